@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: JSON decoding of recorded API payloads per decoder backend.
+
+By default the recorded deals in examples/get_recent_deals/output are
+replicated into a 500-record /deals response (the largest page the API
+serves). Pass your own recorded response files to benchmark those instead:
+
+    python benchmarks/bench_decoding.py
+    python benchmarks/bench_decoding.py path/to/response.json [...]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+from fundable.decoding import available_decoders, get_json_decoder
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_DEALS = os.path.join(REPO_ROOT, 'examples', 'get_recent_deals', 'output', 'sample_deals.json')
+PAGE_SIZE = 500
+
+
+def default_payload() -> bytes:
+    """Build a 500-deal /deals response body from the recorded sample deals."""
+    with open(SAMPLE_DEALS) as f:
+        sample = json.load(f)
+    deals = [dict(sample[i % len(sample)], id=f"deal-{i}") for i in range(PAGE_SIZE)]
+    body = {
+        'success': True,
+        'data': {'deals': deals},
+        'meta': {'total_count': 25000, 'page': 0, 'page_size': PAGE_SIZE},
+    }
+    return json.dumps(body).encode()
+
+
+def bench(payload: bytes, label: str, number: int = 50):
+    print(f"\n{label} ({len(payload) / 1024:.0f} KiB)")
+    print(f"  {'decoder':<10} {'ms/decode':>10} {'MB/s':>8} {'speedup':>8}")
+
+    baseline = None
+    for name in reversed(available_decoders()):  # stdlib json first as the baseline
+        loads = get_json_decoder(name)['loads']
+        best = min(timeit.repeat(lambda: loads(payload), number=number, repeat=5)) / number
+        baseline = baseline or best
+        mb_per_s = len(payload) / best / 1e6
+        print(f"  {name:<10} {best * 1000:>10.2f} {mb_per_s:>8.0f} {baseline / best:>7.1f}x")
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        bench(default_payload(), f"/deals page of {PAGE_SIZE} recorded deals")
+        return
+    for path in paths:
+        with open(path, 'rb') as f:
+            bench(f.read(), os.path.basename(path))
+
+
+if __name__ == "__main__":
+    main()
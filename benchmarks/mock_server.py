@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Local mock Fundable API server generated from the OpenAPI specs in openapi/.
+
+Every path in openapi/openapi-*.yaml is served with synthetic but
+schema-correct data: enums, UUIDs, dates, nested objects and arrays follow
+the 200-response schema of each operation. List endpoints paginate like the
+real API (page / page_size in the POST body or query string, with
+meta.total_count), and the same record index always yields the same record,
+so runs are reproducible. Latency, server errors and 429 rate limiting can
+be injected to benchmark and load-test the client with no network.
+
+Usage (requires PyYAML, included in the `dev` extra):
+    python benchmarks/mock_server.py --port 8400 --latency 50 --rate-limit 200
+
+    client = FundableClient(api_key="test", base_url="http://127.0.0.1:8400")
+
+Or in-process:
+    with MockFundableServer(latency=0.02) as server:
+        client = FundableClient(api_key="test", base_url=server.url)
+"""
+
+import argparse
+import datetime
+import glob
+import gzip
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPENAPI_DIR = os.path.join(REPO_ROOT, 'openapi')
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 500
+
+# Distinct records generated per endpoint; larger result sets reuse them with fresh IDs
+POOL_SIZE = 1000
+# Foreign-key UUIDs (investor_ids, company_id, ...) are drawn from pools this size
+# so the same investors and companies recur across deals, as they do in real data
+FOREIGN_KEY_POOL = 2000
+
+_WORDS = ('alpha', 'atlas', 'beacon', 'cobalt', 'delta', 'ember', 'flux', 'granite', 'harbor',
+          'helix', 'ion', 'juniper', 'keystone', 'lumen', 'meridian', 'nimbus', 'orbit', 'pioneer',
+          'quartz', 'radiant', 'summit', 'tandem', 'vector', 'willow', 'zenith')
+_SUFFIXES = ('Labs', 'AI', 'Capital', 'Ventures', 'Robotics', 'Health', 'Systems', 'Bio', 'Partners')
+_DATE_START = datetime.datetime(2021, 1, 1)
+_DATE_SPAN_SECONDS = 5 * 365 * 24 * 3600
+
+
+def load_specs(openapi_dir: str = OPENAPI_DIR) -> List[Dict[str, Any]]:
+    specs = []
+    for path in sorted(glob.glob(os.path.join(openapi_dir, 'openapi-*.yaml'))):
+        with open(path) as f:
+            specs.append(yaml.safe_load(f))
+    return specs
+
+
+class SchemaFaker:
+    """Generate values matching an OpenAPI schema from a seeded RNG."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+
+    def resolve(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Follow $ref, merge allOf and take the first oneOf/anyOf option."""
+        if '$ref' in schema:
+            name = schema['$ref'].rsplit('/', 1)[-1]
+            resolved = self.resolve(self.spec['components']['schemas'][name])
+            # Sibling keys such as `nullable` apply to the referenced schema
+            extra = {k: v for k, v in schema.items() if k != '$ref'}
+            return dict(resolved, **extra) if extra else resolved
+        if 'allOf' in schema:
+            merged = {'type': 'object', 'properties': {}, 'required': []}
+            for part in schema['allOf']:
+                part = self.resolve(part)
+                merged['properties'].update(part.get('properties', {}))
+                merged['required'].extend(part.get('required', []))
+            merged['properties'].update(schema.get('properties', {}))
+            return merged
+        for key in ('oneOf', 'anyOf'):
+            if key in schema:
+                return self.resolve(schema[key][0])
+        return schema
+
+    def value(self, schema: Dict[str, Any], rng: random.Random, field: str = '', example_only: bool = False) -> Any:
+        """
+        Generate a value for a schema.
+
+        Args:
+            schema: OpenAPI schema (may contain $ref)
+            rng: Seeded random generator
+            field: Property name, used to pick realistic strings
+            example_only: Use spec examples verbatim where present (error bodies)
+        """
+        schema = self.resolve(schema)
+        kind = schema.get('type')
+        if kind is None and 'properties' in schema:
+            kind = 'object'
+
+        if example_only and 'example' in schema and kind != 'object':
+            return schema['example']
+        if 'enum' in schema:
+            options = [v for v in schema['enum'] if v is not None]
+            return rng.choice(options) if options else None
+
+        if kind == 'object':
+            return self.object(schema, rng, example_only)
+        if kind == 'array':
+            return self.array(schema, rng, field, example_only)
+        if kind == 'string':
+            return self.string(schema, rng, field)
+        if kind == 'integer':
+            return int(self.number(schema, rng))
+        if kind == 'number':
+            return round(self.number(schema, rng), 2)
+        if kind == 'boolean':
+            return rng.random() < 0.5
+        return schema.get('example')
+
+    def object(self, schema: Dict[str, Any], rng: random.Random, example_only: bool = False) -> Dict[str, Any]:
+        required = set(schema.get('required', []))
+        result = {}
+        for name, prop in (schema.get('properties') or {}).items():
+            if not example_only and name not in required and self.resolve(prop).get('nullable') and rng.random() < 0.1:
+                result[name] = None
+                continue
+            result[name] = self.value(prop, rng, name, example_only)
+        return result
+
+    def array(self, schema: Dict[str, Any], rng: random.Random, field: str, example_only: bool = False) -> List[Any]:
+        items = schema.get('items') or {}
+        if example_only:
+            return [self.value(items, rng, field, example_only)]
+        count = rng.randint(schema.get('minItems', 0) or 1, min(schema.get('maxItems', 4), 4))
+        return [self.value(items, rng, field) for _ in range(count)]
+
+    def string(self, schema: Dict[str, Any], rng: random.Random, field: str) -> str:
+        fmt = schema.get('format')
+        if fmt == 'uuid':
+            if field == 'id':
+                return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            return pooled_uuid(field, rng.randrange(FOREIGN_KEY_POOL))
+        if fmt in ('date', 'date-time'):
+            moment = _DATE_START + datetime.timedelta(seconds=rng.randrange(_DATE_SPAN_SECONDS))
+            return moment.strftime('%Y-%m-%d') if fmt == 'date' else moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+        if fmt == 'email':
+            return f"{rng.choice(_WORDS)}{rng.randrange(1000)}@example.com"
+        if fmt == 'uri' or field.endswith(('_url', 'linkedin', 'crunchbase', 'twitter', 'image', 'logo')):
+            return f"https://example.com/{field or 'resource'}/{rng.randrange(10 ** 6)}"
+        if 'description' in field:
+            sentences = rng.randint(1, 2) if field.startswith('short') else rng.randint(4, 8)
+            return ' '.join(self.sentence(rng) for _ in range(sentences))
+        if field == 'name' or field.endswith('_name'):
+            return f"{rng.choice(_WORDS).title()} {rng.choice(_SUFFIXES)}"
+        if field == 'domain' or field.endswith('_domain'):
+            return f"{rng.choice(_WORDS)}{rng.randrange(1000)}.com"
+        example = schema.get('example')
+        if isinstance(example, str):
+            return example
+        return f"{field or 'value'}-{rng.randrange(10 ** 6)}"
+
+    @staticmethod
+    def sentence(rng: random.Random) -> str:
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(8, 16))]
+        return ' '.join(words).capitalize() + '.'
+
+    @staticmethod
+    def number(schema: Dict[str, Any], rng: random.Random) -> float:
+        low = schema.get('minimum', 0)
+        example = schema.get('example')
+        high = schema.get('maximum')
+        if high is None:
+            high = max(low + 1, abs(example) * 2 if isinstance(example, (int, float)) and example else 1000)
+        return rng.uniform(low, high)
+
+
+def pooled_uuid(field: str, index: int) -> str:
+    """Deterministic UUID for the index-th member of a field's foreign-key pool."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"fundable-mock/{field}/{index}"))
+
+
+class Route:
+    """One OpenAPI operation, with its response shape and record cache."""
+
+    def __init__(self, spec: Dict[str, Any], method: str, path: str, operation: Dict[str, Any], seed: int):
+        self.method = method.upper()
+        self.path = path
+        self.faker = SchemaFaker(spec)
+        self.pattern = re.compile('^' + re.sub(r'\\{[^/]+\\}', '([^/]+)', re.escape(path)) + '$')
+        self.seed = zlib.crc32(f"{seed}:{self.method} {path}".encode())
+        self.responses = operation.get('responses', {})
+
+        schema = self.response_schema('200') or {}
+        data_schema = self.faker.resolve((schema.get('properties') or {}).get('data', {}))
+        self.envelope = schema
+        self.list_key = None
+        self.record_key = None
+        self.record_schema: Dict[str, Any] = {}
+        for key, prop in (data_schema.get('properties') or {}).items():
+            prop = self.faker.resolve(prop)
+            if prop.get('type') == 'array' and self.list_key is None:
+                self.list_key, self.record_schema = key, prop.get('items') or {}
+            elif prop.get('type') == 'object' and self.record_key is None:
+                self.record_key, self.record_schema = key, prop
+        self.data_schema = data_schema
+        self._pool: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def response_schema(self, status: str) -> Optional[Dict[str, Any]]:
+        content = (self.responses.get(status) or {}).get('content', {})
+        schema = content.get('application/json', {}).get('schema')
+        return self.faker.resolve(schema) if schema else None
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """The index-th record of this endpoint (stable across runs for a given seed)."""
+        slot = index % POOL_SIZE
+        template = self._pool.get(slot)
+        if template is None:
+            template = self.faker.value(self.record_schema, random.Random(self.seed + slot))
+            with self._lock:
+                self._pool[slot] = template
+        if index == slot or 'id' not in template:
+            return template
+        return dict(template, id=pooled_uuid(self.path, index))
+
+    def error_body(self, status: int, code: str, message: str) -> Dict[str, Any]:
+        """Error body shaped like the spec's response for this status, if it defines one."""
+        schema = self.response_schema(str(status))
+        body = self.faker.value(schema, random.Random(self.seed), example_only=True) if schema else {}
+        body = body if isinstance(body, dict) else {}
+        body['success'] = False
+        error = body.get('error') if isinstance(body.get('error'), dict) else {}
+        error.update({'code': code, 'message': message})
+        body['error'] = error
+        return body
+
+    def respond(self, path_params: Tuple[str, ...], query: Dict[str, Any], body: Dict[str, Any],
+                total_count: int) -> Dict[str, Any]:
+        params = dict(query, **body) if isinstance(body, dict) else dict(query)
+        page = max(0, _as_int(params.get('page'), 0))
+        page_size = min(MAX_PAGE_SIZE, max(1, _as_int(params.get('page_size'), DEFAULT_PAGE_SIZE)))
+
+        data: Dict[str, Any] = {}
+        meta: Dict[str, Any] = {'page': page, 'page_size': page_size, 'credits_used': 0}
+        if self.list_key:
+            start = page * page_size
+            count = max(0, min(page_size, total_count - start))
+            data[self.list_key] = [self.record(start + i) for i in range(count)]
+            meta.update({'total_count': total_count, 'credits_used': count})
+            # Sibling arrays (e.g. angel_investors next to investors) get a few records too
+            for key, prop in (self.data_schema.get('properties') or {}).items():
+                if key not in data:
+                    data[key] = self.faker.value(prop, random.Random(self.seed + page), key)
+        elif self.record_key:
+            record = self.record(0)
+            requested_id = path_params[0] if path_params else query.get('id')
+            if requested_id and 'id' in record:
+                record = dict(record, id=requested_id)
+            data[self.record_key] = record
+            meta.update({'page_size': 1, 'credits_used': 1})
+        return {'success': True, 'data': data, 'meta': meta}
+
+
+def _as_int(value: Any, default: int) -> int:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class MockFundableServer:
+    """
+    Threaded HTTP server serving every operation in the OpenAPI specs.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        total_count: meta.total_count reported by list endpoints
+        latency: Mean added latency per request, in seconds
+        jitter: Uniform +/- jitter on the latency, in seconds
+        error_rate: Fraction of requests answered with a 500
+        rate_limit_rate: Fraction of requests answered with a 429 (random injection)
+        rate_limit: Requests per minute before 429s are returned (0 disables);
+            mirrors the API's 200/minute limit when set to 200
+        retry_after: Retry-After seconds sent with 429 responses
+        compress: Gzip responses when the client accepts it
+        seed: Seed for the synthetic data
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, total_count: int = 10000,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, rate_limit: int = 0, retry_after: int = 1,
+                 compress: bool = True, seed: int = 0, openapi_dir: str = OPENAPI_DIR):
+        self.total_count = total_count
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.compress = compress
+        self.request_count = 0
+
+        self.routes: List[Route] = []
+        for spec in load_specs(openapi_dir):
+            for path, operations in (spec.get('paths') or {}).items():
+                for method, operation in operations.items():
+                    if method in ('get', 'post', 'put', 'patch', 'delete'):
+                        self.routes.append(Route(spec, method, path, operation, seed))
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: List[float] = []
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Serve in a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockFundableServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def match(self, method: str, path: str) -> Tuple[Optional[Route], Tuple[str, ...]]:
+        for route in self.routes:
+            if route.method == method:
+                m = route.pattern.match(path)
+                if m:
+                    return route, m.groups()
+        return None, ()
+
+    def _fault(self) -> Optional[int]:
+        """Decide whether this request gets an injected 429 or 500."""
+        with self._lock:
+            self.request_count += 1
+            if self.rate_limit:
+                now = time.monotonic()
+                self._window = [t for t in self._window if now - t < 60]
+                if len(self._window) >= self.rate_limit:
+                    return 429
+                self._window.append(now)
+            roll = self._rng.random()
+            delay = self.latency + (self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so pooled client sessions are exercised
+            # Headers and body go out as separate writes; without TCP_NODELAY every
+            # keep-alive response stalls ~40ms on Nagle + delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self.handle_api('GET')
+
+            def do_POST(self):
+                self.handle_api('POST')
+
+            def handle_api(self, method: str):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                url = urlparse(self.path)
+                path = re.sub(r'^/api/v1', '', url.path).rstrip('/') or '/'
+                route, path_params = server.match(method, path)
+
+                if route is None:
+                    return self.send_json(404, {'success': False, 'error': {
+                        'code': 'NOT_FOUND', 'message': f"No mock route for {method} {path}"}})
+                if not self.headers.get('Authorization', '').startswith('Bearer '):
+                    return self.send_json(401, route.error_body(401, 'UNAUTHORIZED', 'Missing API key'))
+
+                fault = server._fault()
+                if fault == 429:
+                    return self.send_json(429, route.error_body(
+                        429, 'RATE_LIMIT_EXCEEDED', 'Rate limit exceeded. Maximum 200 requests per minute.'),
+                        {'Retry-After': str(server.retry_after)})
+                if fault == 500:
+                    return self.send_json(500, route.error_body(500, 'INTERNAL_ERROR', 'Injected server error'))
+
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    return self.send_json(400, route.error_body(400, 'INVALID_JSON', 'Request body is not valid JSON'))
+                query = {k: v[0] if len(v) == 1 else v for k, v in parse_qs(url.query).items()}
+                self.send_json(200, route.respond(path_params, query, body, server.total_count))
+
+            def send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode()
+                encoding = None
+                if server.compress and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    data = gzip.compress(data, compresslevel=6)
+                    encoding = 'gzip'
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock Fundable API from the OpenAPI specs")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8400)
+    parser.add_argument('--total-count', type=int, default=10000, help="meta.total_count for list endpoints")
+    parser.add_argument('--latency', type=float, default=0.0, help="Mean added latency in ms")
+    parser.add_argument('--jitter', type=float, default=0.0, help="+/- latency jitter in ms")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests returning 500")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Fraction of requests returning 429")
+    parser.add_argument('--rate-limit', type=int, default=0, help="Requests per minute before 429 (0 = off)")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds on 429")
+    parser.add_argument('--no-compress', action='store_true', help="Never gzip responses")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockFundableServer(
+        host=args.host, port=args.port, total_count=args.total_count,
+        latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, rate_limit=args.rate_limit,
+        retry_after=args.retry_after, compress=not args.no_compress, seed=args.seed,
+    )
+    print(f"Mock Fundable API on {server.url} ({len(server.routes)} routes)")
+    print(f"  FundableClient(api_key='test', base_url='{server.url}')")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
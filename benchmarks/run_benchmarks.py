@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for FundableClient hot paths, with JSON baselines.
+
+Covers:
+- client.*     latency / throughput of get_deals, get_companies, get_investors
+               and search_people at several page sizes, against the local
+               mock server (benchmarks/mock_server.py)
+- build.*      request body construction in the filter-heavy builders (no I/O)
+- extract.*    DataExtractor.extract_deal over 100k deals
+- format.*     format_usd over 100k amounts
+- chart.*      InvestorBarChart rendering with and without (cached) logos
+
+Usage (the client benchmarks require PyYAML for the mock server):
+    python benchmarks/run_benchmarks.py                       # run and print
+    python benchmarks/run_benchmarks.py --save main           # write baselines/main.json
+    python benchmarks/run_benchmarks.py --compare main        # fail on >15% median slowdown
+    python benchmarks/run_benchmarks.py -k client --compare main --threshold 0.25
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from fundable import FundableClient, DataExtractor, format_usd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_DIR = os.path.join(BENCH_DIR, 'baselines')
+SAMPLE_DEALS = os.path.join(REPO_ROOT, 'examples', 'get_recent_deals', 'output', 'sample_deals.json')
+
+PAGE_SIZES = [10, 100, 500]
+BULK_RECORDS = 100_000
+
+# name -> {'group', 'setup', 'items', 'min_rounds'}
+BENCHMARKS: Dict[str, Dict[str, Any]] = {}
+
+
+def benchmark(name: str, items: int = 1, min_rounds: int = 5):
+    """
+    Register a benchmark.
+
+    The decorated function receives the shared context dict and returns the
+    zero-argument callable to time; `items` is the number of records one call
+    processes, used to report throughput.
+    """
+    def register(setup: Callable[[Dict[str, Any]], Callable[[], Any]]):
+        BENCHMARKS[name] = {'setup': setup, 'items': items, 'min_rounds': min_rounds}
+        return setup
+    return register
+
+
+def measure(fn: Callable[[], Any], items: int, min_rounds: int, min_time: float) -> Dict[str, Any]:
+    """Time fn() until both min_rounds and min_time are reached (after one warmup call)."""
+    fn()
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < min_rounds or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+        if len(timings) >= 1000:
+            break
+    median = statistics.median(timings)
+    return {
+        'rounds': len(timings),
+        'min': min(timings),
+        'median': median,
+        'mean': statistics.mean(timings),
+        'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'ops_per_sec': 1 / median if median else None,
+        'items_per_sec': items / median if median else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def sample_deals(count: int) -> List[Dict[str, Any]]:
+    with open(SAMPLE_DEALS) as f:
+        sample = json.load(f)
+    return [dict(sample[i % len(sample)], id=f"deal-{i}") for i in range(count)]
+
+
+def mock_client(context: Dict[str, Any]) -> FundableClient:
+    """Client pointed at a shared in-process mock server (started on first use)."""
+    if 'server' not in context:
+        from mock_server import MockFundableServer
+
+        server = MockFundableServer(total_count=100_000)
+        server.start()
+        context['server'] = server
+        context['client'] = FundableClient(api_key='benchmark', base_url=server.url)
+    return context['client']
+
+
+class OfflineClient(FundableClient):
+    """
+    Client whose transport returns a canned empty page, so timing covers
+    argument handling, body construction, JSON encoding and response
+    handling without any socket I/O.
+    """
+
+    EMPTY_PAGE = json.dumps({
+        'success': True,
+        'data': {'deals': [], 'companies': [], 'investors': [], 'people': []},
+        'meta': {'total_count': 0, 'page': 0, 'page_size': 0},
+    }).encode()
+
+    def _request(self, method, path, params=None, body=None, data=None):
+        request = requests.Request(method, f"{self.base_url}{path}", headers=self.headers, params=params,
+                                   json=body if data is None else None, data=data).prepare()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.EMPTY_PAGE
+        response.request = request
+        return response
+
+
+def heavy_filters() -> Dict[str, Any]:
+    ids = [f"00000000-0000-4000-8000-{i:012d}" for i in range(50)]
+    return {
+        'ids': ids,
+        'financing_types': [{'type': t} for t in ('SEED', 'SERIES_A', 'SERIES_B', 'SERIES_C')]
+        + [{'type': 'SERIES_A', 'pre': True}, {'type': 'SEED', 'extension': True}],
+        'industries': ['artificial_intelligence', 'fintech', 'biotech', 'robotics', 'climate'],
+        'locations': ['San Francisco, CA', 'New York, NY', 'London', 'Berlin', 'Austin, TX'],
+        'employee_count': ['1-10', '11-50', '51-100', '101-250'],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def _register_client_benchmarks():
+    methods = {
+        'get_deals': lambda client, size: client.get_deals(page_size=size),
+        'get_companies': lambda client, size: client.get_companies(page_size=size),
+        'get_investors': lambda client, size: client.get_investors(page_size=size),
+        'search_people': lambda client, size: client.search_people(page_size=size),
+    }
+    for method, call in methods.items():
+        for size in PAGE_SIZES:
+            def setup(context, call=call, size=size):
+                client = mock_client(context)
+                return lambda: call(client, size)
+            benchmark(f"client.{method}[page_size={size}]", items=size)(setup)
+
+
+_register_client_benchmarks()
+
+
+@benchmark('build.get_deals[heavy_filters]')
+def bench_build_deals(context):
+    client, f = OfflineClient(api_key='benchmark'), heavy_filters()
+    return lambda: client.get_deals(
+        deal_start_date='2024-01-01', deal_end_date='2024-12-31', company_ids=f['ids'],
+        industries=f['industries'], locations=f['locations'], employee_count=f['employee_count'],
+        financing_types=f['financing_types'], deal_size_min=1_000_000, deal_size_max=50_000_000,
+        investor_ids=f['ids'], deal_ids=f['ids'], page_size=500)
+
+
+@benchmark('build.get_companies[heavy_filters]')
+def bench_build_companies(context):
+    client, f = OfflineClient(api_key='benchmark'), heavy_filters()
+    return lambda: client.get_companies(
+        search_query='vertical AI for logistics', deal_start_date='2024-01-01', company_ids=f['ids'],
+        industries=f['industries'], locations=f['locations'], employee_count=f['employee_count'],
+        financing_types=f['financing_types'], investor_ids=f['ids'], page_size=500)
+
+
+@benchmark('build.get_investors[heavy_filters]')
+def bench_build_investors(context):
+    client, f = OfflineClient(api_key='benchmark'), heavy_filters()
+    return lambda: client.get_investors(
+        investor_ids=f['ids'], industries=f['industries'], locations=f['locations'],
+        employee_count=f['employee_count'], financing_types=f['financing_types'],
+        deal_start_date='2024-01-01', deal_end_date='2024-12-31', company_ids=f['ids'], page_size=500)
+
+
+@benchmark('build.search_people[heavy_filters]')
+def bench_build_people(context):
+    client, f = OfflineClient(api_key='benchmark'), heavy_filters()
+    return lambda: client.search_people(
+        person_type='investor', identifiers={'ids': f['ids']},
+        company={'industries': f['industries'], 'locations': f['locations']},
+        investor={'deals': {'financing_types': f['financing_types']}}, page_size=500)
+
+
+@benchmark(f'extract.extract_deal[{BULK_RECORDS}]', items=BULK_RECORDS, min_rounds=3)
+def bench_extract_deal(context):
+    deals = sample_deals(BULK_RECORDS)
+    extract = DataExtractor.extract_deal
+    return lambda: [extract(deal) for deal in deals]
+
+
+@benchmark(f'format.format_usd[{BULK_RECORDS}]', items=BULK_RECORDS, min_rounds=3)
+def bench_format_usd(context):
+    amounts = [None, 0, 2_500_000, 1_234_567.89, 750_000_000, 'n/a'] * (BULK_RECORDS // 6)
+    return lambda: [format_usd(amount) for amount in amounts]
+
+
+def _chart_setup(context, show_logos: bool):
+    import matplotlib
+    matplotlib.use('Agg')
+    from PIL import Image
+    from fundable.visualization import InvestorBarChart
+
+    tmp = context.setdefault('tmpdir', tempfile.mkdtemp(prefix='fundable-bench-'))
+    chart = InvestorBarChart(cache_dir=os.path.join(tmp, 'logos'))
+    investors = []
+    for i in range(20):
+        url = f"https://logos.example.com/investor-{i}.png"
+        investors.append({'name': f"Investor {i}", 'deal_count': 100 - i * 3, 'image': url})
+        # Pre-seed the logo cache so the benchmark measures rendering, not downloads
+        Image.new('RGBA', (200, 200), (40 + i * 10, 90, 160, 255)).save(
+            chart.cache_dir / f"logos.example.com__investor-{i}.png", 'PNG')
+    output = os.path.join(tmp, f"chart_logos_{show_logos}.png")
+
+    def render():
+        with contextlib.redirect_stdout(io.StringIO()):
+            chart.plot_top_investors(investors, show_logos=show_logos, output_path=output)
+    return render
+
+
+@benchmark('chart.plot_top_investors[no_logos]', min_rounds=3)
+def bench_chart_no_logos(context):
+    return _chart_setup(context, show_logos=False)
+
+
+@benchmark('chart.plot_top_investors[logos]', min_rounds=3)
+def bench_chart_logos(context):
+    return _chart_setup(context, show_logos=True)
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def machine_info() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'commit': commit,
+    }
+
+
+def baseline_path(name_or_path: str) -> str:
+    if name_or_path.endswith('.json') or os.sep in name_or_path:
+        return name_or_path
+    return os.path.join(BASELINE_DIR, f"{name_or_path}.json")
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions = []
+    print(f"\nComparison against baseline ({baseline.get('machine', {}).get('commit') or 'unknown commit'}),"
+          f" threshold {threshold:.0%} on median:")
+    print(f"  {'benchmark':<48} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f"  {name:<48} {'-':>10} {result['median'] * 1000:>10.3f} {'new':>8}")
+            continue
+        change = result['median'] / base['median'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"  {name:<48} {base['median'] * 1000:>10.3f} {result['median'] * 1000:>10.3f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run FundableClient benchmarks")
+    parser.add_argument('-k', dest='keyword', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--min-time', type=float, default=1.0, help="Minimum seconds per benchmark")
+    parser.add_argument('--save', metavar='NAME', help="Save results as baselines/NAME.json (or a .json path)")
+    parser.add_argument('--compare', metavar='NAME', help="Compare with baselines/NAME.json (or a .json path)")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Allowed median slowdown before --compare fails (default 0.15)")
+    parser.add_argument('--list', action='store_true', help="List benchmark names and exit")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if not args.keyword or args.keyword in name]
+    if args.list:
+        print('\n'.join(names))
+        return
+
+    context: Dict[str, Any] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"  {'benchmark':<48} {'median ms':>10} {'min ms':>10} {'rounds':>7} {'items/s':>12}")
+    try:
+        for name in names:
+            spec = BENCHMARKS[name]
+            fn = spec['setup'](context)
+            result = measure(fn, spec['items'], spec['min_rounds'], args.min_time)
+            results[name] = result
+            print(f"  {name:<48} {result['median'] * 1000:>10.3f} {result['min'] * 1000:>10.3f}"
+                  f" {result['rounds']:>7} {result['items_per_sec']:>12,.0f}")
+    finally:
+        if 'server' in context:
+            context['server'].stop()
+
+    report = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'results': results,
+    }
+
+    if args.save:
+        path = baseline_path(args.save)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {os.path.relpath(path)}")
+
+    if args.compare:
+        with open(baseline_path(args.compare)) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
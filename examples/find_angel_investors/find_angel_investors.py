@@ -1,22 +1,29 @@
 #!/usr/bin/env python3
 """
-Example: Find people via POST /people, then enrich the top hits with full
+Example: Find people via POST /people, then enrich the top hits with their
 profiles. The default scenario is angel-investor discovery for a thesis,
 but the request body is fully editable — see PEOPLE_QUERY below for
 alternative recipes (industry filters, lead-only, cross-type, batch lookup).
 
 Workflow:
   1. POST /people with whatever filter combo PEOPLE_QUERY contains.
-  2. For the top N hits, GET /person for the full profile.
+  2. For the top N hits, fetch profiles in one batched lookup (get_people_by_ids).
+     These are /people rows: employment and education history are capped at
+     3 entries each (get_person returns the full lists, one call per person).
   3. If PEOPLE_QUERY uses `investor.deals.search_query`, also run a
      follow-up POST /companies with the same thesis + each person_id to
-     surface their on-thesis portfolio companies.
+     surface their on-thesis portfolio companies (concurrently, via ThesisRanker).
+
+Set FUNDABLE_TRACE_FILE=trace.jsonl to record a span per step and API call,
+then see which stage is slow with `python scripts/summarize_trace.py trace.jsonl`.
 """
 
 import json
 import os
 
 from fundable import FundableClient, format_usd
+from fundable.thesis import ThesisRanker
+from fundable.tracing import Tracer, FileSpanExporter
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'output')
@@ -139,7 +146,7 @@ def print_person_summary(idx, person):
 
 
 def print_profile(person):
-    """Detailed profile block from /person."""
+    """Detailed person profile block."""
     name = person.get('name') or 'Unknown'
     title = person.get('title') or '—'
     location = person.get('location') or '—'
@@ -180,7 +187,7 @@ def print_profile(person):
 
     employment = person.get('employment_history') or []
     if employment:
-        print(f"  Employment ({len(employment)} records):")
+        print("  Employment (most recent):")
         for e in employment[:3]:
             t = e.get('title') or '—'
             c = e.get('company_name') or '—'
@@ -189,7 +196,7 @@ def print_profile(person):
 
     education = person.get('education_history') or []
     if education:
-        print(f"  Education ({len(education)} records):")
+        print("  Education (most recent):")
         for ed in education[:3]:
             s = ed.get('school_name') or '—'
             d = ed.get('degree') or ''
@@ -216,8 +223,7 @@ def print_on_thesis_company(company):
         print(f"      {snippet}")
 
 
-def main():
-    client = FundableClient()
+def run(client):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     thesis = get_thesis(PEOPLE_QUERY)
@@ -232,7 +238,8 @@ def main():
         print(f"    {line}")
     print()
 
-    people = client.search_people(**PEOPLE_QUERY)
+    with client.span('step1_search_people', thesis=thesis):
+        people = client.search_people(**PEOPLE_QUERY)
     print(f"  Found {len(people)} people\n")
     for i, p in enumerate(people, 1):
         print_person_summary(i, p)
@@ -246,50 +253,60 @@ def main():
         print("\nNo results — relax filters or rephrase the search_query.")
         return
 
-    # --- Step 2: Enrich top N with /person + (optional) on-thesis portfolio ---
+    # --- Step 2: Enrich top N with profiles + (optional) on-thesis portfolio ---
     print(f"\n{'=' * 70}")
     if thesis:
-        print(f"STEP 2: Enrich top {min(TOP_N_TO_ENRICH, len(people))} with /person + on-thesis portfolio")
+        print(f"STEP 2: Enrich top {min(TOP_N_TO_ENRICH, len(people))} with profiles + on-thesis portfolio")
     else:
-        print(f"STEP 2: Enrich top {min(TOP_N_TO_ENRICH, len(people))} with /person")
+        print(f"STEP 2: Enrich top {min(TOP_N_TO_ENRICH, len(people))} with profiles")
     print("=" * 70)
 
-    for i, hit in enumerate(people[:TOP_N_TO_ENRICH], 1):
+    # One batched lookup for every profile instead of a get_person call per hit;
+    # /people rows cap employment / education history at 3 entries each
+    top = people[:TOP_N_TO_ENRICH]
+    profiles = client.get_people_by_ids([hit.get('id') for hit in top])
+
+    # On-thesis portfolio queries for every person run concurrently under one rate limit
+    portfolios = {}
+    if thesis:
+        ranker = ThesisRanker(client, thesis, min_relevance=STEP3_MIN_RELEVANCE, page_size=5)
+        portfolios = {result['person_id']: result for result in ranker.scan(hit.get('id') for hit in top)}
+
+    for i, hit in enumerate(top, 1):
         person_id = hit.get('id')
         if not person_id:
             continue
 
-        print(f"\n--- #{i}: {hit.get('name', 'Unknown')} ({person_id}) ---")
-
-        profile = client.get_person(person_id, identifier_type='id')
-        if profile:
-            print("\n  [Profile]")
-            print_profile(profile)
-        else:
-            print("  (profile fetch failed)")
-
-        on_thesis = []
-        if thesis:
-            # Cross-filter: companies the person backed that semantically rank against the thesis.
-            on_thesis = client.get_companies(
-                search_query=thesis,
-                min_relevance=STEP3_MIN_RELEVANCE,
-                people_ids=[person_id],
-                page_size=5,
-            )
-            print(f"\n  [On-thesis portfolio companies — {len(on_thesis)} match]")
-            if on_thesis:
-                for co in on_thesis:
-                    print_on_thesis_company(co)
-            else:
-                print(f"    (no portfolio companies ranked against '{thesis}' for this person)")
+        with client.span('step2_enrich_person', person_id=person_id, rank=i):
+            print(f"\n--- #{i}: {hit.get('name', 'Unknown')} ({person_id}) ---")
 
-        # Persist the enriched bundle
-        out = {'search_hit': hit, 'profile': profile, 'on_thesis_companies': on_thesis}
-        out_path = os.path.join(OUTPUT_DIR, f'profile_{slug}_{i}.json')
-        with open(out_path, 'w') as f:
-            json.dump(out, f, indent=2, default=str)
-        print(f"\n  Saved -> {out_path}")
+            profile = profiles.get(person_id)
+            if profile:
+                print("\n  [Profile]")
+                print_profile(profile)
+            else:
+                print("  (profile fetch failed)")
+
+            on_thesis = []
+            if thesis:
+                # Cross-filter: companies the person backed that semantically rank against the thesis.
+                portfolio = portfolios.get(person_id) or {}
+                on_thesis = portfolio.get('companies') or []
+                if portfolio.get('error'):
+                    print(f"  (on-thesis portfolio query failed: {portfolio['error']})")
+                print(f"\n  [On-thesis portfolio companies — {len(on_thesis)} match]")
+                if on_thesis:
+                    for co in on_thesis:
+                        print_on_thesis_company(co)
+                else:
+                    print(f"    (no portfolio companies ranked against '{thesis}' for this person)")
+
+            # Persist the enriched bundle
+            out = {'search_hit': hit, 'profile': profile, 'on_thesis_companies': on_thesis}
+            out_path = os.path.join(OUTPUT_DIR, f'profile_{slug}_{i}.json')
+            with open(out_path, 'w') as f:
+                json.dump(out, f, indent=2, default=str)
+            print(f"\n  Saved -> {out_path}")
 
     print(f"\n{'=' * 70}")
     label = f"'{thesis}'" if thesis else "the configured query"
@@ -298,5 +315,12 @@ def main():
     print("=" * 70)
 
 
+def main():
+    trace_file = os.getenv('FUNDABLE_TRACE_FILE')
+    client = FundableClient(tracer=Tracer(FileSpanExporter(trace_file)) if trace_file else None)
+    with client.span('find_angel_investors'):
+        run(client)
+
+
 if __name__ == "__main__":
     main()
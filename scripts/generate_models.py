@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Generate src/fundable/models.py from the OpenAPI specs in openapi/.
+
+Each top-level record (Deal, Company, Investor, Person) and every schema it
+references becomes a __slots__ class deriving from fundable._records.Record:
+- enum strings and foreign-key UUIDs are interned
+- arrays of strings become tuples
+- nested objects ($ref schemas and the inline objects listed in INLINE_NAMES)
+  are decoded lazily on first access
+
+Usage (requires PyYAML, included in the `dev` extra):
+    python scripts/generate_models.py
+"""
+
+import keyword
+import os
+from typing import Any, Dict, List, Set, Tuple
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPENAPI_DIR = os.path.join(REPO_ROOT, 'openapi')
+OUTPUT_PATH = os.path.join(REPO_ROOT, 'src', 'fundable', 'models.py')
+
+# (class name, spec file, schema name)
+TARGETS = [
+    ('Deal', 'openapi-deals.yaml', 'Deal'),
+    ('Company', 'openapi-companies.yaml', 'CompanyDetails'),
+    ('Investor', 'openapi-investors.yaml', 'InvestorListItem'),
+    ('Person', 'openapi-people.yaml', 'PersonSearchResult'),
+]
+
+# Inline (non-$ref) nested objects that get their own record class
+INLINE_NAMES = {
+    ('Deal', 'deal_descriptions'): 'DealDescriptions',
+    ('LatestDeal', 'description'): 'DealDescriptions',
+    ('LatestDeal', 'financings'): 'LatestDealFinancing',
+}
+
+HEADER = '''#!/usr/bin/env python3
+"""
+Compact typed records for Fundable API objects.
+
+GENERATED by scripts/generate_models.py from openapi/*.yaml — do not edit
+by hand; re-run the generator after updating the specs.
+
+Pass model=True to the FundableClient list/detail methods to receive these
+instead of raw dicts.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from fundable._records import {imports}
+'''
+
+# fundable._records helpers, in import order; only those a class emits are imported
+HELPERS = ['lazy_record', 'intern_str', 'intern_tuple', 'to_tuple']
+
+
+def load_spec(filename: str) -> Dict[str, Any]:
+    with open(os.path.join(OPENAPI_DIR, filename)) as f:
+        return yaml.safe_load(f)
+
+
+def resolve(spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow $ref and merge allOf into a single object schema."""
+    if '$ref' in schema:
+        name = schema['$ref'].rsplit('/', 1)[-1]
+        return resolve(spec, spec['components']['schemas'][name])
+    if 'allOf' in schema:
+        merged = {'type': 'object', 'properties': {}}
+        for part in schema['allOf']:
+            part = resolve(spec, part)
+            merged['properties'].update(part.get('properties', {}))
+        merged['properties'].update(schema.get('properties', {}))
+        return merged
+    return schema
+
+
+def attr_name(field: str) -> str:
+    return f"{field}_" if keyword.iskeyword(field) else field
+
+
+def py_type(kind: str) -> str:
+    return {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool'}.get(kind, 'Any')
+
+
+class Generator:
+
+    def __init__(self):
+        self.classes: Dict[str, str] = {}   # class name -> source, in dependency order
+        self.helpers: Set[str] = set()      # fundable._records helpers the classes call
+        self.filename = ''
+
+    def source(self, ref_name: str, parent: str, field: str) -> str:
+        if ref_name:
+            return f"{self.filename} #/components/schemas/{ref_name}"
+        return f"{self.filename}, inline `{field}` of {parent}"
+
+    def record_class(self, name: str, spec: Dict[str, Any], schema: Dict[str, Any], source: str) -> str:
+        if name in self.classes:
+            return name
+        self.classes[name] = ''  # reserve (guards recursive schemas)
+        schema = resolve(spec, schema)
+
+        fields: List[Tuple[str, str]] = []       # (attribute, annotation)
+        assigns: List[str] = []
+        lazies: List[str] = []
+        slots: List[str] = []
+
+        for field, prop in (schema.get('properties') or {}).items():
+            attr = attr_name(field)
+            ref_name = prop['$ref'].rsplit('/', 1)[-1] if '$ref' in prop else None
+            prop = resolve(spec, prop)
+            kind = prop.get('type')
+            items = prop.get('items') or {}
+            item_ref = items['$ref'].rsplit('/', 1)[-1] if '$ref' in items else None
+            inline_name = INLINE_NAMES.get((name, field))
+
+            if ref_name or (kind == 'object' and inline_name):
+                nested = self.record_class(ref_name or inline_name, spec, prop,
+                                           self.source(ref_name, name, field))
+                slots.append(f"_{attr}")
+                assigns.append(f"self._{attr} = get('{field}')")
+                lazies.append(f"{attr} = lazy_record('_{attr}', {nested})")
+                self.helpers.add('lazy_record')
+                fields.append((attr, f"Optional[{nested}]"))
+            elif kind == 'array' and (item_ref or inline_name):
+                nested = self.record_class(item_ref or inline_name, spec, items,
+                                           self.source(item_ref, name, field))
+                slots.append(f"_{attr}")
+                assigns.append(f"self._{attr} = get('{field}')")
+                lazies.append(f"{attr} = lazy_record('_{attr}', {nested}, many=True)")
+                self.helpers.add('lazy_record')
+                fields.append((attr, f"Optional[Tuple[{nested}, ...]]"))
+            elif kind == 'array' and items.get('type') == 'string':
+                shared = 'enum' in items or items.get('format') == 'uuid'
+                helper = 'intern_tuple' if shared else 'to_tuple'
+                slots.append(attr)
+                assigns.append(f"self.{attr} = {helper}(get('{field}'))")
+                self.helpers.add(helper)
+                fields.append((attr, 'Optional[Tuple[str, ...]]'))
+            elif kind == 'string' and ('enum' in prop or (prop.get('format') == 'uuid' and field != 'id')):
+                slots.append(attr)
+                assigns.append(f"self.{attr} = intern_str(get('{field}'))")
+                self.helpers.add('intern_str')
+                fields.append((attr, 'Optional[str]'))
+            else:
+                slots.append(attr)
+                assigns.append(f"self.{attr} = get('{field}')")
+                fields.append((attr, f"Optional[{py_type(kind)}]" if kind in ('string', 'integer', 'number', 'boolean') else 'Any'))
+
+        lines = [f"class {name}(Record):"]
+        lines.append(f'    """{name} record ({source})."""')
+        lines.append('')
+        lines.append(f"    __slots__ = {tuple(slots)!r}")
+        lines.append(f"    _fields = {tuple(f for f, _ in fields)!r}")
+        lines.append('')
+        for attr, annotation in fields:
+            lines.append(f"    {attr}: {annotation}")
+        if lazies:
+            lines.append('')
+            lines.extend(f"    {lazy}" for lazy in lazies)
+        lines.append('')
+        lines.append('    @classmethod')
+        lines.append(f"    def from_dict(cls, data: Dict[str, Any]) -> '{name}':")
+        lines.append('        self = cls.__new__(cls)')
+        lines.append('        get = data.get')
+        lines.extend(f"        {assign}" for assign in assigns)
+        lines.append('        return self')
+
+        # Move to the end so dependencies are emitted first
+        del self.classes[name]
+        self.classes[name] = '\n'.join(lines)
+        return name
+
+
+def main():
+    generator = Generator()
+    for class_name, filename, schema_name in TARGETS:
+        spec = load_spec(filename)
+        generator.filename = filename
+        schema = spec['components']['schemas'][schema_name]
+        generator.record_class(class_name, spec, schema, f"{filename} #/components/schemas/{schema_name}")
+
+    names = list(generator.classes)
+    body = '\n\n\n'.join(generator.classes.values())
+    exports = ',\n'.join(f'    "{n}"' for n in names)
+    imports = ', '.join(['Record'] + [h for h in HELPERS if h in generator.helpers])
+    header = HEADER.format(imports=imports)
+    with open(OUTPUT_PATH, 'w') as f:
+        f.write(f"{header}\n\n{body}\n\n\n__all__ = [\n{exports},\n]\n")
+    print(f"Wrote {len(names)} record classes to {os.path.relpath(OUTPUT_PATH, REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
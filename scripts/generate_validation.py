@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Generate src/fundable/request_rules.py from the OpenAPI specs in openapi/.
+
+Every operation's JSON request body and query parameters are reduced to the
+constraints fundable.validation checks locally before a request is sent:
+types, enums, minimum / maximum, minItems / maxItems and required keys.
+Descriptions, examples and formats are dropped.
+
+Usage (requires PyYAML, included in the `dev` extra):
+    python scripts/generate_validation.py
+"""
+
+import glob
+import os
+from typing import Any, Dict
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPENAPI_DIR = os.path.join(REPO_ROOT, 'openapi')
+OUTPUT_PATH = os.path.join(REPO_ROOT, 'src', 'fundable', 'request_rules.py')
+
+# Schema keywords kept, renamed to the validator's keys
+KEYWORDS = {
+    'type': 'type',
+    'enum': 'enum',
+    'minimum': 'minimum',
+    'maximum': 'maximum',
+    'minItems': 'min_items',
+    'maxItems': 'max_items',
+    'required': 'required',
+}
+
+# Limits the specs state only in prose, keyed by dotted field path and merged
+# into the generated constraints. alert_ids is validated as the list passed to
+# get_alerts, before it is joined into the comma-separated parameter.
+_MAX_100 = {'max_items': 100}
+OVERRIDES = {
+    'GET /alerts': {'alert_ids': {'type': 'array', 'items': {'type': 'string'}, 'min_items': 1, 'max_items': 10}},
+    'POST /companies': {
+        'identifiers.domains': _MAX_100,
+        'identifiers.linkedin_urls': _MAX_100,
+        'identifiers.crunchbase_urls': _MAX_100,
+    },
+    'POST /investors': {
+        'identifiers.domains': _MAX_100,
+        'identifiers.linkedin_urls': _MAX_100,
+        'identifiers.crunchbase_urls': _MAX_100,
+    },
+    'POST /people': {
+        'identifiers.linkedin_urls': _MAX_100,
+        'identifiers.crunchbase_urls': _MAX_100,
+        'identifiers.twitter_urls': _MAX_100,
+    },
+}
+
+HEADER = '''#!/usr/bin/env python3
+"""
+Request constraints for local validation (see fundable.validation).
+
+GENERATED by scripts/generate_validation.py from openapi/*.yaml — do not
+edit by hand; re-run the generator after updating the specs.
+
+Keys are "METHOD /path"; each value is the constraint tree of the JSON body
+(POST) or of the query parameters (GET).
+"""
+'''
+
+
+def resolve(spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow $ref and merge allOf into a single object schema."""
+    if '$ref' in schema:
+        name = schema['$ref'].rsplit('/', 1)[-1]
+        return resolve(spec, spec['components']['schemas'][name])
+    if 'allOf' in schema:
+        merged = {'type': 'object', 'properties': {}, 'required': []}
+        for part in schema['allOf']:
+            part = resolve(spec, part)
+            merged['properties'].update(part.get('properties', {}))
+            merged['required'].extend(part.get('required', []))
+        merged['properties'].update(schema.get('properties', {}))
+        return merged
+    return schema
+
+
+def compile_schema(spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a JSON schema to the validator's constraint tree."""
+    schema = resolve(spec, schema)
+    node = {key: schema[name] for name, key in KEYWORDS.items() if schema.get(name) not in (None, [])}
+    if 'items' in schema:
+        node['items'] = compile_schema(spec, schema['items'])
+    if schema.get('properties'):
+        node['properties'] = {field: compile_schema(spec, prop) for field, prop in schema['properties'].items()}
+    return node
+
+
+def compile_operation(spec: Dict[str, Any], operation: Dict[str, Any]) -> Dict[str, Any]:
+    body = (((operation.get('requestBody') or {}).get('content') or {}).get('application/json') or {}).get('schema')
+    if body:
+        return compile_schema(spec, body)
+    properties = {}
+    for param in operation.get('parameters') or []:
+        param = resolve(spec, param)
+        if param.get('in') == 'query' and param.get('schema'):
+            properties[param['name']] = compile_schema(spec, param['schema'])
+    return {'type': 'object', 'properties': properties}
+
+
+def apply_override(node: Dict[str, Any], path: str, constraints: Dict[str, Any]):
+    """Merge constraints into the field at a dotted path, creating missing levels."""
+    for field in path.split('.'):
+        node = node.setdefault('properties', {}).setdefault(field, {})
+    node.update(constraints)
+
+
+def format_value(value: Any, indent: int = 0) -> str:
+    """Python literal for the rules, one key per line; lists stay inline when short."""
+    pad = ' ' * (indent + 4)
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        items = ''.join(f"{pad}{key!r}: {format_value(item, indent + 4)},\n" for key, item in value.items())
+        return f"{{\n{items}{' ' * indent}}}"
+    if isinstance(value, list) and len(repr(value)) + indent > 90:
+        items = ''.join(f"{pad}{item!r},\n" for item in value)
+        return f"[\n{items}{' ' * indent}]"
+    return repr(value)
+
+
+def main():
+    rules: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(glob.glob(os.path.join(OPENAPI_DIR, '*.yaml'))):
+        with open(path) as f:
+            spec = yaml.safe_load(f)
+        for route, operations in (spec.get('paths') or {}).items():
+            if '{' in route:
+                continue   # path-parameter routes take only an ID
+            for method, operation in operations.items():
+                if method not in ('get', 'post'):
+                    continue
+                key = f"{method.upper()} {route}"
+                rules[key] = compile_operation(spec, operation)
+                for path, constraints in OVERRIDES.get(key, {}).items():
+                    apply_override(rules[key], path, constraints)
+
+    with open(OUTPUT_PATH, 'w') as f:
+        f.write(f"{HEADER}\nRULES = {format_value(rules)}\n")
+    print(f"Wrote rules for {len(rules)} operations to {os.path.relpath(OUTPUT_PATH, REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Summarize a trace file written by fundable.tracing.FileSpanExporter.
+
+Prints one row per span name: call count, total time, self time (total minus
+time spent in child spans), slowest single span and error count. A stage
+with a high total but low self time is slow because of its children, e.g. a
+fan-out of API calls.
+
+Usage:
+    python scripts/summarize_trace.py trace.jsonl
+"""
+
+import sys
+
+from fundable.tracing import load_spans, summarize
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python scripts/summarize_trace.py trace.jsonl")
+        sys.exit(1)
+
+    stages = summarize(load_spans(sys.argv[1]))
+    print(f"{'span':<40} {'count':>6} {'total ms':>10} {'self ms':>10} {'max ms':>9} {'errors':>6}")
+    for stage in stages:
+        print(f"{stage['name'][:40]:<40} {stage['count']:>6} {stage['total_ms']:>10.1f}"
+              f" {stage['self_ms']:>10.1f} {stage['max_ms']:>9.1f} {stage['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,31 @@ Basic usage:
 __version__ = "0.1.0"
 
 from fundable.client import FundableClient, DataExtractor, format_usd
+from fundable.models import Deal, Company, Investor, Person
+from fundable.metrics import RequestMetrics, PrometheusMetrics, LoggingHook
+from fundable.tracing import Tracer, FileSpanExporter, InMemorySpanExporter
+from fundable.errors import FundableError, ApiResult
+from fundable.pagination import Page, AdaptivePageSizer
 from fundable.visualization.charts import InvestorBarChart, IndustryChart
 
 __all__ = [
     "FundableClient",
     "DataExtractor",
     "format_usd",
+    "Deal",
+    "Company",
+    "Investor",
+    "Person",
+    "RequestMetrics",
+    "PrometheusMetrics",
+    "LoggingHook",
+    "Tracer",
+    "FileSpanExporter",
+    "InMemorySpanExporter",
+    "FundableError",
+    "ApiResult",
+    "Page",
+    "AdaptivePageSizer",
     "InvestorBarChart",
     "IndustryChart",
     "__version__",
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Base class and helpers for the compact record types in fundable.models.
+
+Records are plain __slots__ classes (no per-instance __dict__), which cuts
+per-object memory several-fold compared to the dicts parsed from JSON.
+Repeated strings such as enum values and foreign-key UUIDs are interned so
+a million deals share one copy of 'SEED' and of each investor ID, and
+nested objects are kept as raw JSON until first accessed.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+_intern = sys.intern
+
+
+def intern_str(value: Any) -> Any:
+    """Intern a string value; non-strings (including None) pass through."""
+    return _intern(value) if type(value) is str else value
+
+
+def intern_tuple(values: Optional[List[Any]]) -> Optional[Tuple[Any, ...]]:
+    """Convert a list of strings to a tuple of interned strings."""
+    if values is None:
+        return None
+    return tuple([_intern(v) if type(v) is str else v for v in values])
+
+
+def to_tuple(values: Optional[List[Any]]) -> Optional[Tuple[Any, ...]]:
+    """Convert a list to a (smaller, immutable) tuple."""
+    return None if values is None else tuple(values)
+
+
+def _plain(value: Any) -> Any:
+    """Convert records and tuples back to JSON-compatible dicts and lists."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (tuple, list)):
+        return [_plain(v) for v in value]
+    return value
+
+
+class lazy_record:
+    """
+    Descriptor that decodes a nested JSON object into a record on first access.
+
+    The raw dict (or list of dicts when many=True) is stored in a private
+    slot by from_dict() and replaced with the decoded record the first time
+    the attribute is read, so nested fields that are never touched cost no
+    decoding time.
+    """
+
+    __slots__ = ('slot', 'record_cls', 'many')
+
+    def __init__(self, slot: str, record_cls: Type['Record'], many: bool = False):
+        self.slot = slot
+        self.record_cls = record_cls
+        self.many = many
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if self.many:
+            if type(value) is list:
+                from_dict = self.record_cls.from_dict
+                value = tuple([from_dict(v) if type(v) is dict else v for v in value])
+                setattr(obj, self.slot, value)
+        elif type(value) is dict:
+            value = self.record_cls.from_dict(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+class Record(ABC):
+    """
+    Base class for generated API record types.
+
+    Subclasses declare `_fields` (public field names, in schema order) and
+    implement from_dict(). Records also support dict-style get() and
+    item access, so helpers such as DataExtractor.extract_deal accept them
+    in place of raw dicts.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Record':
+        """Decode one JSON object (a dict parsed from the API response) into a record."""
+
+    @classmethod
+    def from_list(cls, items: List[Dict[str, Any]]) -> List['Record']:
+        """Decode a list of JSON objects into records."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to a JSON-compatible dict."""
+        return {name: _plain(getattr(self, name)) for name in self._fields}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access; returns default for unknown fields or None values."""
+        if key not in self._fields:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        shown = [f"{name}={getattr(self, name)!r}" for name in ('id', 'name') if name in self._fields]
+        return f"{type(self).__name__}({', '.join(shown)})"
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Incremental alert polling.
+
+Re-polling a fixed 7-day window every cycle pays for the same deals again
+and again, since get_alerts counts every deal returned against the rate
+limit. AlertPoller keeps, per alert, the end of the last window it fetched
+and only asks for the time slice since then. Alert IDs are packed into
+concurrent get_alerts calls of up to 10, deals are deduplicated by ID
+across alerts and cycles, and only deals never seen before are emitted:
+
+    poller = AlertPoller(client, state_path='alerts.state.json')
+    for match in poller.poll():
+        print(match['deal']['company_name'], match['alert_names'])
+
+    poller.run(handle_match, interval=900)    # poll every 15 minutes
+
+Polling cost then tracks new activity rather than window size.
+"""
+
+import datetime
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from fundable.backfill import write_atomic
+from fundable.concurrency import shared_limiter
+
+_STATE_VERSION = 1
+
+
+def format_alert_time(value: datetime.datetime) -> str:
+    """Format a datetime as the ISO 8601 UTC timestamp get_alerts expects."""
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + f"{value.microsecond // 1000:03d}Z"
+
+
+def parse_alert_time(value: str) -> datetime.datetime:
+    """Parse a timestamp written by format_alert_time (naive UTC)."""
+    return datetime.datetime.strptime(value.rstrip('Z')[:19], '%Y-%m-%dT%H:%M:%S')
+
+
+class AlertPoller:
+    """
+    Poll saved alerts incrementally and emit each matching deal once.
+
+    Args:
+        client: FundableClient (any error_mode; failed calls are printed and retried next poll)
+        alert_ids: Alerts to poll (default: every alert from get_alert_configurations())
+        state_path: JSON file holding per-alert windows and seen deal IDs, so
+            restarts neither miss nor re-emit deals; None keeps state in memory
+        initial_lookback: How far back the first poll of an alert reaches
+        overlap: Extra time re-queried before each window, to catch deals
+            indexed late; duplicates are filtered by deal ID
+        seen_ttl: How long deal IDs are remembered for deduplication
+        concurrency: get_alerts calls in flight at once
+        rate_limit: Requests per minute (default: the client's shared rate_limiter)
+        max_retries: Retries per call for 429 / 5xx / transport errors
+    """
+
+    def __init__(self, client, alert_ids: Optional[Iterable[str]] = None, state_path: Optional[str] = None,
+                 initial_lookback: datetime.timedelta = datetime.timedelta(days=1),
+                 overlap: datetime.timedelta = datetime.timedelta(0),
+                 seen_ttl: datetime.timedelta = datetime.timedelta(days=30),
+                 concurrency: int = 4, rate_limit: Optional[int] = None, max_retries: int = 5):
+        self.client = client
+        self.state_path = state_path
+        self.initial_lookback = initial_lookback
+        self.overlap = overlap
+        self.seen_ttl = seen_ttl
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._limiter = shared_limiter(client, rate_limit)
+
+        # Configurations are loaded once; call reload_configurations() to pick up new alerts
+        self.configurations: Dict[str, Dict[str, Any]] = {}
+        self.reload_configurations()
+        self.alert_ids = list(alert_ids) if alert_ids is not None else list(self.configurations)
+
+        # alert_id -> end of the last successfully fetched window (format_alert_time string)
+        self.windows: Dict[str, str] = {}
+        # deal_id -> first-seen timestamp (epoch seconds), oldest first
+        self.seen: 'OrderedDict[str, float]' = OrderedDict()
+        self._load_state()
+
+    def reload_configurations(self):
+        """Fetch alert configurations (names, frequencies, filters); does not use credits."""
+        configurations = self.client.with_error_mode('raise').get_alert_configurations()
+        self.configurations = {config['configuration_id']: config for config in configurations
+                               if config.get('configuration_id')}
+
+    def _load_state(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        with open(self.state_path) as f:
+            state = json.load(f)
+        if state.get('version') != _STATE_VERSION:
+            return
+        self.windows = state.get('windows', {})
+        self.seen = OrderedDict(sorted(state.get('seen', {}).items(), key=lambda item: item[1]))
+
+    def save_state(self):
+        if not self.state_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(directory, exist_ok=True)
+        write_atomic(self.state_path, json.dumps({
+            'version': _STATE_VERSION,
+            'windows': self.windows,
+            'seen': self.seen,
+        }))
+
+    def _prune_seen(self, now: float):
+        cutoff = now - self.seen_ttl.total_seconds()
+        while self.seen:
+            deal_id, first_seen = next(iter(self.seen.items()))
+            if first_seen >= cutoff:
+                break
+            self.seen.popitem(last=False)
+
+    def _window_start(self, alert_id: str, now: datetime.datetime) -> str:
+        last = self.windows.get(alert_id)
+        start = parse_alert_time(last) if last else now - self.initial_lookback
+        return format_alert_time(start - self.overlap)
+
+    def _alert_name(self, alert: Dict[str, Any]) -> str:
+        config = self.configurations.get(alert.get('alertId'), {})
+        return alert.get('alertName') or config.get('configuration_name') or alert.get('alertId', '')
+
+    def poll(self, now: Optional[datetime.datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch each alert's new time slice and return deals not seen before.
+
+        Alerts whose windows start at the same time are fetched together with
+        get_alerts_bulk (concurrent calls of up to 10 IDs). A failed call is
+        reported and its alerts keep their old window, so the next poll
+        re-covers it.
+
+        Args:
+            now: End of this poll's window (default: current UTC time)
+
+        Returns:
+            One dict per new deal: 'deal', 'alert_ids' and 'alert_names'
+            (every polled alert that matched it), newest deal first
+        """
+        now = now or datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        end = format_alert_time(now)
+
+        # Group alerts by window start; in steady state that is a single group
+        groups: Dict[str, List[str]] = {}
+        for alert_id in self.alert_ids:
+            groups.setdefault(self._window_start(alert_id, now), []).append(alert_id)
+
+        matches: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        with self.client.span('alert_poll', alerts=len(self.alert_ids), groups=len(groups)):
+            for start, alert_ids in sorted(groups.items()):
+                result = self.client.with_error_mode('print').get_alerts_bulk(
+                    alert_ids, start, end, concurrency=self.concurrency,
+                    rate_limiter=self._limiter, max_retries=self.max_retries)
+                for alert in result['alerts']:
+                    for deal in alert.get('deals', []):
+                        deal_id = deal.get('id')
+                        if not deal_id or deal_id in self.seen:
+                            continue
+                        match = matches.setdefault(deal_id, {'deal': deal, 'alert_ids': [], 'alert_names': []})
+                        if alert.get('alertId') not in match['alert_ids']:
+                            match['alert_ids'].append(alert.get('alertId'))
+                            match['alert_names'].append(self._alert_name(alert))
+                failed = {alert_id for error in result['errors'] for alert_id in error['alert_ids']}
+                for alert_id in alert_ids:
+                    if alert_id not in failed:
+                        self.windows[alert_id] = end
+
+        seen_at = time.time()
+        for deal_id in matches:
+            self.seen[deal_id] = seen_at
+        self._prune_seen(seen_at)
+        self.save_state()
+        return sorted(matches.values(), key=lambda match: match['deal'].get('date') or '', reverse=True)
+
+    def run(self, handler: Callable[[Dict[str, Any]], Any], interval: float = 3600,
+            max_cycles: Optional[int] = None):
+        """
+        Poll forever (or max_cycles times), calling handler(match) for each new deal.
+
+        Args:
+            handler: Called once per new deal with the dict poll() returns
+            interval: Seconds between the starts of consecutive polls
+            max_cycles: Stop after this many polls (None to run until interrupted)
+        """
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            started = time.monotonic()
+            for match in self.poll():
+                handler(match)
+            cycles += 1
+            if max_cycles is None or cycles < max_cycles:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
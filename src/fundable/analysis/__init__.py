@@ -0,0 +1,12 @@
+"""Analysis tools for Fundable API data.
+
+This module provides NumPy-backed aggregations over deal streams, such as
+investor leaderboards whose output feeds directly into the chart classes
+in fundable.visualization, and a sparse co-investment graph. Requires the
+`analysis` extra (numpy).
+"""
+
+from fundable.analysis.leaderboard import InvestorLeaderboard
+from fundable.analysis.coinvestment import CoInvestmentGraph
+
+__all__ = ["InvestorLeaderboard", "CoInvestmentGraph"]
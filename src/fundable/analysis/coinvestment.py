@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Co-investment graph: which investors share syndicates, and how often.
+
+Deal -> investor edges (from get_deals() investor_ids or get_deal_investors())
+are expanded into investor pairs and accumulated in a symmetric
+investor x investor co-occurrence matrix stored as CSR arrays. Nothing dense
+is ever materialized, so tens of thousands of investors fit comfortably in
+memory. SciPy is optional; to_scipy() converts when it is installed.
+"""
+
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+import numpy as np
+
+from fundable.analysis.leaderboard import _IdEncoder
+
+
+class CoInvestmentGraph:
+    """
+    Sparse investor x investor co-occurrence matrix.
+
+    Two weights are tracked per investor pair:
+    - 'deals': number of deals the pair participated in together
+    - 'capital': sum of total_round_raised over those deals
+
+    New syndicates are buffered as COO pairs and merged into the CSR arrays on
+    the next query, so the graph can be updated incrementally as deals sync.
+    """
+
+    WEIGHTS = ['deals', 'capital']
+
+    def __init__(self):
+        self._investors = _IdEncoder()
+        self._deal_ids = set()
+        self._triu_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Pending COO chunks (row codes, col codes, round size per pair)
+        self._pending_rows: List[np.ndarray] = []
+        self._pending_cols: List[np.ndarray] = []
+        self._pending_capital: List[np.ndarray] = []
+
+        # Compacted CSR arrays (symmetric, no diagonal)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._deals = np.zeros(0, dtype=np.int64)
+        self._capital = np.zeros(0, dtype=np.float64)
+
+    @property
+    def num_investors(self) -> int:
+        """Number of distinct investors seen so far."""
+        return len(self._investors)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (directed) investor pairs."""
+        self._compact()
+        return len(self._indices)
+
+    def _pairs(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Upper-triangle index pairs for a syndicate of size k (cached by k)."""
+        pairs = self._triu_cache.get(k)
+        if pairs is None:
+            pairs = np.triu_indices(k, 1)
+            self._triu_cache[k] = pairs
+        return pairs
+
+    def add_syndicate(self, investor_ids: Iterable[str], round_size: float = None,
+                      deal_id: str = None) -> bool:
+        """
+        Add one deal's syndicate to the graph.
+
+        Args:
+            investor_ids: Investor UUIDs that participated in the deal
+            round_size: Deal size in USD, used for the 'capital' weight
+            deal_id: Optional deal UUID; syndicates already added under the
+                same deal_id are ignored
+
+        Returns:
+            True if the syndicate was added, False if it was a duplicate
+        """
+        if deal_id is not None:
+            if deal_id in self._deal_ids:
+                return False
+            self._deal_ids.add(deal_id)
+
+        codes = np.unique(np.fromiter((self._investors.encode(i) for i in investor_ids),
+                                      dtype=np.int32))
+        if len(codes) < 2:
+            return True
+
+        upper, lower = self._pairs(len(codes))
+        self._pending_rows.append(codes[upper])
+        self._pending_cols.append(codes[lower])
+        self._pending_capital.append(np.full(len(upper), round_size or 0.0, dtype=np.float64))
+        return True
+
+    def add_deals(self, deals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add syndicates from deal dicts (get_deals() results).
+
+        Uses investor_ids, or an enriched `investors` list of DealInvestor
+        dicts when present, plus total_round_raised for the capital weight.
+
+        Returns:
+            Number of new deals added
+        """
+        added = 0
+        for deal in deals:
+            investors = deal.get('investors')
+            if investors and isinstance(investors[0], dict):
+                investor_ids = [inv['id'] for inv in investors if inv.get('id')]
+            else:
+                investor_ids = deal.get('investor_ids') or []
+            if self.add_syndicate(investor_ids, deal.get('total_round_raised'), deal.get('id')):
+                added += 1
+        return added
+
+    def add_deal_investors(self, deal_id: str, investors: List[Dict[str, Any]],
+                           round_size: float = None) -> bool:
+        """Add a syndicate from a get_deal_investors() response."""
+        return self.add_syndicate([inv['id'] for inv in investors if inv.get('id')],
+                                  round_size, deal_id)
+
+    def _compact(self):
+        """Merge pending COO pairs into the CSR arrays, summing duplicates."""
+        n = len(self._investors)
+        if not self._pending_rows:
+            # Investors seen only in solo syndicates still need (empty) rows
+            if len(self._indptr) < n + 1:
+                self._indptr = np.concatenate([
+                    self._indptr,
+                    np.full(n + 1 - len(self._indptr), self._indptr[-1], dtype=np.int64)])
+            return
+
+        new_rows = np.concatenate(self._pending_rows).astype(np.int64)
+        new_cols = np.concatenate(self._pending_cols).astype(np.int64)
+        new_capital = np.concatenate(self._pending_capital)
+        self._pending_rows, self._pending_cols, self._pending_capital = [], [], []
+
+        # Existing CSR back to COO (row of each stored entry)
+        old_rows = np.repeat(np.arange(len(self._indptr) - 1, dtype=np.int64),
+                             np.diff(self._indptr))
+
+        # Symmetrize new pairs, then combine with existing entries
+        rows = np.concatenate([old_rows, new_rows, new_cols])
+        cols = np.concatenate([self._indices.astype(np.int64), new_cols, new_rows])
+        deals = np.concatenate([self._deals, np.ones(2 * len(new_rows), dtype=np.int64)])
+        capital = np.concatenate([self._capital, new_capital, new_capital])
+
+        # Sum duplicates by linear key; np.unique also sorts by (row, col)
+        keys, inverse = np.unique(rows * n + cols, return_inverse=True)
+        self._deals = np.bincount(inverse, weights=deals, minlength=len(keys)).astype(np.int64)
+        self._capital = np.bincount(inverse, weights=capital, minlength=len(keys))
+        self._indices = (keys % n).astype(np.int32)
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // n, minlength=n), out=self._indptr[1:])
+
+    def csr(self, weight: str = 'deals') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the raw CSR arrays (data, indices, indptr) for a weight.
+
+        Row/column i corresponds to investor_id(i).
+        """
+        if weight not in self.WEIGHTS:
+            raise ValueError(f"weight must be one of: {self.WEIGHTS}")
+        self._compact()
+        data = self._deals if weight == 'deals' else self._capital
+        return data, self._indices, self._indptr
+
+    def to_scipy(self, weight: str = 'deals'):
+        """Return the co-occurrence matrix as a scipy.sparse.csr_matrix (requires scipy)."""
+        from scipy.sparse import csr_matrix
+
+        data, indices, indptr = self.csr(weight)
+        n = len(self._investors)
+        return csr_matrix((data, indices, indptr), shape=(n, n))
+
+    def investor_id(self, code: int) -> str:
+        """Map a matrix row/column index back to an investor UUID."""
+        return self._investors.values[code]
+
+    def top_coinvestors(self, investor_id: str, k: int = 10,
+                        weight: str = 'deals') -> List[Dict[str, Any]]:
+        """
+        Get an investor's most frequent co-investors.
+
+        Args:
+            investor_id: Investor UUID
+            k: Number of co-investors to return
+            weight: 'deals' (shared deal count) or 'capital' (shared round size, USD)
+
+        Returns:
+            List of dicts with id, deal_count and total_capital, sorted by
+            `weight` descending. Empty if the investor has no co-investors.
+        """
+        data, indices, indptr = self.csr(weight)
+        code = self._investors.codes.get(investor_id)
+        if code is None or code + 1 >= len(indptr) or k <= 0:
+            return []
+
+        start, end = indptr[code], indptr[code + 1]
+        if start == end:
+            return []
+        row = data[start:end]
+        if len(row) > k:
+            candidates = np.argpartition(-row, k - 1)[:k]
+        else:
+            candidates = np.arange(len(row))
+        ordered = candidates[np.argsort(-row[candidates], kind='stable')]
+
+        results = []
+        for offset in (start + ordered).tolist():
+            results.append({
+                'id': self._investors.values[indices[offset]],
+                'deal_count': int(self._deals[offset]),
+                'total_capital': float(self._capital[offset]),
+            })
+        return results
+
+    def top_pairs(self, k: int = 20, weight: str = 'deals') -> List[Dict[str, Any]]:
+        """
+        Get the strongest co-investment pairs across the whole graph.
+
+        Returns:
+            List of dicts with investor_a, investor_b, deal_count and total_capital
+        """
+        data, indices, indptr = self.csr(weight)
+        rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+        upper = np.flatnonzero(rows < indices)
+        if not len(upper) or k <= 0:
+            return []
+        if len(upper) > k:
+            upper = upper[np.argpartition(-data[upper], k - 1)[:k]]
+        upper = upper[np.argsort(-data[upper], kind='stable')]
+
+        return [{
+            'investor_a': self._investors.values[rows[i]],
+            'investor_b': self._investors.values[indices[i]],
+            'deal_count': int(self._deals[i]),
+            'total_capital': float(self._capital[i]),
+        } for i in upper.tolist()]
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Vectorized investor leaderboards built from a stream of deals.
+
+Deals from get_deals() are flattened into deal -> investor edges with
+integer-encoded IDs, and all per-investor aggregates (deal counts, capital,
+lead counts, recency) are computed with NumPy group-bys instead of Python
+loops. The output rows plug straight into InvestorBarChart.
+"""
+
+from typing import List, Dict, Any, Optional, Iterable
+
+import numpy as np
+
+
+_NO_DATE = np.datetime64('NaT', 'D')
+
+
+class _IdEncoder:
+    """Map string IDs to dense integer codes (and back)."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class InvestorLeaderboard:
+    """
+    Accumulate deals and rank investors by activity.
+
+    Deals are added incrementally with add_deals(); each call appends one
+    chunk of per-deal and per-edge arrays. Aggregation concatenates the
+    chunks once and reduces them with np.bincount / np.maximum.at, so ranking
+    millions of deal-investor edges takes a fraction of a second.
+
+    Lead information is not part of the deal payload itself. Pass `leads`
+    (deal_id -> lead investor IDs, e.g. built from get_deal_investors()) or
+    add deals that carry an enriched `investors` list of DealInvestor dicts.
+    """
+
+    METRICS = ['deal_count', 'lead_count', 'total_capital', 'last_deal_date']
+
+    def __init__(self):
+        self._investors = _IdEncoder()
+        self._round_types = _IdEncoder()
+        self._deal_ids = set()
+        self._num_deals = 0
+
+        # Chunks appended by add_deals(), concatenated lazily in _arrays()
+        self._deal_chunks: List[Dict[str, np.ndarray]] = []
+        self._edge_chunks: List[Dict[str, np.ndarray]] = []
+        self._cache: Optional[Dict[str, np.ndarray]] = None
+
+    @property
+    def num_deals(self) -> int:
+        """Number of distinct deals added so far."""
+        return self._num_deals
+
+    @property
+    def num_edges(self) -> int:
+        """Number of deal -> investor edges added so far."""
+        return sum(len(chunk['investor']) for chunk in self._edge_chunks)
+
+    def add_deals(self, deals: Iterable[Dict[str, Any]],
+                  leads: Optional[Dict[str, Iterable[str]]] = None) -> int:
+        """
+        Add a batch of deals to the leaderboard.
+
+        Args:
+            deals: Deal dicts from get_deals() (uses id, investor_ids,
+                total_round_raised, round_type and date). Deals with an
+                `investors` list of DealInvestor dicts use its ids and
+                lead_investor flags instead of investor_ids.
+            leads: Optional mapping of deal_id -> lead investor IDs
+
+        Returns:
+            Number of new deals added (deals already seen are skipped)
+        """
+        leads = leads or {}
+        encode = self._investors.encode
+        first_deal = self._num_deals
+
+        amounts, dates, round_codes = [], [], []
+        edge_deal, edge_investor, edge_lead = [], [], []
+
+        for deal in deals:
+            deal_id = deal.get('id')
+            if deal_id in self._deal_ids:
+                continue
+            if deal_id:
+                self._deal_ids.add(deal_id)
+
+            deal_index = first_deal + len(amounts)
+            amounts.append(deal.get('total_round_raised') or 0.0)
+            dates.append((deal.get('date') or '')[:10] or 'NaT')
+            round_codes.append(self._round_types.encode(deal.get('round_type') or 'Unknown'))
+
+            enriched = deal.get('investors')
+            if enriched and isinstance(enriched[0], dict):
+                investor_ids = [inv['id'] for inv in enriched if inv.get('id')]
+                lead_ids = {inv['id'] for inv in enriched if inv.get('lead_investor')}
+            else:
+                investor_ids = deal.get('investor_ids') or []
+                lead_ids = leads.get(deal_id, ())
+                if lead_ids and not isinstance(lead_ids, (set, frozenset)):
+                    lead_ids = set(lead_ids)
+
+            for investor_id in investor_ids:
+                edge_deal.append(deal_index)
+                edge_investor.append(encode(investor_id))
+                edge_lead.append(investor_id in lead_ids)
+
+        if not amounts:
+            return 0
+
+        self._deal_chunks.append({
+            'amount': np.asarray(amounts, dtype=np.float64),
+            'date': np.asarray(dates, dtype='datetime64[D]'),
+            'round_type': np.asarray(round_codes, dtype=np.int32),
+        })
+        self._edge_chunks.append({
+            'deal': np.asarray(edge_deal, dtype=np.int64),
+            'investor': np.asarray(edge_investor, dtype=np.int32),
+            'lead': np.asarray(edge_lead, dtype=bool),
+        })
+        self._num_deals += len(amounts)
+        self._cache = None
+        return len(amounts)
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """Concatenate all chunks into flat deal and edge arrays (cached)."""
+        if self._cache is None:
+            if self._deal_chunks:
+                arrays = {key: np.concatenate([c[key] for c in self._deal_chunks])
+                          for key in self._deal_chunks[0]}
+                arrays.update({f"edge_{key}": np.concatenate([c[key] for c in self._edge_chunks])
+                               for key in self._edge_chunks[0]})
+                # Collapse to a single chunk so later appends stay cheap
+                self._deal_chunks = [{k: arrays[k] for k in ('amount', 'date', 'round_type')}]
+                self._edge_chunks = [{k: arrays[f"edge_{k}"] for k in ('deal', 'investor', 'lead')}]
+            else:
+                arrays = {
+                    'amount': np.zeros(0, dtype=np.float64),
+                    'date': np.zeros(0, dtype='datetime64[D]'),
+                    'round_type': np.zeros(0, dtype=np.int32),
+                    'edge_deal': np.zeros(0, dtype=np.int64),
+                    'edge_investor': np.zeros(0, dtype=np.int32),
+                    'edge_lead': np.zeros(0, dtype=bool),
+                }
+            self._cache = arrays
+        return self._cache
+
+    def aggregate(self, round_types: List[str] = None,
+                  start_date: str = None, end_date: str = None) -> Dict[str, np.ndarray]:
+        """
+        Compute per-investor aggregates, optionally restricted to a subset of deals.
+
+        Args:
+            round_types: Only count deals with these round types (e.g. ['SEED'])
+            start_date: Only count deals on or after this date (YYYY-MM-DD)
+            end_date: Only count deals on or before this date (YYYY-MM-DD)
+
+        Returns:
+            Dict of arrays indexed by investor code: deal_count, lead_count,
+            total_capital and last_deal_date (datetime64[D], NaT if undated)
+        """
+        arrays = self._arrays()
+        edge_deal = arrays['edge_deal']
+        edge_investor = arrays['edge_investor']
+        edge_lead = arrays['edge_lead']
+        n = len(self._investors)
+
+        deal_mask = None
+        if round_types is not None:
+            wanted = [self._round_types.codes[rt] for rt in round_types if rt in self._round_types.codes]
+            deal_mask = np.isin(arrays['round_type'], wanted)
+        if start_date or end_date:
+            dates = arrays['date']
+            date_mask = ~np.isnat(dates)
+            if start_date:
+                date_mask &= dates >= np.datetime64(start_date[:10], 'D')
+            if end_date:
+                date_mask &= dates <= np.datetime64(end_date[:10], 'D')
+            deal_mask = date_mask if deal_mask is None else deal_mask & date_mask
+
+        if deal_mask is not None:
+            keep = deal_mask[edge_deal]
+            edge_deal = edge_deal[keep]
+            edge_investor = edge_investor[keep]
+            edge_lead = edge_lead[keep]
+
+        deal_count = np.bincount(edge_investor, minlength=n)
+        lead_count = np.bincount(edge_investor, weights=edge_lead, minlength=n).astype(np.int64)
+        total_capital = np.bincount(edge_investor, weights=arrays['amount'][edge_deal], minlength=n)
+
+        # Recency: NaT sorts as the minimum int64, so a max-reduction skips undated deals
+        edge_days = arrays['date'][edge_deal].astype(np.int64)
+        last_days = np.full(n, _NO_DATE.astype(np.int64), dtype=np.int64)
+        np.maximum.at(last_days, edge_investor, edge_days)
+
+        return {
+            'deal_count': deal_count,
+            'lead_count': lead_count,
+            'total_capital': total_capital,
+            'last_deal_date': last_days.astype('datetime64[D]'),
+        }
+
+    def top(self, n: int = 20, metric: str = 'deal_count',
+            investors: Optional[Dict[str, Dict[str, Any]]] = None,
+            round_types: List[str] = None,
+            start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
+        """
+        Rank investors by a metric and return chart-ready dicts.
+
+        Args:
+            n: Number of investors to return
+            metric: One of 'deal_count', 'lead_count', 'total_capital', 'last_deal_date'
+            investors: Optional investor_id -> investor dict (e.g. from get_investors())
+                used to fill in 'name' and 'image' for charting
+            round_types, start_date, end_date: Deal filters passed to aggregate()
+
+        Returns:
+            List of dicts with id, name, image and every metric, sorted by `metric`
+            descending. Pass directly to InvestorBarChart.plot_top_investors().
+        """
+        if metric not in self.METRICS:
+            raise ValueError(f"metric must be one of: {self.METRICS}")
+
+        stats = self.aggregate(round_types=round_types, start_date=start_date, end_date=end_date)
+        active = np.flatnonzero(stats['deal_count'])
+        if not len(active) or n <= 0:
+            return []
+
+        keys = stats[metric][active]
+        if metric == 'last_deal_date':
+            # Undated investors rank last; avoid negating the NaT sentinel
+            keys = keys.astype(np.int64)
+            keys = np.where(keys == _NO_DATE.astype(np.int64), np.iinfo(np.int64).min + 1, keys)
+        # Sort by metric desc, then deal_count desc as a tie-breaker
+        order = np.lexsort((-stats['deal_count'][active], -keys))[:n]
+        ranked = active[order]
+
+        investors = investors or {}
+        rows = []
+        for code in ranked.tolist():
+            investor_id = self._investors.values[code]
+            info = investors.get(investor_id) or {}
+            last_date = stats['last_deal_date'][code]
+            rows.append({
+                'id': investor_id,
+                'name': info.get('name') or investor_id,
+                'image': info.get('image'),
+                'deal_count': int(stats['deal_count'][code]),
+                'lead_count': int(stats['lead_count'][code]),
+                'total_capital': float(stats['total_capital'][code]),
+                'last_deal_date': None if np.isnat(last_date) else str(last_date),
+            })
+        return rows
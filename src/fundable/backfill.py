@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Date-sharded, resumable get_deals backfills.
+
+Paging deep into one sorted result set is slow and fragile for multi-year
+ranges. DealBackfill splits the range into shards of a few days, probes
+each shard's total_count (one single-record request), and halves any shard
+whose count exceeds max_shard_count until every shard is a few pages deep.
+Shard pages are then fetched concurrently under the API rate limit, with
+retries, and each completed page is recorded in a checkpoint file so an
+interrupted backfill resumes where it stopped:
+
+    backfill = DealBackfill(
+        client, '2019-01-01', '2024-12-31',
+        filters={'financing_types': [{'type': 'SEED'}]},
+        sink=JsonlPageSink('backfill/seed'),
+        checkpoint_path='backfill/seed.checkpoint.json',
+    )
+    summary = backfill.run()      # re-run after a crash to resume
+
+Shards are inclusive, non-overlapping day ranges, so each deal is fetched
+exactly once.
+"""
+
+import datetime
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fundable.concurrency import RateLimiter, call_with_retry, shared_limiter, submit_in_context
+from fundable.pagination import Page, page_count
+from fundable.queries import DealQuery
+
+# get_deals arguments the backfill controls itself
+_RESERVED_FILTERS = ('deal_start_date', 'deal_end_date', 'start_date', 'end_date', 'page', 'page_size')
+
+
+def _to_date(value) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def _plain(record: Any) -> Any:
+    return record.to_dict() if hasattr(record, 'to_dict') else record
+
+
+def write_atomic(path: str, text: str):
+    """Write a file via a temp file and rename, so readers never see a partial file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+class Shard:
+    """An inclusive range of deal dates."""
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start: datetime.date, end: datetime.date):
+        self.start = start
+        self.end = end
+
+    @property
+    def key(self) -> str:
+        return f"{self.start.isoformat()}:{self.end.isoformat()}"
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def split(self) -> Tuple['Shard', 'Shard']:
+        """Halve the shard (it must span at least two days)."""
+        middle = self.start + datetime.timedelta(days=self.days // 2 - 1)
+        return Shard(self.start, middle), Shard(middle + datetime.timedelta(days=1), self.end)
+
+    def __repr__(self) -> str:
+        return f"Shard({self.key})"
+
+
+class Checkpoint:
+    """
+    JSON checkpoint of per-shard progress.
+
+    Each shard key maps to {'split': True} once it has been halved, or to
+    {'total_count', 'num_pages', 'pages_done'} once planned. The file also
+    stores a fingerprint of the query, so a checkpoint is never resumed
+    against a different query.
+    """
+
+    def __init__(self, path: Optional[str], fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.shards: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            if saved.get('fingerprint') != fingerprint:
+                raise ValueError(f"Checkpoint {path} was written for a different query; "
+                                 f"delete it or choose another checkpoint path")
+            self.shards = saved.get('shards', {})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.shards.get(key)
+
+    def set_split(self, key: str):
+        self.shards[key] = {'split': True}
+
+    def set_planned(self, key: str, total_count: Optional[int], num_pages: Optional[int]):
+        self.shards[key] = {'total_count': total_count, 'num_pages': num_pages, 'pages_done': []}
+
+    def mark_page(self, key: str, page: int):
+        state = self.shards[key]
+        if page not in state['pages_done']:
+            state['pages_done'].append(page)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            write_atomic(self.path, json.dumps({'fingerprint': self.fingerprint, 'shards': self.shards}))
+
+
+class JsonlPageSink:
+    """
+    Write each fetched page to its own JSON Lines file.
+
+    Files are named by shard and page and written atomically, so a page
+    re-fetched after a crash simply overwrites its earlier copy.
+    """
+
+    def __init__(self, directory: str, prefix: str = 'deals'):
+        self.directory = directory
+        self.prefix = prefix
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, shard: Shard, page: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}_{shard.start}_{shard.end}_p{page:05d}.jsonl")
+
+    def __call__(self, shard: Shard, page: int, records: List[Any]):
+        lines = ''.join(json.dumps(_plain(record), default=str) + '\n' for record in records)
+        write_atomic(self.path(shard, page), lines)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Read back every record written so far."""
+        for path in sorted(glob.glob(os.path.join(self.directory, f"{self.prefix}_*.jsonl"))):
+            with open(path) as f:
+                for line in f:
+                    yield json.loads(line)
+
+
+class DealBackfill:
+    """
+    Backfill get_deals over a date range using adaptive date shards.
+
+    Args:
+        client: FundableClient (any error_mode; the backfill uses a raising copy)
+        start_date: First deal date (YYYY-MM-DD or date)
+        end_date: Last deal date, inclusive
+        filters: Other get_deals() keyword arguments (financing_types, industries, model, ...)
+        sink: Callable(shard, page, records) receiving each fetched page, called
+            from the coordinating thread; e.g. JsonlPageSink(directory)
+        checkpoint_path: JSON file recording progress; None disables resuming
+        page_size: Records per page (max 500)
+        max_shard_count: Shards whose total_count exceeds this are split in half
+        initial_shard_days: Length of the initial shards in days
+        workers: Concurrent requests
+        rate_limit: Requests per minute across all workers (default: the client's shared rate_limiter)
+        max_retries: Retries per request for 429 / 5xx / transport errors
+    """
+
+    def __init__(self, client, start_date, end_date, filters: Optional[Dict[str, Any]] = None,
+                 sink: Optional[Callable[[Shard, int, List[Any]], Any]] = None,
+                 checkpoint_path: Optional[str] = None, page_size: int = 500,
+                 max_shard_count: int = 5000, initial_shard_days: int = 7, workers: int = 4,
+                 rate_limit: Optional[int] = None, max_retries: int = 5):
+        self.client = client
+        self.start = _to_date(start_date)
+        self.end = _to_date(end_date)
+        if self.end < self.start:
+            raise ValueError("end_date must not be before start_date")
+        self.filters = dict(filters or {})
+        reserved = [key for key in _RESERVED_FILTERS if key in self.filters]
+        if reserved:
+            raise ValueError(f"DealBackfill sets these itself; remove them from filters: {reserved}")
+        if not 1 <= page_size <= 500:
+            raise ValueError("page_size must be between 1 and 500")
+        # Filters are validated and encoded once; shards only swap the date range
+        self.model = bool(self.filters.get('model'))
+        self.query = DealQuery(page_size=page_size,
+                               **{key: value for key, value in self.filters.items() if key != 'model'})
+
+        self.sink = sink or (lambda shard, page, records: None)
+        self.page_size = page_size
+        self.max_shard_count = max_shard_count
+        self.initial_shard_days = max(1, initial_shard_days)
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.checkpoint = Checkpoint(checkpoint_path, self.fingerprint())
+
+    def fingerprint(self) -> str:
+        """Hash of everything that determines the shard plan and page contents."""
+        query = {
+            'endpoint': 'deals',
+            'start': self.start.isoformat(),
+            'end': self.end.isoformat(),
+            'filters': self.filters,
+            'page_size': self.page_size,
+            'max_shard_count': self.max_shard_count,
+            'initial_shard_days': self.initial_shard_days,
+        }
+        return hashlib.sha256(json.dumps(query, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def initial_shards(self) -> List[Shard]:
+        shards = []
+        start = self.start
+        step = datetime.timedelta(days=self.initial_shard_days)
+        while start <= self.end:
+            end = min(self.end, start + step - datetime.timedelta(days=1))
+            shards.append(Shard(start, end))
+            start = end + datetime.timedelta(days=1)
+        return shards
+
+    def shard_query(self, shard: Shard, page_size: Optional[int] = None) -> DealQuery:
+        """The shard's precompiled get_deals query (page_size defaults to the backfill's)."""
+        return self.query.with_filters(deal_start_date=shard.start.isoformat(), deal_end_date=shard.end.isoformat(),
+                                       page_size=page_size or self.page_size)
+
+    def _fetch(self, client, limiter: RateLimiter, shard: Shard, query: DealQuery, page: int) -> Page:
+        with client.span('backfill.fetch', shard=shard.key, page=page):
+            return call_with_retry(lambda: client.run_query_page(query, page=page, model=self.model),
+                                   limiter, max_retries=self.max_retries)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run (or resume) the backfill.
+
+        Returns:
+            Summary dict: shards, splits, pages, skipped_pages (already done), records, elapsed_s
+
+        Raises:
+            fundable.errors.FundableError: a request failed after all retries; progress
+            up to that point is kept in the checkpoint
+        """
+        client = self.client.with_error_mode('raise')
+        limiter = shared_limiter(self.client, self.rate_limit)
+        checkpoint = self.checkpoint
+        summary = {'shards': 0, 'splits': 0, 'pages': 0, 'skipped_pages': 0, 'records': 0}
+        started = time.perf_counter()
+        pending: Dict[Future, Tuple[str, Shard, int]] = {}
+        # (shard key, kind) -> query, so every page of a shard reuses one encoded body
+        queries: Dict[Tuple[str, str], DealQuery] = {}
+
+        def fetch(executor, kind: str, shard: Shard, page: int):
+            query = queries.get((shard.key, kind))
+            if query is None:
+                query = queries[shard.key, kind] = self.shard_query(shard, 1 if kind == 'probe' else None)
+            future = submit_in_context(executor, self._fetch, client, limiter, shard, query, page)
+            pending[future] = (kind, shard, page)
+
+        def plan(executor, shard: Shard):
+            state = checkpoint.get(shard.key)
+            if state is None:
+                fetch(executor, 'probe', shard, 0)
+            elif state.get('split'):
+                summary['splits'] += 1
+                for child in shard.split():
+                    plan(executor, child)
+            else:
+                schedule_pages(executor, shard, state)
+
+        def schedule_pages(executor, shard: Shard, state: Dict[str, Any]):
+            summary['shards'] += 1
+            done = set(state['pages_done'])
+            summary['skipped_pages'] += len(done)
+            if state['num_pages'] is None:
+                # total_count unknown: page sequentially until a short page
+                next_page = max(done) + 1 if done else 0
+                fetch(executor, 'page', shard, next_page)
+                return
+            for page in range(state['num_pages']):
+                if page not in done:
+                    fetch(executor, 'page', shard, page)
+
+        with self.client.span('deal_backfill', start=self.start.isoformat(), end=self.end.isoformat()):
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for shard in self.initial_shards():
+                    plan(executor, shard)
+                try:
+                    while pending:
+                        finished, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            kind, shard, page = pending.pop(future)
+                            result = future.result()
+                            if kind == 'probe':
+                                total = result.total_count
+                                if total is not None and total > self.max_shard_count and shard.days > 1:
+                                    checkpoint.set_split(shard.key)
+                                    summary['splits'] += 1
+                                    for child in shard.split():
+                                        plan(executor, child)
+                                else:
+                                    num_pages = page_count(total, self.page_size)
+                                    checkpoint.set_planned(shard.key, total, num_pages)
+                                    schedule_pages(executor, shard, checkpoint.get(shard.key))
+                            else:
+                                self.sink(shard, page, result.records)
+                                checkpoint.mark_page(shard.key, page)
+                                summary['pages'] += 1
+                                summary['records'] += len(result.records)
+                                if checkpoint.get(shard.key)['num_pages'] is None and len(result.records) >= self.page_size:
+                                    fetch(executor, 'page', shard, page + 1)
+                            checkpoint.save()
+                except BaseException:
+                    for future in pending:
+                        future.cancel()
+                    checkpoint.save()
+                    raise
+
+        summary['elapsed_s'] = round(time.perf_counter() - started, 2)
+        return summary
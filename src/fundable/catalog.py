@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Local reference catalog of industries, super categories and locations.
+
+Filters such as industries=, super_categories= and locations= take
+permalinks ('artificial-intelligence', 'san-francisco-california'), and
+turning a name into one costs a search_industries / search_locations round
+trip. ReferenceCatalog keeps the reference data in memory, persisted to a
+JSON file with a TTL, and answers lookups from an in-process prefix trie and
+trigram index:
+
+    catalog = ReferenceCatalog(client)           # loads the cache, or fetches it once
+    catalog.industries(['artificial intelligence', 'fintech'])
+    # ['artificial-intelligence', 'fintech']
+    catalog.locations(['San Francisco'])         # ['san-francisco-california']
+    catalog.lookup('location', 'san fran')       # ranked candidates, no network
+
+The search endpoints have no "list all" form, so the catalog is seeded by a
+one-off sweep of searches (one per letter and type) and grows as names the
+sweep missed are resolved: each fallback search is memoized and its results
+are added to the catalog and the cache file.
+"""
+
+import json
+import os
+import re
+import string
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fundable.concurrency import call_with_retry, shared_limiter, submit_in_context
+from fundable.metrics import cache_miss
+
+CATALOG_KINDS = {
+    'industry': {'method': 'search_industries', 'path': '/industry/search', 'type_key': 'industry_type',
+                 'types': ['INDUSTRY', 'SUPER_CATEGORY']},
+    'location': {'method': 'search_locations', 'path': '/location/search', 'type_key': 'location_type',
+                 'types': ['CITY', 'STATE', 'REGION', 'COUNTRY']},
+}
+
+DEFAULT_CACHE_PATH = os.path.join('.fundable_cache', 'reference_catalog.json')
+DEFAULT_TTL = 7 * 24 * 3600     # seconds
+DEFAULT_SEED_TERMS = list(string.ascii_lowercase)
+
+_CACHE_VERSION = 1
+
+
+def normalize_name(value: Optional[str]) -> str:
+    """Casefold and reduce punctuation / dashes to single spaces ('Real-Estate & PropTech' -> 'real estate proptech')."""
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', (value or '').casefold()).split())
+
+
+def trigrams(value: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded so word starts and ends count."""
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PrefixTrie:
+    """
+    Character trie mapping normalized keys to entry indexes.
+
+    Each entry is inserted under its full name and under every word, so
+    'fran' finds 'San Francisco'.
+    """
+
+    __slots__ = ('_root',)
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def insert(self, key: str, value: int):
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault('', set()).add(value)
+
+    def search(self, prefix: str, limit: int = 10) -> List[int]:
+        """Indexes under prefix, shortest keys first (breadth-first)."""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        found: List[int] = []
+        level = [node]
+        while level and len(found) < limit:
+            next_level = []
+            for current in level:
+                for char, child in current.items():
+                    if char == '':
+                        found.extend(value for value in sorted(child) if value not in found)
+                    else:
+                        next_level.append(child)
+            level = next_level
+        return found[:limit]
+
+
+class NgramIndex:
+    """Trigram inverted index scored by the Dice coefficient, for typo-tolerant matching."""
+
+    __slots__ = ('_postings', '_sizes')
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: Dict[int, int] = {}
+
+    def add(self, value: int, text: str):
+        grams = trigrams(text)
+        self._sizes[value] = len(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(value)
+
+    def search(self, text: str, limit: int = 10, min_score: float = 0.3) -> List[Tuple[float, int]]:
+        """(score, index) pairs with score >= min_score, best first."""
+        grams = trigrams(text)
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scored = [(2.0 * count / (len(grams) + self._sizes[value]), value) for value, count in shared.items()]
+        scored = [pair for pair in scored if pair[0] >= min_score]
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return scored[:limit]
+
+
+class _KindIndex:
+    """Entries of one catalog kind plus their lookup structures."""
+
+    def __init__(self, type_key: str):
+        self.type_key = type_key
+        self.entries: List[Dict[str, Any]] = []
+        self.by_permalink: Dict[str, int] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.trie = PrefixTrie()
+        self.ngrams = NgramIndex()
+
+    def add(self, entry: Dict[str, Any]) -> bool:
+        permalink = entry.get('permalink')
+        if not permalink or permalink in self.by_permalink:
+            return False
+        index = len(self.entries)
+        entry = {'permalink': permalink, 'name': entry.get('name') or permalink,
+                 'type': entry.get('type') or entry.get(self.type_key)}
+        self.entries.append(entry)
+        self.by_permalink[permalink] = index
+
+        name = normalize_name(entry['name'])
+        self.by_name.setdefault(name, []).append(index)
+        self.trie.insert(name, index)
+        for word in name.split()[1:]:
+            self.trie.insert(word, index)
+        self.ngrams.add(index, name)
+        return True
+
+
+class ReferenceCatalog:
+    """
+    In-memory industry / super category / location catalog with a disk cache.
+
+    Args:
+        client: FundableClient used to fill the catalog and for fallback
+            searches; None for a purely offline catalog (cache file only)
+        cache_path: JSON cache file (None disables persistence)
+        ttl: Seconds before the cached sweep is refreshed; a stale cache is
+            still used when there is no client
+        seed_terms: Search terms swept per kind and type when (re)filling the catalog
+        workers: Concurrent searches during a sweep
+        rate_limit: Requests per minute during a sweep and fallback searches (default: the client's shared rate_limiter)
+        max_retries: Retries per search for 429 / 5xx / transport errors
+    """
+
+    def __init__(self, client=None, cache_path: Optional[str] = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 seed_terms: Optional[Iterable[str]] = None, workers: int = 4,
+                 rate_limit: Optional[int] = None, max_retries: int = 5):
+        self.client = client
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.seed_terms = list(seed_terms) if seed_terms is not None else DEFAULT_SEED_TERMS
+        self.workers = max(1, workers)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.fetched_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._reset()
+
+        if not self.load() and client is not None:
+            self.refresh()
+
+    def _reset(self):
+        self._kinds = {kind: _KindIndex(spec['type_key']) for kind, spec in CATALOG_KINDS.items()}
+        # Memoized fallback searches: 'kind|type|normalized name' -> permalinks in API rank order
+        self._queries: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _check_kind(kind: str, type: Optional[str] = None):
+        if kind not in CATALOG_KINDS:
+            raise ValueError(f"kind must be one of: {list(CATALOG_KINDS)}")
+        if type is not None and type not in CATALOG_KINDS[kind]['types']:
+            raise ValueError(f"type must be one of: {CATALOG_KINDS[kind]['types']}")
+
+    @property
+    def is_stale(self) -> bool:
+        return self.fetched_at is None or time.time() - self.fetched_at > self.ttl
+
+    def __len__(self) -> int:
+        return sum(len(index.entries) for index in self._kinds.values())
+
+    # --- Persistence ---
+
+    def load(self) -> bool:
+        """
+        Load the cache file.
+
+        Returns:
+            True if the cache was loaded and is fresh (or is stale but there is
+            no client to refresh it), False if the catalog needs a refresh
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading reference catalog cache {self.cache_path}: {e}")
+            return False
+        if saved.get('version') != _CACHE_VERSION:
+            return False
+
+        with self._lock:
+            self._reset()
+            for kind, entries in saved.get('entries', {}).items():
+                if kind in self._kinds:
+                    for entry in entries:
+                        self._kinds[kind].add(entry)
+            self._queries = saved.get('queries', {})
+            self.fetched_at = saved.get('fetched_at')
+        return not self.is_stale or self.client is None
+
+    def save(self):
+        """Write the catalog and memoized searches to the cache file."""
+        if not self.cache_path:
+            return
+        with self._lock:
+            state = {
+                'version': _CACHE_VERSION,
+                'fetched_at': self.fetched_at,
+                'entries': {kind: index.entries for kind, index in self._kinds.items()},
+                'queries': self._queries,
+            }
+            text = json.dumps(state)
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.cache_path}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, self.cache_path)
+
+    def refresh(self):
+        """
+        Re-fill the catalog with a sweep of seed-term searches and save it.
+
+        Raises:
+            fundable.errors.FundableError: a search failed after all retries
+        """
+        if self.client is None:
+            raise ValueError("refresh() needs a client")
+        client = self.client.with_error_mode('raise')
+        limiter = shared_limiter(self.client, self.rate_limit)
+        searches = [(kind, type, term) for kind, spec in CATALOG_KINDS.items()
+                    for type in spec['types'] for term in self.seed_terms]
+
+        def search(kind: str, type: str, term: str) -> List[Dict[str, Any]]:
+            method = getattr(client, CATALOG_KINDS[kind]['method'])
+            return call_with_retry(lambda: method(name=term, type=type), limiter, max_retries=self.max_retries)
+
+        with self.client.span('catalog.refresh', searches=len(searches)), \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [(kind, submit_in_context(executor, search, kind, type, term))
+                       for kind, type, term in searches]
+            results = [(kind, future.result()) for kind, future in futures]
+
+        with self._lock:
+            queries = self._queries
+            self._reset()
+            self._queries = queries
+            for kind, entries in results:
+                for entry in entries:
+                    self._kinds[kind].add(entry)
+            self.fetched_at = time.time()
+        self.save()
+
+    # --- Lookups ---
+
+    def add(self, kind: str, entries: Iterable[Dict[str, Any]]) -> int:
+        """Add search-result dicts (permalink, name, industry_type / location_type); returns how many were new."""
+        self._check_kind(kind)
+        with self._lock:
+            return sum(self._kinds[kind].add(entry) for entry in entries)
+
+    def entries(self, kind: str, type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """All cached entries of a kind, optionally of one type ('SUPER_CATEGORY', 'CITY', ...)."""
+        self._check_kind(kind, type)
+        return [dict(entry) for entry in self._kinds[kind].entries if type is None or entry['type'] == type]
+
+    def get(self, kind: str, permalink: str) -> Optional[Dict[str, Any]]:
+        """Entry for a permalink, or None."""
+        self._check_kind(kind)
+        index = self._kinds[kind].by_permalink.get(permalink)
+        return dict(self._kinds[kind].entries[index]) if index is not None else None
+
+    def lookup(self, kind: str, name: str, type: Optional[str] = None, limit: int = 10,
+               min_score: float = 0.3) -> List[Dict[str, Any]]:
+        """
+        Rank cached entries against a name, without network calls.
+
+        Exact name or permalink matches score 1.0, prefix matches (of the name
+        or any word in it) 0.9 down to 0.5 by length difference, and the rest
+        their trigram similarity.
+
+        Args:
+            kind: 'industry' or 'location'
+            name: Name, partial name or permalink
+            type: Only entries of this type
+            limit: Maximum results
+            min_score: Minimum trigram similarity for fuzzy matches
+
+        Returns:
+            Entry dicts (permalink, name, type) with a 'score', best first
+        """
+        self._check_kind(kind, type)
+        query = normalize_name(name)
+        if not query:
+            return []
+        index = self._kinds[kind]
+        scores: Dict[int, float] = {}
+
+        def offer(position: int, score: float):
+            if type is None or index.entries[position]['type'] == type:
+                scores[position] = max(score, scores.get(position, 0.0))
+
+        with self._lock:
+            exact = list(index.by_name.get(query, []))
+            if name in index.by_permalink:
+                exact.append(index.by_permalink[name])
+            for position in exact:
+                offer(position, 1.0)
+            for position in index.trie.search(query, limit=limit * 4):
+                extra = len(normalize_name(index.entries[position]['name'])) - len(query)
+                offer(position, max(0.5, 0.9 - 0.01 * max(0, extra)))
+            for score, position in index.ngrams.search(query, limit=limit * 4, min_score=min_score):
+                offer(position, score)
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+            return [dict(index.entries[position], score=round(score, 3)) for position, score in ranked]
+
+    def resolve(self, kind: str, name: str, type: Optional[str] = None, min_score: float = 0.75,
+                allow_network: bool = True) -> Optional[str]:
+        """
+        Resolve a name to its permalink.
+
+        Served from memory when the name (or permalink) is known, when the
+        same name was searched before, or when the best local candidate scores
+        at least min_score. Otherwise, if allowed and a client is set, one
+        search call is made; its results are memoized, added to the catalog
+        and saved, so the next resolve of the name is local.
+
+        Returns:
+            Permalink, or None if nothing matches
+        """
+        self._check_kind(kind, type)
+        memo_key = f"{kind}|{type or ''}|{normalize_name(name)}"
+        candidates = self.lookup(kind, name, type=type, limit=1)
+        with self._lock:
+            memoized = self._queries.get(memo_key)
+        if candidates and candidates[0]['score'] >= 1.0:
+            permalink = candidates[0]['permalink']
+        elif memoized is not None:
+            permalink = memoized[0] if memoized else None
+        elif candidates and candidates[0]['score'] >= min_score:
+            permalink = candidates[0]['permalink']
+        else:
+            if not allow_network or self.client is None:
+                return None
+            return self._search(kind, name, type, memo_key)
+        if self.client is not None:
+            self.client.record_cache_hit('GET', CATALOG_KINDS[kind]['path'], 1)
+        return permalink
+
+    def _search(self, kind: str, name: str, type: Optional[str], memo_key: str) -> Optional[str]:
+        """Fallback search for a name the catalog cannot answer; memoizes and saves the results."""
+        method = getattr(self.client.with_error_mode('raise'), CATALOG_KINDS[kind]['method'])
+        with cache_miss():
+            results = call_with_retry(lambda: method(name=name, type=type),
+                                      shared_limiter(self.client, self.rate_limit), max_retries=self.max_retries)
+        permalinks = [entry['permalink'] for entry in results if entry.get('permalink')]
+        with self._lock:
+            for entry in results:
+                self._kinds[kind].add(entry)
+            self._queries[memo_key] = permalinks
+        self.save()
+        return permalinks[0] if permalinks else None
+
+    def _resolve_all(self, kind: str, names: Iterable[str], type: Optional[str]) -> List[str]:
+        permalinks, missing = [], []
+        for name in names:
+            permalink = self.resolve(kind, name, type=type)
+            if permalink is None:
+                missing.append(name)
+            elif permalink not in permalinks:
+                permalinks.append(permalink)
+        if missing:
+            raise ValueError(f"Unknown {kind} names: {missing}")
+        return permalinks
+
+    def industries(self, names: Iterable[str]) -> List[str]:
+        """Permalinks for the industries= filter (raises ValueError for unknown names)."""
+        return self._resolve_all('industry', names, 'INDUSTRY')
+
+    def super_categories(self, names: Iterable[str]) -> List[str]:
+        """Permalinks for the super_categories= filter (raises ValueError for unknown names)."""
+        return self._resolve_all('industry', names, 'SUPER_CATEGORY')
+
+    def locations(self, names: Iterable[str], type: Optional[str] = None) -> List[str]:
+        """Permalinks for the locations= filter (raises ValueError for unknown names)."""
+        return self._resolve_all('location', names, type)
@@ -3,14 +3,38 @@
 Simplified Fundable API client.
 """
 
+import contextlib
+import copy
+import functools
 import os
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 load_dotenv()
 
+from fundable.decoding import get_json_decoder, decode_response
+from fundable.models import Deal, Company, Investor, Person
+from fundable.transport import TransferStats, accept_encoding_header, endpoint_label
+from fundable.metrics import RequestMetrics, count_records, emit
+from fundable.tracing import Tracer, NOOP_SPAN, request_attributes
+from fundable.pagination import AdaptivePageSizer, Page, page_count
+from fundable.queries import Query, build_companies_body, build_deals_body, build_investors_body
+from fundable.validation import request_error
+from fundable.errors import (
+    ERROR_MODES, ApiResult, FundableError, error_from_exception, error_from_response,
+)
+from fundable.concurrency import DEFAULT_RATE_LIMIT, RateLimiter, call_with_retry, submit_in_context
+
+# Alert IDs accepted per get_alerts call
+ALERT_BATCH_SIZE = 10
+
+# Largest page_size accepted by /company/deals, /investor/deals and /person/deals
+DEAL_HISTORY_PAGE_SIZE = 500
+
 
 def format_usd(amount) -> str:
     """Format a dollar amount with commas. Returns 'Undisclosed' if None or 0."""
@@ -23,13 +47,78 @@ def format_usd(amount) -> str:
     return 'Undisclosed'
 
 
+def api_method(fn):
+    """
+    Mark a public API method. In error_mode='result' its return value (or
+    FundableError) is wrapped in an ApiResult with the response status,
+    meta and timing; in the other modes the method runs unchanged.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if self.error_mode != 'result':
+            return fn(self, *args, **kwargs)
+        local = self._local
+        if getattr(local, 'depth', 0):
+            # Nested call: the outermost method builds the result
+            return fn(self, *args, **kwargs)
+
+        local.depth, local.status, local.meta = 1, None, None
+        started = time.perf_counter()
+        data, error = None, None
+        try:
+            data = fn(self, *args, **kwargs)
+        except FundableError as e:
+            error = e
+        finally:
+            local.depth = 0
+        return ApiResult(
+            data=data,
+            error=error,
+            status=local.status or (error.status if error else None),
+            meta=local.meta,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+    return wrapper
+
+
 class FundableClient:
     """Simple client for fetching deals from Fundable API."""
 
     DEFAULT_BASE_URL = "https://www.tryfundable.ai/api/v1"
 
-    def __init__(self, api_key: str = None, base_url: str = None):
-        """Initialize client with API key and base URL."""
+    def __init__(self, api_key: str = None, base_url: str = None,
+                 json_decoder: Union[str, Callable[[bytes], Any]] = None,
+                 hooks: List[Callable[[RequestMetrics], Any]] = None,
+                 tracer: Tracer = None,
+                 error_mode: str = 'print',
+                 validate: bool = True,
+                 page_sizer: AdaptivePageSizer = None,
+                 rate_limiter: RateLimiter = None):
+        """
+        Initialize client with API key and base URL.
+
+        Args:
+            api_key: Fundable API key (defaults to FUNDABLE_API_KEY)
+            base_url: API base URL (defaults to FUNDABLE_API_URL or production)
+            json_decoder: 'orjson', 'msgspec', 'json', or a callable taking bytes.
+                Defaults to the fastest installed backend.
+            hooks: Callables receiving a fundable.metrics.RequestMetrics after each
+                API call (e.g. PrometheusMetrics(), LoggingHook())
+            tracer: fundable.tracing.Tracer; when set, every API call is recorded as a span
+            error_mode: How failures surface (see fundable.errors):
+                'print' (default) prints and returns an empty value,
+                'raise' raises typed FundableError subclasses,
+                'result' returns an ApiResult with data, meta, timings or the error
+            validate: Check get_deals / get_companies / get_investors / search_people /
+                get_alerts requests against the OpenAPI enums and limits before
+                sending (see fundable.validation); invalid requests fail like a 400
+                without a network call
+            page_sizer: fundable.pagination.AdaptivePageSizer; it is registered as a
+                hook and chooses the page sizes of iter_query() scans
+            rate_limiter: fundable.concurrency.RateLimiter shared by every concurrent
+                helper of this client that is not given its own (default: one
+                created on first use, at the API's 200 requests/minute)
+        """
         self.api_key = api_key or os.getenv("FUNDABLE_API_KEY")
         if not self.api_key:
             raise ValueError("API key required. Set FUNDABLE_API_KEY environment variable or pass api_key parameter.")
@@ -37,19 +126,212 @@ class FundableClient:
         self.base_url = base_url or os.getenv("FUNDABLE_API_URL", self.DEFAULT_BASE_URL)
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": accept_encoding_header()
         }
 
-    def _post(self, path: str, body: Dict[str, Any]) -> Any:
-        """Make a POST request with a JSON body, returning the parsed response."""
-        return requests.post(
-            f"{self.base_url}{path}",
-            headers=self.headers,
-            json=body,
-            timeout=30
-        )
+        # One pooled session: keep-alive connections and TLS sessions are reused across calls
+        self.session = requests.Session()
+        self.transfer_stats = TransferStats()
+
+        decoder = get_json_decoder(json_decoder)
+        self.json_decoder = decoder['name']
+        self._json_loads = decoder['loads']
+
+        self.hooks = list(hooks or [])
+        self.tracer = tracer
+        self.page_sizer = page_sizer
+        if page_sizer is not None and page_sizer not in self.hooks:
+            self.hooks.append(page_sizer)
+
+        if error_mode not in ERROR_MODES:
+            raise ValueError(f"error_mode must be one of: {ERROR_MODES}")
+        self.error_mode = error_mode
+        self.validate = validate
+        # Per-thread status/meta of the current call, for error_mode='result'
+        self._local = threading.local()
+        # One slot and lock, shared with with_error_mode() copies, so the
+        # lazily created limiter is the same object for all of them
+        self._rate_limiter = [rate_limiter]
+        self._rate_limiter_lock = threading.Lock()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Client-wide RateLimiter used by the concurrent helpers unless they are given their own."""
+        if self._rate_limiter[0] is None:
+            with self._rate_limiter_lock:
+                if self._rate_limiter[0] is None:
+                    self._rate_limiter[0] = RateLimiter(DEFAULT_RATE_LIMIT)
+        return self._rate_limiter[0]
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: RateLimiter):
+        self._rate_limiter[0] = limiter
+
+    def add_hook(self, hook: Callable[[RequestMetrics], Any]):
+        """Register a callable that receives a RequestMetrics after each API call."""
+        self.hooks.append(hook)
+
+    def record_cache_hit(self, method: str, path: str, records: int = None):
+        """
+        Report a lookup a caching layer answered without calling `method path`.
+
+        The hooks receive a RequestMetrics with cache='hit', no status and
+        `records` cached records served.
+        """
+        if not self.hooks:
+            return
+        metrics = RequestMetrics(method, endpoint_label(path), path)
+        metrics.cache = 'hit'
+        metrics.records = records
+        metrics.finish()
+        emit(self.hooks, metrics)
+
+    def with_error_mode(self, error_mode: str) -> 'FundableClient':
+        """Return a copy sharing this client's session, hooks and tracer, with another error_mode."""
+        if error_mode not in ERROR_MODES:
+            raise ValueError(f"error_mode must be one of: {ERROR_MODES}")
+        clone = copy.copy(self)
+        clone.error_mode = error_mode
+        clone._local = threading.local()
+        return clone
+
+    def span(self, name: str, **attributes):
+        """
+        Context manager opening a tracing span that parents the API calls made inside it.
+
+        Yields a no-op span when the client has no tracer, so helpers can always use it.
+        """
+        if self.tracer is None:
+            return contextlib.nullcontext(NOOP_SPAN)
+        return self.tracer.span(name, **attributes)
+
+    def _request(self, method: str, path: str, params: Dict[str, Any] = None,
+                 body: Dict[str, Any] = None, data: bytes = None) -> requests.Response:
+        """
+        Send a request to the API. All client methods go through here.
+
+        data is an already-encoded JSON body (from a fundable.queries.Query);
+        body is then only used for tracing attributes.
+        """
+        instrumented = self.hooks or self.tracer is not None
+        metrics = RequestMetrics(method, endpoint_label(path), path) if instrumented else None
+        span = None
+        if self.tracer is not None:
+            span = self.tracer.start_span(f"{method} {metrics.endpoint}", dict(
+                request_attributes(params, body), **{'http.method': method, 'fundable.endpoint': metrics.endpoint}))
+        try:
+            response = self.session.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self.headers,
+                params=params,
+                json=body if data is None else None,
+                data=data,
+                timeout=30
+            )
+        except requests.exceptions.RequestException as e:
+            if metrics is not None:
+                metrics.error = str(e)
+                self._finish_call(metrics, span)
+            if self.error_mode != 'print':
+                raise error_from_exception(e, path) from e
+            raise
+        transfer = self.transfer_stats.record(path, response)
+        response.fundable_path = path
+
+        if metrics is not None:
+            metrics.status = response.status_code
+            metrics.ttfb_ms = response.elapsed.total_seconds() * 1000
+            metrics.request_bytes = len(response.request.body or b'')
+            metrics.response_bytes = transfer['wire_bytes']
+            metrics.decoded_bytes = transfer['decoded_bytes']
+            # Finished by _decode(), once the record count is known
+            response.fundable_metrics = metrics
+            response.fundable_span = span
+        return response
+
+    def _finish_call(self, metrics: RequestMetrics, span=None):
+        """Complete an instrumented call: end its span and hand the metrics to the hooks."""
+        metrics.finish()
+        if span is not None:
+            span.set_attributes({
+                'http.status_code': metrics.status,
+                'http.response.body.size': metrics.response_bytes,
+                'fundable.records': metrics.records,
+            })
+            span.set_status('ERROR' if metrics.error or not metrics.ok else 'OK', metrics.error)
+            span.end()
+        emit(self.hooks, metrics)
+
+    def _post(self, path: str, body: Dict[str, Any], data: bytes = None) -> requests.Response:
+        """Make a POST request with a JSON body (or pre-encoded body bytes)."""
+        return self._request('POST', path, body=body, data=data)
+
+    def _get(self, path: str, params: Dict[str, Any] = None) -> requests.Response:
+        """Make a GET request with optional query parameters."""
+        return self._request('GET', path, params=params)
+
+    def _rejected(self, endpoint: str, payload: Dict[str, Any], action: str) -> bool:
+        """
+        Validate a request locally before sending it. Returns True if it is
+        invalid (after printing the problems); raises ValidationError instead
+        in the 'raise' and 'result' error modes.
+        """
+        if not self.validate:
+            return False
+        error = request_error(endpoint, payload)
+        if error is None:
+            return False
+        if self.error_mode != 'print':
+            raise error
+        print(f"Error {action}: {error}")
+        return True
+
+    def _decode(self, response: requests.Response) -> Any:
+        """
+        Parse a JSON response body with the configured decoder.
 
-    def get_investor(self, identifier: str, identifier_type: str = 'id') -> Optional[Dict[str, Any]]:
+        In the 'raise' and 'result' error modes, non-2xx responses and
+        undecodable bodies raise the matching FundableError here.
+        """
+        metrics = getattr(response, 'fundable_metrics', None)
+        strict = self.error_mode != 'print'
+        capture = strict or getattr(self._local, 'capture_meta', False)
+        if metrics is None and not capture:
+            return decode_response(response, self._json_loads)
+
+        endpoint = getattr(response, 'fundable_path', None)
+        try:
+            try:
+                data = decode_response(response, self._json_loads)
+            except requests.exceptions.RequestException as e:
+                if metrics is not None:
+                    metrics.error = str(e)
+                if not strict:
+                    raise
+                if not response.ok:
+                    raise error_from_response(response, None, endpoint) from e
+                raise error_from_exception(e, endpoint) from e
+
+            if metrics is not None:
+                metrics.records = count_records(data)
+                if not response.ok and isinstance(data, dict):
+                    error = data.get('error')
+                    metrics.error = (error.get('message') if isinstance(error, dict) else None) or response.reason
+            if capture:
+                self._local.status = response.status_code
+                self._local.meta = data.get('meta') if isinstance(data, dict) and response.ok else None
+            if strict and not response.ok:
+                raise error_from_response(response, data, endpoint)
+            return data
+        finally:
+            if metrics is not None:
+                self._finish_call(metrics, getattr(response, 'fundable_span', None))
+
+    @api_method
+    def get_investor(self, identifier: str, identifier_type: str = 'id',
+                     model: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get detailed investor information by ID, permalink, domain, LinkedIn, or Crunchbase.
 
@@ -57,6 +339,7 @@ class FundableClient:
             identifier: Investor UUID, permalink, domain, LinkedIn slug, or Crunchbase slug
             identifier_type: One of 'id', 'permalink', 'domain', 'linkedin', 'crunchbase', 'url'.
                 Defaults to 'id'.
+            model: Return a fundable.models.Investor record instead of a dict
 
         Returns:
             Investor details dict or None if not found
@@ -68,13 +351,8 @@ class FundableClient:
         params = {identifier_type: identifier}
 
         try:
-            response = requests.get(
-                f"{self.base_url}/investor",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/investor', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -82,30 +360,29 @@ class FundableClient:
                 return None
 
             if data.get("success"):
-                return data["data"]["investor"]
+                investor = data["data"]["investor"]
+                return Investor.from_dict(investor) if model else investor
             return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching investor {identifier}: {e}")
             return None
 
-    def get_deal(self, deal_id: str) -> Optional[Dict[str, Any]]:
+    @api_method
+    def get_deal(self, deal_id: str, model: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get detailed deal information by ID.
 
         Args:
             deal_id: Deal UUID
+            model: Return a fundable.models.Deal record instead of a dict
 
         Returns:
             Deal details dict or None if not found
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/deals/{deal_id}",
-                headers=self.headers,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get(f"/deals/{deal_id}")
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -113,13 +390,15 @@ class FundableClient:
                 return None
 
             if data.get("success"):
-                return data["data"]["deal"]
+                deal = data["data"]["deal"]
+                return Deal.from_dict(deal) if model else deal
             return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching deal {deal_id}: {e}")
             return None
 
+    @api_method
     def get_deal_investors(self, deal_id: str) -> List[Dict[str, Any]]:
         """
         Get full investor details for a specific deal.
@@ -131,12 +410,8 @@ class FundableClient:
             List of DealInvestor dicts with name, lead_investor, domain, linkedin, crunchbase, etc.
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/deals/{deal_id}/investors",
-                headers=self.headers,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get(f"/deals/{deal_id}/investors")
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -151,6 +426,7 @@ class FundableClient:
             print(f"Error fetching investors for deal {deal_id}: {e}")
             return []
 
+    @api_method
     def get_deals(self,
                   # Pagination
                   page: int = None,
@@ -180,84 +456,32 @@ class FundableClient:
                   # Legacy support
                   start_date: str = None,
                   end_date: str = None,
+                  # Return fundable.models.Deal records instead of dicts
+                  model: bool = False,
                   **kwargs) -> List[Dict[str, Any]]:
         """
         Get deals with any combination of filters. Sends a POST request with a JSON body.
 
         All parameters are optional. Date strings should be in YYYY-MM-DD format.
+        Pass model=True to receive compact fundable.models.Deal records.
         """
-        # Handle legacy parameters
-        if start_date and not deal_start_date:
-            deal_start_date = start_date
-        if end_date and not deal_end_date:
-            deal_end_date = end_date
-
-        # No implicit date window: send exactly the filters the caller specified.
-        # A date-less query is valid — the API returns most-recent deals, bounded by
-        # page_size and sort_by (default 'most_recent_deal').
-
-        # Build nested JSON body
-        body = {}
-
-        # Identifiers section
-        identifiers = {}
-        if deal_ids:
-            identifiers['deal_ids'] = deal_ids
-        if identifiers:
-            body['identifiers'] = identifiers
-
-        # Deal section
-        deal_filters = {}
-        if financing_types:
-            deal_filters['financing_types'] = financing_types
-        if deal_size_min is not None:
-            deal_filters['size_min'] = deal_size_min
-        if deal_size_max is not None:
-            deal_filters['size_max'] = deal_size_max
-        if deal_start_date:
-            deal_filters['date_start'] = deal_start_date
-        if deal_end_date:
-            deal_filters['date_end'] = deal_end_date
-        if deal_filters:
-            body['deal'] = deal_filters
-
-        # Company section
-        company_filters = {}
-        if locations:
-            company_filters['locations'] = locations
-        if industries:
-            company_filters['industries'] = industries
-        if super_categories:
-            company_filters['super_categories'] = super_categories
-        if employee_count:
-            company_filters['employee_count'] = employee_count
-        if ipo_status:
-            company_filters['ipo_status'] = ipo_status
-        if total_raised_min is not None:
-            company_filters['total_raised_min'] = total_raised_min
-        if total_raised_max is not None:
-            company_filters['total_raised_max'] = total_raised_max
-        if company_ids:
-            company_filters['company_ids'] = company_ids
-        if company_filters:
-            body['company'] = company_filters
-
-        # Investors section
-        investors_filter = {}
-        if investor_ids:
-            investors_filter['investor_ids'] = investor_ids
-        if investors_filter:
-            body['investors'] = investors_filter
-
-        # Pagination and sorting
-        body['page_size'] = page_size if page_size is not None else 100
+        body = build_deals_body(
+            page_size=page_size, sort_by=sort_by,
+            deal_start_date=deal_start_date, deal_end_date=deal_end_date,
+            company_ids=company_ids, industries=industries, super_categories=super_categories,
+            locations=locations, employee_count=employee_count, ipo_status=ipo_status,
+            total_raised_min=total_raised_min, total_raised_max=total_raised_max,
+            financing_types=financing_types, deal_size_min=deal_size_min, deal_size_max=deal_size_max,
+            investor_ids=investor_ids, deal_ids=deal_ids, start_date=start_date, end_date=end_date,
+        )
         if page is not None:
             body['page'] = page
-        body['sort_by'] = sort_by if sort_by else 'most_recent_deal'
+        if self._rejected('POST /deals', body, 'fetching deals'):
+            return []
 
         try:
             response = self._post('/deals', body)
-            data = response.json()
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -265,7 +489,8 @@ class FundableClient:
                 return []
 
             if data.get("success"):
-                return data["data"]["deals"]
+                deals = data["data"]["deals"]
+                return Deal.from_list(deals) if model else deals
             else:
                 return []
 
@@ -273,6 +498,7 @@ class FundableClient:
             print(f"Error fetching deals: {e}")
             return []
 
+    @api_method
     def get_companies(self,
                       # Pagination
                       page: int = None,
@@ -309,11 +535,14 @@ class FundableClient:
                       domains: List[str] = None,
                       linkedins: List[str] = None,
                       crunchbases: List[str] = None,
+                      # Return fundable.models.Company records instead of dicts
+                      model: bool = False,
                       **kwargs) -> List[Dict[str, Any]]:
         """
         Get companies with any combination of filters. Sends a POST request with a JSON body.
 
         All parameters are optional. Date strings should be in YYYY-MM-DD format.
+        Pass model=True to receive compact fundable.models.Company records.
 
         Investor scoping:
         - `investor_ids` filters by firms participating in the company's *latest* round
@@ -323,99 +552,25 @@ class FundableClient:
         - `any_round_investor_ids` filters by firm UUIDs across any round
           (lands under `investors.investor_ids`).
         """
-        has_batch_filter = domains or linkedins or crunchbases or company_ids
-        # Free-form thesis search and per-person portfolio lookups should not be silently
-        # narrowed to a 1-day window — treat them like batch lookups for date defaulting.
-        skip_date_default = has_batch_filter or search_query or people_ids or any_round_investor_ids
-
-        # Set date defaults if not provided (skip for batch lookups / thesis searches)
-        if not skip_date_default:
-            if not deal_end_date:
-                deal_end_date = datetime.utcnow().strftime("%Y-%m-%d")
-            if not deal_start_date:
-                deal_start_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
-
-        # Build nested JSON body
-        body = {}
-
-        # Identifiers section
-        identifiers = {}
-        if company_ids:
-            identifiers['ids'] = company_ids
-        if domains:
-            identifiers['domains'] = domains
-        if linkedins:
-            identifiers['linkedin_urls'] = linkedins
-        if crunchbases:
-            identifiers['crunchbase_urls'] = crunchbases
-        if identifiers:
-            body['identifiers'] = identifiers
-
-        # Company section
-        company_filters = {}
-        if search_query:
-            company_filters['search_query'] = search_query
-        if min_relevance is not None:
-            company_filters['min_relevance'] = min_relevance
-        if locations:
-            company_filters['locations'] = locations
-        if industries:
-            company_filters['industries'] = industries
-        if super_categories:
-            company_filters['super_categories'] = super_categories
-        if employee_count:
-            company_filters['employee_count'] = employee_count
-        if ipo_status:
-            company_filters['ipo_status'] = ipo_status
-        if total_raised_min is not None:
-            company_filters['total_raised_min'] = total_raised_min
-        if total_raised_max is not None:
-            company_filters['total_raised_max'] = total_raised_max
-        if company_founded_start:
-            company_filters['founded_start'] = company_founded_start
-        if company_founded_end:
-            company_filters['founded_end'] = company_founded_end
-        if company_filters:
-            body['company'] = company_filters
-
-        # Latest deal section
-        latest_deal_filters = {}
-        if financing_types:
-            latest_deal_filters['financing_types'] = financing_types
-        if deal_size_min is not None:
-            latest_deal_filters['size_min'] = deal_size_min
-        if deal_size_max is not None:
-            latest_deal_filters['size_max'] = deal_size_max
-        if deal_start_date:
-            latest_deal_filters['date_start'] = deal_start_date
-        if deal_end_date:
-            latest_deal_filters['date_end'] = deal_end_date
-        if investor_ids:
-            latest_deal_filters['investor_ids'] = investor_ids
-        if latest_deal_filters:
-            body['latest_deal'] = latest_deal_filters
-
-        # Investors section (any-round scope)
-        investors_block = {}
-        if people_ids:
-            investors_block['people_ids'] = people_ids
-        if any_round_investor_ids:
-            investors_block['investor_ids'] = any_round_investor_ids
-        if investors_block:
-            body['investors'] = investors_block
-
-        # Pagination and sorting
-        body['page_size'] = page_size if page_size is not None else 100
+        body = build_companies_body(
+            page_size=page_size, sort_by=sort_by, search_query=search_query, min_relevance=min_relevance,
+            deal_start_date=deal_start_date, deal_end_date=deal_end_date,
+            company_founded_start=company_founded_start, company_founded_end=company_founded_end,
+            company_ids=company_ids, industries=industries, super_categories=super_categories,
+            locations=locations, employee_count=employee_count, ipo_status=ipo_status,
+            total_raised_min=total_raised_min, total_raised_max=total_raised_max,
+            financing_types=financing_types, deal_size_min=deal_size_min, deal_size_max=deal_size_max,
+            investor_ids=investor_ids, people_ids=people_ids, any_round_investor_ids=any_round_investor_ids,
+            domains=domains, linkedins=linkedins, crunchbases=crunchbases,
+        )
         if page is not None:
             body['page'] = page
-        if sort_by:
-            body['sort_by'] = sort_by
-        elif not has_batch_filter:
-            body['sort_by'] = 'most_recent_raise'
+        if self._rejected('POST /companies', body, 'fetching companies'):
+            return []
 
         try:
             response = self._post('/companies', body)
-            data = response.json()
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -423,7 +578,8 @@ class FundableClient:
                 return []
 
             if data.get("success"):
-                return data["data"]["companies"]
+                companies = data["data"]["companies"]
+                return Company.from_list(companies) if model else companies
             else:
                 return []
 
@@ -431,6 +587,7 @@ class FundableClient:
             print(f"Error fetching companies: {e}")
             return []
 
+    @api_method
     def get_investors(self,
                       # Pagination
                       page: int = None,
@@ -461,6 +618,8 @@ class FundableClient:
                       # Portfolio filters - thresholds
                       min_matching_deals: int = None,
                       only_lead_deals: bool = None,
+                      # Return fundable.models.Investor records instead of dicts
+                      model: bool = False,
                       **kwargs) -> List[Dict[str, Any]]:
         """
         Get investors with any combination of filters. Sends a POST request with a JSON body.
@@ -470,77 +629,27 @@ class FundableClient:
         - Portfolio Filters (company_investments): filter by the companies they've invested in
 
         All parameters are optional. Date strings should be in YYYY-MM-DD format.
+        Pass model=True to receive compact fundable.models.Investor records.
         """
-        has_batch_filter = investor_domains or investor_linkedins or investor_crunchbases
-
-        # Build nested JSON body
-        body = {}
-
-        # Identifiers section (investor batch lookup)
-        identifiers = {}
-        if investor_ids:
-            identifiers['ids'] = investor_ids
-        if investor_domains:
-            identifiers['domains'] = investor_domains
-        if investor_linkedins:
-            identifiers['linkedin_urls'] = investor_linkedins
-        if investor_crunchbases:
-            identifiers['crunchbase_urls'] = investor_crunchbases
-        if identifiers:
-            body['identifiers'] = identifiers
-
-        # Investor section
-        investor_filters = {}
-        if investor_locations:
-            investor_filters['locations'] = investor_locations
-        if investor_employee_count:
-            investor_filters['employee_count'] = investor_employee_count
-        if investor_filters:
-            body['investor'] = investor_filters
-
-        # Company investments section (portfolio filters)
-        portfolio_filters = {}
-        if deal_size_min is not None:
-            portfolio_filters['deal_size_min'] = deal_size_min
-        if deal_size_max is not None:
-            portfolio_filters['deal_size_max'] = deal_size_max
-        if deal_start_date:
-            portfolio_filters['deal_start_date'] = deal_start_date
-        if deal_end_date:
-            portfolio_filters['deal_end_date'] = deal_end_date
-        if financing_types:
-            portfolio_filters['financing_types'] = financing_types
-        if locations:
-            portfolio_filters['locations'] = locations
-        if industries:
-            portfolio_filters['industries'] = industries
-        if super_categories:
-            portfolio_filters['super_categories'] = super_categories
-        if employee_count:
-            portfolio_filters['employee_count'] = employee_count
-        if ipo_status:
-            portfolio_filters['ipo_status'] = ipo_status
-        if company_ids:
-            portfolio_filters['company_ids'] = company_ids
-        if min_matching_deals is not None:
-            portfolio_filters['min_matching_deals'] = min_matching_deals
-        if only_lead_deals is not None:
-            portfolio_filters['only_lead_deals'] = only_lead_deals
-        if portfolio_filters:
-            body['company_investments'] = portfolio_filters
-
-        # Pagination and sorting
-        body['page_size'] = page_size if page_size is not None else 100
+        body = build_investors_body(
+            page_size=page_size, sort_by=sort_by,
+            investor_locations=investor_locations, investor_employee_count=investor_employee_count,
+            investor_domains=investor_domains, investor_linkedins=investor_linkedins,
+            investor_crunchbases=investor_crunchbases, investor_ids=investor_ids,
+            industries=industries, super_categories=super_categories, locations=locations,
+            employee_count=employee_count, ipo_status=ipo_status,
+            deal_size_min=deal_size_min, deal_size_max=deal_size_max,
+            deal_start_date=deal_start_date, deal_end_date=deal_end_date, financing_types=financing_types,
+            company_ids=company_ids, min_matching_deals=min_matching_deals, only_lead_deals=only_lead_deals,
+        )
         if page is not None:
             body['page'] = page
-        if sort_by:
-            body['sort_by'] = sort_by
-        elif not has_batch_filter:
-            body['sort_by'] = 'most_recent_deal'
+        if self._rejected('POST /investors', body, 'fetching investors'):
+            return []
 
         try:
             response = self._post('/investors', body)
-            data = response.json()
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -548,7 +657,8 @@ class FundableClient:
                 return []
 
             if data.get("success"):
-                return data["data"]["investors"]
+                investors = data["data"]["investors"]
+                return Investor.from_list(investors) if model else investors
             else:
                 return []
 
@@ -556,6 +666,43 @@ class FundableClient:
             print(f"Error fetching investors: {e}")
             return []
 
+    @api_method
+    def run_query(self, query: Query, page: int = None, model: bool = False) -> List[Any]:
+        """
+        Fetch one page of a precompiled query (fundable.queries.DealQuery,
+        CompanyQuery or InvestorQuery).
+
+        Returns the same records as the matching get_* call with the same
+        filters, but the body is not rebuilt or re-encoded; only the page
+        number is patched in.
+
+        Args:
+            query: Query built once and reused across pages
+            page: Page number (0-based; None lets the API default to 0)
+            model: Return fundable.models records instead of dicts
+        """
+        label = query.records_key
+        # The parsed body is only needed for span attributes
+        body = dict(query.body, page=page) if self.tracer is not None else None
+        try:
+            response = self._post(query.path, body, data=query.encode(page))
+            data = self._decode(response)
+
+            if not response.ok:
+                error_msg = data.get('error', {}).get('message', response.reason)
+                print(f"Error fetching {label}: {error_msg}")
+                return []
+
+            if data.get("success"):
+                records = data["data"][query.records_key]
+                return query.record_type.from_list(records) if model else records
+            return []
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching {label}: {e}")
+            return []
+
+    @api_method
     def get_alerts(self, alert_ids: List[str], start_date: str, end_date: str) -> Dict[str, Any]:
         """
         Get alert data with deals for specified alert IDs and date range.
@@ -568,6 +715,10 @@ class FundableClient:
         Returns:
             Dict with 'alerts' array containing alert data and deals
         """
+        if self._rejected('GET /alerts', {'alert_ids': list(alert_ids), 'start_date': start_date,
+                                          'end_date': end_date}, 'fetching alerts'):
+            return {"alerts": [], "total_count": 0}
+
         params = {
             'alert_ids': ','.join(alert_ids),
             'start_date': start_date,
@@ -575,13 +726,8 @@ class FundableClient:
         }
 
         try:
-            response = requests.get(
-                f"{self.base_url}/alerts/",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/alerts/', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -596,6 +742,61 @@ class FundableClient:
             print(f"Error fetching alerts: {e}")
             return {"alerts": [], "total_count": 0}
 
+    @api_method
+    def get_alerts_bulk(self, alert_ids: List[str], start_date: str, end_date: str,
+                        concurrency: int = 4, rate_limiter: RateLimiter = None,
+                        max_retries: int = 3) -> Dict[str, Any]:
+        """
+        Get alert data for any number of alert IDs.
+
+        The IDs are split into chunks of ALERT_BATCH_SIZE (the API limit of 10)
+        and the chunks are fetched in parallel, retrying rate limits and
+        server errors. A failing chunk does not fail the others.
+
+        Args:
+            alert_ids: List of alert UUIDs (any number)
+            start_date: Start date in ISO 8601 format (e.g., "2024-01-01T00:00:00.000Z")
+            end_date: End date in ISO 8601 format (e.g., "2024-12-31T23:59:59.999Z")
+            concurrency: Chunks fetched at once
+            rate_limiter: fundable.concurrency.RateLimiter to use instead of the
+                client's shared rate_limiter
+            max_retries: Retries per chunk for 429 / 5xx / transport errors
+
+        Returns:
+            Dict with 'alerts' (merged, in chunk order), 'total_count' (deals
+            across all chunks) and 'errors': one {'alert_ids', 'error'} dict
+            per chunk that still failed after retries
+        """
+        strict = self.with_error_mode('raise')
+        limiter = rate_limiter or self.rate_limiter
+        chunks = [alert_ids[i:i + ALERT_BATCH_SIZE] for i in range(0, len(alert_ids), ALERT_BATCH_SIZE)]
+
+        def fetch(chunk: List[str]):
+            alerts = call_with_retry(lambda: strict.get_alerts(chunk, start_date, end_date),
+                                     limiter, max_retries=max_retries)
+            return alerts, strict._local.meta or {}
+
+        merged = {"alerts": [], "total_count": 0, "errors": []}
+        with self.span('get_alerts_bulk', alerts=len(alert_ids), chunks=len(chunks)), \
+                ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = [submit_in_context(executor, fetch, chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    data, meta = future.result()
+                except FundableError as e:
+                    if self.error_mode == 'print':
+                        print(f"Error fetching alerts {', '.join(chunk)}: {e}")
+                    merged["errors"].append({"alert_ids": chunk, "error": e})
+                    continue
+                alerts = data.get("alerts", [])
+                merged["alerts"].extend(alerts)
+                total = meta.get("total_count")
+                if total is None:
+                    total = sum(alert.get("totalDealCount") or 0 for alert in alerts)
+                merged["total_count"] += total
+        return merged
+
+    @api_method
     def get_alert_configurations(self) -> List[Dict[str, Any]]:
         """
         Get all alert configurations for the authenticated user.
@@ -604,12 +805,8 @@ class FundableClient:
             List of alert configuration dicts
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/alerts/configurations",
-                headers=self.headers,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/alerts/configurations')
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -624,13 +821,16 @@ class FundableClient:
             print(f"Error fetching alert configurations: {e}")
             return []
 
-    def get_company(self, identifier: str, identifier_type: str = 'id') -> Optional[Dict[str, Any]]:
+    @api_method
+    def get_company(self, identifier: str, identifier_type: str = 'id',
+                    model: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get company details by various identifier types.
 
         Args:
             identifier: The company identifier value
             identifier_type: One of 'id', 'permalink', 'domain', 'url', 'linkedin', 'crunchbase'
+            model: Return a fundable.models.Company record instead of a dict
 
         Returns:
             Company details dict or None if not found
@@ -642,13 +842,8 @@ class FundableClient:
         params = {identifier_type: identifier}
 
         try:
-            response = requests.get(
-                f"{self.base_url}/company",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/company', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -656,13 +851,15 @@ class FundableClient:
                 return None
 
             if data.get("success"):
-                return data["data"]["company"]
+                company = data["data"]["company"]
+                return Company.from_dict(company) if model else company
             return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching company {identifier}: {e}")
             return None
 
+    @api_method
     def get_company_deals(self, id: str = None, domain: str = None,
                           linkedin: str = None, crunchbase: str = None,
                           page: int = None, page_size: int = None) -> Dict[str, Any]:
@@ -677,7 +874,7 @@ class FundableClient:
             linkedin: LinkedIn company URL (e.g., "https://linkedin.com/company/stripe")
             crunchbase: Crunchbase organization URL (e.g., "https://crunchbase.com/organization/stripe")
             page: Page number (0-based)
-            page_size: Results per page (1-100, default 10)
+            page_size: Results per page (1-500, default 10)
 
         Returns:
             Dict with 'deals' list and 'meta' dict (total_count, page, page_size)
@@ -694,13 +891,8 @@ class FundableClient:
             params['page_size'] = page_size
 
         try:
-            response = requests.get(
-                f"{self.base_url}/company/deals",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/company/deals', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -715,6 +907,7 @@ class FundableClient:
             print(f"Error fetching company deals: {e}")
             return {"deals": [], "meta": {"total_count": 0}}
 
+    @api_method
     def search_companies(self, name: str = None, domain: str = None,
                          linkedin: str = None, crunchbase: str = None) -> List[Dict[str, Any]]:
         """
@@ -737,13 +930,8 @@ class FundableClient:
             raise ValueError("Exactly one of name, domain, linkedin, or crunchbase must be provided")
 
         try:
-            response = requests.get(
-                f"{self.base_url}/company/search",
-                headers=self.headers,
-                params=provided,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/company/search', provided)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -758,6 +946,7 @@ class FundableClient:
             print(f"Error searching companies: {e}")
             return []
 
+    @api_method
     def get_investor_deals(self, domain: str = None, linkedin: str = None,
                            crunchbase: str = None, page: int = None,
                            page_size: int = None) -> Dict[str, Any]:
@@ -771,7 +960,7 @@ class FundableClient:
             linkedin: LinkedIn company URL (e.g., "https://linkedin.com/company/sequoia-capital")
             crunchbase: Crunchbase organization URL (e.g., "https://crunchbase.com/organization/sequoia-capital")
             page: Page number (0-based)
-            page_size: Results per page (1-100, default 10)
+            page_size: Results per page (1-500, default 10)
 
         Returns:
             Dict with 'deals' list and 'meta' dict (total_count, page, page_size)
@@ -788,13 +977,8 @@ class FundableClient:
             params['page_size'] = page_size
 
         try:
-            response = requests.get(
-                f"{self.base_url}/investor/deals",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/investor/deals', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -809,6 +993,7 @@ class FundableClient:
             print(f"Error fetching investor deals: {e}")
             return {"deals": [], "meta": {"total_count": 0}}
 
+    @api_method
     def search_investors(self, name: str = None, domain: str = None,
                          linkedin: str = None, crunchbase: str = None) -> List[Dict[str, Any]]:
         """
@@ -831,13 +1016,8 @@ class FundableClient:
             raise ValueError("Exactly one of name, domain, linkedin, or crunchbase must be provided")
 
         try:
-            response = requests.get(
-                f"{self.base_url}/investor/search",
-                headers=self.headers,
-                params=provided,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/investor/search', provided)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -852,6 +1032,7 @@ class FundableClient:
             print(f"Error searching investors: {e}")
             return []
 
+    @api_method
     def search_industries(self, name: str, type: str = None) -> List[Dict[str, Any]]:
         """
         Search industries and super categories by name with fuzzy matching.
@@ -873,13 +1054,8 @@ class FundableClient:
             params['type'] = type
 
         try:
-            response = requests.get(
-                f"{self.base_url}/industry/search",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/industry/search', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -894,6 +1070,7 @@ class FundableClient:
             print(f"Error searching industries: {e}")
             return []
 
+    @api_method
     def search_locations(self, name: str, type: str = None) -> List[Dict[str, Any]]:
         """
         Search locations by name with fuzzy matching.
@@ -915,13 +1092,8 @@ class FundableClient:
             params['type'] = type
 
         try:
-            response = requests.get(
-                f"{self.base_url}/location/search",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/location/search', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -950,6 +1122,7 @@ class FundableClient:
             return 'twitter'
         raise ValueError(f"Could not auto-detect identifier type for {identifier!r}. Pass identifier_type explicitly.")
 
+    @api_method
     def search_people(self,
                       person_type: str = None,
                       identifiers: Dict[str, Any] = None,
@@ -958,7 +1131,8 @@ class FundableClient:
                       investor: Dict[str, Any] = None,
                       page: int = None,
                       page_size: int = None,
-                      sort_by: str = None) -> List[Dict[str, Any]]:
+                      sort_by: str = None,
+                      model: bool = False) -> List[Dict[str, Any]]:
         """
         Search people via POST /people with cross-type filters.
 
@@ -974,6 +1148,7 @@ class FundableClient:
             company: current-employer filters (incl. nested `latest_deal`)
             investor: investor-firm + deal-activity filters (incl. nested `deals`)
             page, page_size, sort_by: pagination + sort
+            model: Return fundable.models.Person records instead of dicts
 
         Returns:
             List of person result dicts (data.people).
@@ -995,10 +1170,12 @@ class FundableClient:
             body['page_size'] = page_size
         if sort_by:
             body['sort_by'] = sort_by
+        if self._rejected('POST /people', body, 'searching people'):
+            return []
 
         try:
             response = self._post('/people', body)
-            data = response.json()
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -1006,14 +1183,17 @@ class FundableClient:
                 return []
 
             if data.get("success"):
-                return data["data"]["people"]
+                people = data["data"]["people"]
+                return Person.from_list(people) if model else people
             return []
 
         except requests.exceptions.RequestException as e:
             print(f"Error searching people: {e}")
             return []
 
-    def get_person(self, identifier: str, identifier_type: str = None) -> Optional[Dict[str, Any]]:
+    @api_method
+    def get_person(self, identifier: str, identifier_type: str = None,
+                   model: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get full person detail via GET /person.
 
@@ -1021,6 +1201,7 @@ class FundableClient:
             identifier: Person UUID or LinkedIn / Crunchbase / Twitter URL
             identifier_type: One of 'id', 'linkedin', 'crunchbase', 'twitter'.
                 If None, auto-detects from `identifier`.
+            model: Return a fundable.models.Person record instead of a dict
 
         Returns:
             Person detail dict or None if not found.
@@ -1033,13 +1214,8 @@ class FundableClient:
             raise ValueError(f"identifier_type must be one of: {valid_types}")
 
         try:
-            response = requests.get(
-                f"{self.base_url}/person",
-                headers=self.headers,
-                params={identifier_type: identifier},
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/person', {identifier_type: identifier})
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -1047,13 +1223,15 @@ class FundableClient:
                 return None
 
             if data.get("success"):
-                return data["data"]["person"]
+                person = data["data"]["person"]
+                return Person.from_dict(person) if model else person
             return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching person {identifier}: {e}")
             return None
 
+    @api_method
     def get_person_deals(self, identifier: str, identifier_type: str = None,
                          page: int = 0, page_size: int = 10) -> List[Dict[str, Any]]:
         """
@@ -1077,13 +1255,8 @@ class FundableClient:
         params = {identifier_type: identifier, 'page': page, 'page_size': page_size}
 
         try:
-            response = requests.get(
-                f"{self.base_url}/person/deals",
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            data = response.json()
+            response = self._get('/person/deals', params)
+            data = self._decode(response)
 
             if not response.ok:
                 error_msg = data.get('error', {}).get('message', response.reason)
@@ -1098,6 +1271,348 @@ class FundableClient:
             print(f"Error fetching deals for person {identifier}: {e}")
             return []
 
+    @api_method
+    def search_person(self, name: str = None, id: str = None, linkedin: str = None,
+                      crunchbase: str = None, twitter: str = None,
+                      person_type: str = None) -> List[Dict[str, Any]]:
+        """
+        Search people by name, ID, LinkedIn, Crunchbase, or Twitter/X via GET /person/search.
+
+        Exactly one of name, id, linkedin, crunchbase, twitter must be provided.
+
+        Args:
+            name: Fuzzy name search across investors and non-investor people (up to 10 results)
+            id: Person UUID
+            linkedin: LinkedIn person URL or slug
+            crunchbase: Crunchbase person URL or slug
+            twitter: Twitter/X URL or handle
+            person_type: Optional pool filter — 'investor' or 'company'
+
+        Returns:
+            List of matching people (id, name, linkedin_url, crunchbase_url, twitter_url, person_type)
+        """
+        provided = {k: v for k, v in {'name': name, 'id': id, 'linkedin': linkedin,
+                                       'crunchbase': crunchbase, 'twitter': twitter}.items() if v}
+        if len(provided) != 1:
+            raise ValueError("Exactly one of name, id, linkedin, crunchbase, or twitter must be provided")
+        if person_type is not None:
+            valid_types = ['investor', 'company']
+            if person_type not in valid_types:
+                raise ValueError(f"person_type must be one of: {valid_types}")
+            provided['person_type'] = person_type
+
+        try:
+            response = self._get('/person/search', provided)
+            data = self._decode(response)
+
+            if not response.ok:
+                error_msg = data.get('error', {}).get('message', response.reason)
+                print(f"Error searching person: {error_msg}")
+                return []
+
+            if data.get("success"):
+                return data["data"]["people"]
+            return []
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error searching person: {e}")
+            return []
+
+    @api_method
+    def get_people_by_ids(self, ids: List[str], chunk_size: int = 100, concurrency: int = 4,
+                          rate_limiter: RateLimiter = None, max_retries: int = 3,
+                          model: bool = False) -> Dict[str, Any]:
+        """
+        Fetch many person profiles at once, keyed by ID.
+
+        IDs are deduplicated and looked up with search_people(identifiers={'ids': ...})
+        in chunks fetched in parallel, instead of one get_person call per ID.
+        Profiles have the /people shape: the same fields as get_person, with
+        employment and education history capped at 3 entries each (use
+        get_person when the full lists are needed).
+
+        Args:
+            ids: Person UUIDs
+            chunk_size: IDs per request (max 100)
+            concurrency: Chunks fetched at once
+            rate_limiter: fundable.concurrency.RateLimiter to use instead of the
+                client's shared rate_limiter
+            max_retries: Retries per chunk for 429 / 5xx / transport errors
+            model: Return fundable.models.Person records instead of dicts
+
+        Returns:
+            Dict of person ID -> profile; IDs that were not found are absent.
+            A chunk that still fails after retries is printed in the default
+            error mode and raised (after the other chunks finish) otherwise.
+        """
+        if not 1 <= chunk_size <= 100:
+            raise ValueError("chunk_size must be between 1 and 100")
+        strict = self.with_error_mode('raise')
+        limiter = rate_limiter or self.rate_limiter
+        unique = list(dict.fromkeys(person_id for person_id in ids if person_id))
+        chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+
+        def fetch(chunk: List[str]) -> List[Any]:
+            return call_with_retry(
+                lambda: strict.search_people(identifiers={'ids': chunk}, page_size=len(chunk), model=model),
+                limiter, max_retries=max_retries)
+
+        people: Dict[str, Any] = {}
+        errors: List[FundableError] = []
+        with self.span('get_people_by_ids', ids=len(unique), chunks=len(chunks)), \
+                ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = [submit_in_context(executor, fetch, chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    results = future.result()
+                except FundableError as e:
+                    if self.error_mode == 'print':
+                        print(f"Error fetching {len(chunk)} people: {e}")
+                    errors.append(e)
+                    continue
+                for person in results:
+                    person_id = person.id if model else person.get('id')
+                    if person_id:
+                        people[person_id] = person
+        if errors and self.error_mode != 'print':
+            raise errors[0]
+        return people
+
+    # ------------------------------------------------------------------
+    # Page results: records plus pagination meta (total_count, page, page_size)
+    # ------------------------------------------------------------------
+
+    def _page(self, fetch: Callable[..., Any], records_key: str = None, **kwargs) -> Page:
+        """Call a list method and return its records together with the response meta."""
+        local = self._local
+        local.capture_meta, local.meta = True, None
+        try:
+            result = fetch(**kwargs)
+        finally:
+            local.capture_meta = False
+        if records_key is not None:
+            result = result.get(records_key, [])
+        return Page(result, local.meta)
+
+    @api_method
+    def get_deals_page(self, page: int = 0, page_size: int = None, **filters) -> Page:
+        """
+        Like get_deals(), but returns a Page with total_count, page and page_size.
+
+        Accepts the same filters as get_deals() (including model=True).
+        """
+        return self._page(self.get_deals, page=page, page_size=page_size, **filters)
+
+    @api_method
+    def get_companies_page(self, page: int = 0, page_size: int = None, **filters) -> Page:
+        """Like get_companies(), but returns a Page with total_count, page and page_size."""
+        return self._page(self.get_companies, page=page, page_size=page_size, **filters)
+
+    @api_method
+    def get_investors_page(self, page: int = 0, page_size: int = None, **filters) -> Page:
+        """Like get_investors(), but returns a Page with total_count, page and page_size."""
+        return self._page(self.get_investors, page=page, page_size=page_size, **filters)
+
+    @api_method
+    def search_people_page(self, page: int = 0, page_size: int = None, **filters) -> Page:
+        """Like search_people(), but returns a Page with total_count, page and page_size."""
+        return self._page(self.search_people, page=page, page_size=page_size, **filters)
+
+    @api_method
+    def run_query_page(self, query: Query, page: int = 0, model: bool = False) -> Page:
+        """Like run_query(), but returns a Page with total_count, page and page_size."""
+        return self._page(self.run_query, query=query, page=page, model=model)
+
+    @api_method
+    def get_company_deals_page(self, page: int = 0, page_size: int = None, **identifier) -> Page:
+        """Like get_company_deals(), but returns a Page of deals."""
+        return self._page(self.get_company_deals, 'deals', page=page, page_size=page_size, **identifier)
+
+    @api_method
+    def get_investor_deals_page(self, page: int = 0, page_size: int = None, **identifier) -> Page:
+        """Like get_investor_deals(), but returns a Page of deals."""
+        return self._page(self.get_investor_deals, 'deals', page=page, page_size=page_size, **identifier)
+
+    @api_method
+    def get_person_deals_page(self, identifier: str, identifier_type: str = None,
+                              page: int = 0, page_size: int = 10) -> Page:
+        """Like get_person_deals(), but returns a Page of deals."""
+        return self._page(self.get_person_deals, identifier=identifier, identifier_type=identifier_type,
+                          page=page, page_size=page_size)
+
+    def iter_query(self, query: Query, model: bool = False, rate_limiter: RateLimiter = None,
+                   max_retries: int = 3) -> Iterator[Any]:
+        """
+        Iterate over every record of a precompiled query, page by page.
+
+        With a page_sizer on the client, each page's size is chosen from the
+        latency and payload sizes observed for the endpoint so far, so a scan
+        grows toward the largest pages that fit the budget (and shrinks when
+        responses slow down). The page number is derived from the records
+        already read. Without a page_sizer the query's own page_size is used.
+
+        Args:
+            query: fundable.queries.DealQuery, CompanyQuery or InvestorQuery
+            model: Yield fundable.models records instead of dicts
+            rate_limiter: fundable.concurrency.RateLimiter to use instead of the
+                client's shared rate_limiter
+            max_retries: Retries per page for 429 / 5xx / transport errors
+
+        Returns:
+            Iterator of records. A page that still fails after retries ends
+            the iteration with a printed error in the default error mode and
+            raises otherwise (also in error_mode='result').
+        """
+        strict = self.with_error_mode('raise')
+        limiter = rate_limiter or self.rate_limiter
+        endpoint = endpoint_label(query.path)
+        sized = {query.body['page_size']: query}
+
+        def generate() -> Iterator[Any]:
+            offset, size, total = 0, query.body['page_size'], None
+            try:
+                while total is None or offset < total:
+                    if self.page_sizer is not None:
+                        size = self.page_sizer.page_size(endpoint, offset, size)
+                    if size not in sized:
+                        sized[size] = query.with_filters(page_size=size)
+                    page = call_with_retry(
+                        lambda: strict.run_query_page(sized[size], page=offset // size, model=model),
+                        limiter, max_retries=max_retries)
+                    yield from page
+                    offset += len(page)
+                    if page.total_count is not None:
+                        total = page.total_count
+                    if len(page) < size:
+                        return
+            except FundableError as e:
+                if self.error_mode != 'print':
+                    raise
+                print(f"Error fetching {query.records_key}: {e}")
+
+        return generate()
+
+    # ------------------------------------------------------------------
+    # Full deal histories: every page, fetched concurrently
+    # ------------------------------------------------------------------
+
+    def _iter_deal_pages(self, fetch_page: Callable[..., Page], label: str, page_size: int,
+                         concurrency: int, rate_limiter: Optional[RateLimiter],
+                         max_retries: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the deals of every page, in order. Page 0 is fetched first to
+        learn total_count; the remaining pages are then fetched concurrently.
+        """
+        if not 1 <= page_size <= DEAL_HISTORY_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {DEAL_HISTORY_PAGE_SIZE}")
+        strict = self.with_error_mode('raise')
+        limiter = rate_limiter or self.rate_limiter
+
+        def fetch(page: int) -> Page:
+            return call_with_retry(lambda: fetch_page(strict, page=page, page_size=page_size),
+                                   limiter, max_retries=max_retries)
+
+        def generate() -> Iterator[Dict[str, Any]]:
+            try:
+                first = fetch(0)
+                yield from first
+                num_pages = page_count(first.total_count, page_size)
+                if num_pages is None:
+                    # No total_count: fall back to sequential pages until a short one
+                    page, current = 0, first
+                    while len(current) >= page_size:
+                        page += 1
+                        current = fetch(page)
+                        yield from current
+                    return
+                if num_pages <= 1:
+                    return
+                with ThreadPoolExecutor(max_workers=max(1, min(concurrency, num_pages - 1))) as executor:
+                    futures = [submit_in_context(executor, fetch, page) for page in range(1, num_pages)]
+                    try:
+                        for future in futures:
+                            yield from future.result()
+                    finally:
+                        # Stopping early (or a failed page) drops the pages not yet started
+                        for future in futures:
+                            future.cancel()
+            except FundableError as e:
+                if self.error_mode != 'print':
+                    raise
+                print(f"Error fetching deals for {label}: {e}")
+
+        return generate()
+
+    def iter_company_deals(self, id: str = None, domain: str = None, linkedin: str = None,
+                           crunchbase: str = None, page_size: int = DEAL_HISTORY_PAGE_SIZE,
+                           concurrency: int = 4, rate_limiter: RateLimiter = None,
+                           max_retries: int = 3) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a company's full deal history.
+
+        Uses the largest page size, reads total_count from the first page and
+        fetches the remaining pages concurrently, yielding deals in page order.
+        Exactly one identifier must be provided, as for get_company_deals().
+
+        Args:
+            id, domain, linkedin, crunchbase: Company identifier (exactly one)
+            page_size: Deals per request (1-500)
+            concurrency: Pages fetched at once
+            rate_limiter: fundable.concurrency.RateLimiter to use instead of the
+                client's shared rate_limiter
+            max_retries: Retries per page for 429 / 5xx / transport errors
+
+        Returns:
+            Iterator of deal dicts. A page that still fails after retries ends
+            the iteration with a printed error in the default error mode and
+            raises otherwise (also in error_mode='result').
+        """
+        provided = {k: v for k, v in {'id': id, 'domain': domain, 'linkedin': linkedin,
+                                       'crunchbase': crunchbase}.items() if v}
+        if len(provided) != 1:
+            raise ValueError("Exactly one of id, domain, linkedin, or crunchbase must be provided")
+        return self._iter_deal_pages(
+            lambda client, **page: client.get_company_deals_page(**page, **provided),
+            f"company {next(iter(provided.values()))}", page_size, concurrency, rate_limiter, max_retries)
+
+    def iter_investor_deals(self, domain: str = None, linkedin: str = None, crunchbase: str = None,
+                            page_size: int = DEAL_HISTORY_PAGE_SIZE, concurrency: int = 4,
+                            rate_limiter: RateLimiter = None, max_retries: int = 3) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over an investor's full deal history (see iter_company_deals()).
+
+        Args:
+            domain, linkedin, crunchbase: Investor identifier (exactly one)
+            page_size, concurrency, rate_limiter, max_retries: As for iter_company_deals()
+        """
+        provided = {k: v for k, v in {'domain': domain, 'linkedin': linkedin,
+                                       'crunchbase': crunchbase}.items() if v}
+        if len(provided) != 1:
+            raise ValueError("Exactly one of domain, linkedin, or crunchbase must be provided")
+        return self._iter_deal_pages(
+            lambda client, **page: client.get_investor_deals_page(**page, **provided),
+            f"investor {next(iter(provided.values()))}", page_size, concurrency, rate_limiter, max_retries)
+
+    def iter_person_deals(self, identifier: str, identifier_type: str = None,
+                          page_size: int = DEAL_HISTORY_PAGE_SIZE, concurrency: int = 4,
+                          rate_limiter: RateLimiter = None, max_retries: int = 3) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every deal a person participated in (see iter_company_deals()).
+
+        Args:
+            identifier: Person UUID or LinkedIn / Crunchbase / Twitter URL
+            identifier_type: 'id', 'linkedin', 'crunchbase', or 'twitter' (auto-detected if None)
+            page_size, concurrency, rate_limiter, max_retries: As for iter_company_deals()
+        """
+        if identifier_type is None:
+            identifier_type = self._detect_person_identifier_type(identifier)
+        valid_types = ['id', 'linkedin', 'crunchbase', 'twitter']
+        if identifier_type not in valid_types:
+            raise ValueError(f"identifier_type must be one of: {valid_types}")
+        return self._iter_deal_pages(
+            lambda client, **page: client.get_person_deals_page(identifier, identifier_type, **page),
+            f"person {identifier}", page_size, concurrency, rate_limiter, max_retries)
+
 
 class DataExtractor:
     """Simple class to extract useful information from deal data."""
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Rate limiting and retries for concurrent API fetches.
+
+The API allows 200 requests per minute per key. RateLimiter is a
+thread-safe token bucket shared by all workers of a job; a 429 pauses every
+worker until Retry-After has passed. call_with_retry() retries rate limits,
+5xx responses and transport errors with exponential backoff.
+"""
+
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Optional
+
+from fundable.errors import RETRYABLE_ERRORS, RateLimited
+from fundable.metrics import retry_attempt
+
+DEFAULT_RATE_LIMIT = 200    # requests per minute
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Args:
+        rate: Requests allowed per `per` seconds
+        per: Window length in seconds
+        burst: Bucket size (defaults to a tenth of the rate, at least 1), so a
+            burst of workers cannot use the whole minute's budget at once
+    """
+
+    def __init__(self, rate: int = DEFAULT_RATE_LIMIT, per: float = 60.0, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.per = per
+        self.capacity = burst or max(1, rate // 10)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (after a 429), for every worker."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+def shared_limiter(client, rate_limit: Optional[int] = None) -> RateLimiter:
+    """
+    Limiter for a concurrent helper: a separate RateLimiter(rate_limit) when a
+    rate is given, otherwise the client's shared rate_limiter, so helpers
+    running side by side on one client stay within one API budget together.
+    """
+    if rate_limit is not None:
+        return RateLimiter(rate_limit)
+    return client.rate_limiter
+
+
+def call_with_retry(fn: Callable[[], Any], limiter: Optional[RateLimiter] = None, max_retries: int = 5,
+                    backoff: float = 1.0, max_backoff: float = 60.0) -> Any:
+    """
+    Call fn() (which must raise fundable.errors exceptions, i.e. a client in
+    error_mode='raise'), waiting for the rate limiter before each attempt.
+
+    Rate limits wait Retry-After (or the backoff when absent); 5xx and
+    transport errors back off exponentially with jitter. Other errors, and
+    the last failure once max_retries is exhausted, are raised.
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            with retry_attempt(attempt):
+                return fn()
+        except RETRYABLE_ERRORS as e:
+            if attempt >= max_retries:
+                raise
+            delay = min(max_backoff, backoff * 2 ** attempt) * (0.5 + random.random() / 2)
+            if isinstance(e, RateLimited):
+                delay = e.retry_after if e.retry_after is not None else delay
+                if limiter is not None:
+                    limiter.pause(delay)
+                    delay = 0
+            attempt += 1
+            if delay:
+                time.sleep(delay)
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """Submit to an executor under a copy of the current context, so tracing spans keep their parent."""
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
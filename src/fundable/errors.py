@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Typed errors and result objects for FundableClient.
+
+By default client methods print errors and return an empty value, so a
+rate-limited page looks like an empty page. Two stricter modes are
+available via FundableClient(error_mode=...):
+- 'raise': failures raise a FundableError subclass (RateLimited carries
+  retry_after, NotFound, ValidationError, ServerError, TimeoutError, ...)
+- 'result': methods return an ApiResult carrying the usual return value
+  plus status, meta (total_count, page, page_size) and timing, or the error
+
+    client = FundableClient(error_mode='raise')
+    try:
+        deals = client.get_deals(page=3, page_size=500)
+    except RateLimited as e:
+        time.sleep(e.retry_after or 60)   # re-fetch just this page
+"""
+
+import builtins
+import email.utils
+import time
+from typing import Any, Dict, Optional
+
+import requests
+
+ERROR_MODES = ['print', 'raise', 'result']
+
+
+class FundableError(Exception):
+    """
+    Base class for API failures.
+
+    Attributes:
+        message: Error message from the API (or the transport)
+        status: HTTP status code, or None for transport failures
+        code: API error code (e.g. 'RATE_LIMIT_EXCEEDED'), if provided
+        details: API error details dict, if provided
+        endpoint: Request path that failed
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, code: Optional[str] = None,
+                 details: Optional[Dict[str, Any]] = None, endpoint: Optional[str] = None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.code = code
+        self.details = details or {}
+        self.endpoint = endpoint
+
+    def __str__(self) -> str:
+        where = f" ({self.endpoint})" if self.endpoint else ''
+        status = f"{self.status} " if self.status else ''
+        return f"{status}{self.message}{where}"
+
+
+class ValidationError(FundableError):
+    """400 / 422: invalid or unknown parameters. Not retryable."""
+
+
+class AuthenticationError(FundableError):
+    """401 / 403: missing or invalid API key."""
+
+
+class InsufficientCredits(FundableError):
+    """402: the API key is out of credits."""
+
+
+class NotFound(FundableError):
+    """404: the requested record does not exist."""
+
+
+class RateLimited(FundableError):
+    """429: rate limit exceeded; retry after `retry_after` seconds (None if not sent)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class ServerError(FundableError):
+    """5xx: server-side failure. Usually retryable."""
+
+
+class TransportError(FundableError):
+    """The request did not complete (connection reset, DNS failure, invalid response body)."""
+
+
+class TimeoutError(TransportError, builtins.TimeoutError):
+    """The request timed out. Also catchable as the builtin TimeoutError."""
+
+
+_STATUS_ERRORS = {
+    400: ValidationError,
+    401: AuthenticationError,
+    402: InsufficientCredits,
+    403: AuthenticationError,
+    404: NotFound,
+    422: ValidationError,
+    429: RateLimited,
+}
+
+# Errors worth retrying with backoff
+RETRYABLE_ERRORS = (RateLimited, ServerError, TransportError)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def error_from_response(response: requests.Response, data: Any = None, endpoint: Optional[str] = None) -> FundableError:
+    """Build the typed error for a non-2xx response (data is the decoded body, if any)."""
+    status = response.status_code
+    error = data.get('error') if isinstance(data, dict) else None
+    if not isinstance(error, dict):
+        error = {'message': error} if isinstance(error, str) else {}
+    message = error.get('message') or response.reason or f"HTTP {status}"
+    kwargs = {'status': status, 'code': error.get('code'), 'details': error.get('details'), 'endpoint': endpoint}
+
+    if status == 429:
+        return RateLimited(message, retry_after=parse_retry_after(response.headers.get('Retry-After')), **kwargs)
+    if status >= 500:
+        return ServerError(message, **kwargs)
+    return _STATUS_ERRORS.get(status, FundableError)(message, **kwargs)
+
+
+def error_from_exception(exc: Exception, endpoint: Optional[str] = None) -> FundableError:
+    """Wrap a requests transport or decode exception."""
+    if isinstance(exc, requests.exceptions.Timeout):
+        return TimeoutError(f"Request timed out: {exc}", endpoint=endpoint)
+    return TransportError(str(exc), endpoint=endpoint)
+
+
+class ApiResult:
+    """
+    Outcome of one client method call in error_mode='result'.
+
+    Attributes:
+        data: What the method returns in the other modes (list, dict, record, ...),
+            or None on failure
+        error: FundableError on failure, else None
+        status: HTTP status of the (last) response
+        meta: Response `meta` dict (total_count, page, page_size, credits_used, ...)
+        elapsed_ms: Wall time of the call, including decoding
+    """
+
+    __slots__ = ('data', 'error', 'status', 'meta', 'elapsed_ms')
+
+    def __init__(self, data: Any = None, error: Optional[FundableError] = None, status: Optional[int] = None,
+                 meta: Optional[Dict[str, Any]] = None, elapsed_ms: Optional[float] = None):
+        self.data = data
+        self.error = error
+        self.status = status
+        self.meta = meta or {}
+        self.elapsed_ms = elapsed_ms
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def total_count(self) -> Optional[int]:
+        return self.meta.get('total_count')
+
+    @property
+    def page(self) -> Optional[int]:
+        return self.meta.get('page')
+
+    @property
+    def page_size(self) -> Optional[int]:
+        return self.meta.get('page_size')
+
+    @property
+    def retryable(self) -> bool:
+        return isinstance(self.error, RETRYABLE_ERRORS)
+
+    def unwrap(self) -> Any:
+        """Return data, or raise the error."""
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"ApiResult(error={self.error!r})"
+        size = f"{len(self.data)} items" if isinstance(self.data, (list, tuple)) else type(self.data).__name__
+        return f"ApiResult({size}, status={self.status}, total_count={self.total_count})"
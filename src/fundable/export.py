@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Resumable, checkpointed bulk exports.
+
+ExportJob pages through one list endpoint (get_companies, search_people,
+get_deals or get_investors) and appends every record to a JSON Lines file.
+After each page the output is flushed to disk and a checkpoint records the
+query fingerprint, the next page and the output byte offset. On restart the
+output is truncated back to the last durable offset, so a page that was
+half-written when the process died is written again exactly once, and the
+export continues from that page instead of page 0:
+
+    job = ExportJob(client, 'get_companies',
+                    query={'industries': ['fintech'], 'employee_count': ['11-50']},
+                    output_path='exports/fintech.jsonl')
+    summary = job.run()      # safe to re-run after a crash or deploy
+"""
+
+import datetime
+import functools
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from fundable.backfill import write_atomic
+from fundable.concurrency import RateLimiter, call_with_retry, shared_limiter, submit_in_context
+from fundable.pagination import page_count
+from fundable.queries import QUERY_TYPES
+
+EXPORT_METHODS = ['get_deals', 'get_companies', 'get_investors', 'search_people']
+
+
+class ExportJob:
+    """
+    Export every page of a list query to a JSON Lines file, resumably.
+
+    Args:
+        client: FundableClient (any error_mode; the job uses a raising copy)
+        method: One of EXPORT_METHODS
+        query: Keyword arguments for the method (filters, sort_by, model, ...);
+            page and page_size are managed by the job
+        output_path: JSON Lines output file
+        checkpoint_path: Checkpoint file (default: output_path + '.checkpoint.json')
+        page_size: Records per page (max 500)
+        max_pages: Stop after this many pages (None for all)
+        workers: Pages fetched concurrently ahead of the writer; output order is preserved
+        rate_limit: Requests per minute (default: the client's shared rate_limiter)
+        max_retries: Retries per page for 429 / 5xx / transport errors
+    """
+
+    def __init__(self, client, method: str, query: Optional[Dict[str, Any]] = None, output_path: str = None,
+                 checkpoint_path: Optional[str] = None, page_size: int = 500, max_pages: Optional[int] = None,
+                 workers: int = 1, rate_limit: Optional[int] = None, max_retries: int = 5):
+        if method not in EXPORT_METHODS:
+            raise ValueError(f"method must be one of: {EXPORT_METHODS}")
+        if not output_path:
+            raise ValueError("output_path is required")
+        self.query = dict(query or {})
+        if 'page' in self.query or 'page_size' in self.query:
+            raise ValueError("ExportJob manages page and page_size; remove them from query")
+        if not 1 <= page_size <= 500:
+            raise ValueError("page_size must be between 1 and 500")
+
+        self.client = client
+        self.method = method
+        # Filter-heavy methods send one precompiled body; only the page number changes per request
+        self.compiled = None
+        if method in QUERY_TYPES:
+            self.compiled = QUERY_TYPES[method](
+                page_size=page_size, **{key: value for key, value in self.query.items() if key != 'model'})
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or f"{output_path}.checkpoint.json"
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.workers = max(1, workers)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+
+    def fingerprint(self) -> str:
+        """
+        Hash of the method, query and page size; a checkpoint only resumes the same export.
+
+        Precompiled methods also save their compiled body in the checkpoint and
+        resume from it, so defaults filled in at compile time (such as
+        get_companies' rolling one-day window) stay those of the first run.
+        """
+        query = {'method': self.method, 'query': self.query, 'page_size': self.page_size}
+        return hashlib.sha256(json.dumps(query, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def load_checkpoint(self) -> Dict[str, Any]:
+        """Saved progress, or a fresh state when there is no checkpoint yet."""
+        fingerprint = self.fingerprint()
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                state = json.load(f)
+            if state.get('fingerprint') != fingerprint:
+                raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a different export; "
+                                 f"delete it or choose another output path")
+            if self.compiled is not None and state.get('body') is not None:
+                self.compiled = type(self.compiled).from_body(state['body'])
+            return state
+        return {
+            'fingerprint': fingerprint,
+            'method': self.method,
+            'query': self.query,
+            'body': self.compiled.body if self.compiled is not None else None,
+            'page_size': self.page_size,
+            'total_count': None,
+            'num_pages': None,
+            'next_page': 0,
+            'records': 0,
+            'output_offset': 0,
+            'complete': False,
+        }
+
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        state['updated_at'] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        write_atomic(self.checkpoint_path, json.dumps(state, default=str, indent=2))
+
+    def _fetch(self, client, limiter: RateLimiter, page: int):
+        if self.compiled is not None:
+            model = bool(self.query.get('model'))
+            fetch = functools.partial(client.run_query_page, self.compiled, page=page, model=model)
+        else:
+            fetch = functools.partial(getattr(client, f"{self.method}_page"), page=page,
+                                      page_size=self.page_size, **self.query)
+        with client.span('export.fetch', method=self.method, page=page):
+            return call_with_retry(fetch, limiter, max_retries=self.max_retries)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run (or resume) the export.
+
+        Returns:
+            Summary dict: pages and records written in this run, total records,
+            total_count, resumed_from page, complete, elapsed_s
+
+        Raises:
+            fundable.errors.FundableError: a page failed after all retries; the
+            checkpoint keeps every page written before it
+        """
+        client = self.client.with_error_mode('raise')
+        limiter = shared_limiter(self.client, self.rate_limit)
+        state = self.load_checkpoint()
+        summary = {'pages': 0, 'records': 0, 'resumed_from': state['next_page']}
+        started = time.perf_counter()
+
+        if state['complete']:
+            return dict(summary, total_records=state['records'], total_count=state['total_count'],
+                        complete=True, elapsed_s=0.0)
+
+        directory = os.path.dirname(os.path.abspath(self.output_path))
+        os.makedirs(directory, exist_ok=True)
+        # Drop anything written after the last durable page
+        with open(self.output_path, 'a'):
+            pass
+        if os.path.getsize(self.output_path) != state['output_offset']:
+            with open(self.output_path, 'r+') as f:
+                f.truncate(state['output_offset'])
+
+        with self.client.span('export_job', method=self.method, resumed_from=state['next_page']), \
+                open(self.output_path, 'a') as out, \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+            inflight = {}
+
+            def last_page() -> Optional[int]:
+                limits = [n for n in (state['num_pages'], self.max_pages) if n is not None]
+                return min(limits) if limits else None
+
+            def fill_window():
+                # Fetch ahead only once total_count is known, so no requests go past the end
+                window = self.workers if state['num_pages'] is not None else 1
+                next_page = max(inflight) + 1 if inflight else state['next_page']
+                stop = last_page()
+                while len(inflight) < window and (stop is None or next_page < stop):
+                    inflight[next_page] = submit_in_context(executor, self._fetch, client, limiter, next_page)
+                    next_page += 1
+
+            try:
+                fill_window()
+                while inflight:
+                    page_number = state['next_page']
+                    page = inflight.pop(page_number).result()
+
+                    if page.total_count is not None:
+                        state['total_count'] = page.total_count
+                        state['num_pages'] = page_count(page.total_count, self.page_size)
+
+                    for record in page.records:
+                        record = record.to_dict() if hasattr(record, 'to_dict') else record
+                        out.write(json.dumps(record, default=str) + '\n')
+                    out.flush()
+                    os.fsync(out.fileno())
+
+                    state['output_offset'] = out.tell()
+                    state['records'] += len(page.records)
+                    state['next_page'] = page_number + 1
+                    summary['pages'] += 1
+                    summary['records'] += len(page.records)
+
+                    stop = last_page()
+                    short_page = len(page.records) < self.page_size
+                    if (stop is not None and state['next_page'] >= stop) or (state['num_pages'] is None and short_page):
+                        state['complete'] = state['num_pages'] is None or state['next_page'] >= state['num_pages']
+                    self._save_checkpoint(state)
+                    if not short_page or state['num_pages'] is not None:
+                        fill_window()
+            except BaseException:
+                for future in inflight.values():
+                    future.cancel()
+                raise
+
+        return dict(summary, total_records=state['records'], total_count=state['total_count'],
+                    complete=state['complete'], elapsed_s=round(time.perf_counter() - started, 2))
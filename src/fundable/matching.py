@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Local evaluation of saved alert criteria against synced deals.
+
+Every get_alerts call is billed by the deals it returns. When deals are
+already synced locally through get_deals, AlertMatcher evaluates the saved
+alerts itself: the filters from get_alert_configurations() are compiled into
+predicates, and inverted indexes on industry, location and round type narrow
+each deal down to the few alerts that can match before the remaining
+criteria (size, employee count, investors, companies) are checked:
+
+    matcher = AlertMatcher.from_client(client)
+    companies = companies_for_deals(client, deals)
+    for alert_id, matched in matcher.match_many(deals, companies).items():
+        print(matcher.alerts[alert_id].name, len(matched))
+
+Deals carry only a company_id, so industry, location and employee criteria
+are evaluated against the deal's company record. Company records list
+industries but not super categories; pass super_categories= (industry
+permalink -> super category permalinks) to evaluate super_categories
+filters, otherwise such alerts are listed in `unsupported` and never match.
+
+Alert investor filters name investors by permalink ("sequoia-capital"),
+while deals list investor UUIDs. from_client() resolves the permalinks with
+investor_ids_for_alerts(); when building a matcher directly, pass
+investor_ids= (permalink -> UUID). Alerts with unresolved investor
+permalinks are listed in `unsupported`.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fundable.concurrency import call_with_retry
+
+# Alert financing types are human-readable ("Series A", "Seed"); deals use the enum
+_ROUND_ALIASES = {
+    'DEBT': 'DEBT_FINANCING',
+    'ICO': 'INITIAL_COIN_OFFERING',
+    'SECONDARY': 'SECONDARY_MARKET',
+    'NOTE': 'CONVERTIBLE_NOTE',
+    'GRANTS': 'GRANT',
+}
+
+_LOCATION_LEVELS = ('city', 'state', 'country', 'region')
+
+_UUID = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
+
+
+def normalize_round_type(value: Optional[str]) -> str:
+    """'Series A' / 'series-a' / 'SERIES_A' -> 'SERIES_A'."""
+    key = '_'.join((value or '').replace('-', ' ').upper().split())
+    return _ROUND_ALIASES.get(key, key)
+
+
+def _plain(record: Any) -> Dict[str, Any]:
+    if record is None:
+        return {}
+    return record.to_dict() if hasattr(record, 'to_dict') else record
+
+
+def _ids(items: Iterable[Any]) -> Set[str]:
+    """IDs from a list of strings or {'id': ...} dicts."""
+    found = set()
+    for item in items or []:
+        value = item.get('id') if isinstance(item, dict) else item
+        if value:
+            found.add(value)
+    return found
+
+
+def deal_facts(deal: Any, company: Any = None,
+               super_categories: Optional[Dict[str, Iterable[str]]] = None) -> Dict[str, Any]:
+    """
+    Flatten a deal (and its company) into the values alert criteria test.
+
+    Args:
+        deal: Deal dict from get_deals (or a fundable.models.Deal)
+        company: The deal's company dict from get_companies, if available
+        super_categories: Industry permalink -> super category permalinks
+
+    Returns:
+        Dict of sets (industries, super_categories, locations, round_types,
+        investors, companies) plus size and num_employees
+    """
+    deal, company = _plain(deal), _plain(company)
+    industries = {industry.get('permalink') for industry in company.get('industries') or []
+                  if industry.get('permalink')}
+    supers = set()
+    for industry in industries:
+        supers.update((super_categories or {}).get(industry, ()))
+
+    location = company.get('location') or {}
+    locations = {(location.get(level) or {}).get('permalink') for level in _LOCATION_LEVELS}
+    locations.discard(None)
+
+    financings = deal.get('financings') or []
+    round_types = {normalize_round_type(financing.get('type')) for financing in financings if financing.get('type')}
+    if deal.get('round_type'):
+        round_types.add(normalize_round_type(deal['round_type']))
+
+    size = deal.get('total_round_raised')
+    if size is None:
+        sizes = [financing.get('size_usd') for financing in financings if financing.get('size_usd') is not None]
+        size = sum(sizes) if sizes else None
+
+    companies = {value for value in (deal.get('company_id'), company.get('id'), company.get('guru_permalink')) if value}
+    return {
+        'industries': industries,
+        'super_categories': supers,
+        'locations': locations,
+        'round_types': round_types,
+        'size': size,
+        'num_employees': company.get('num_employees'),
+        'investors': set(deal.get('investor_ids') or []) | set(deal.get('angel_investor_ids') or []),
+        'companies': companies,
+    }
+
+
+class CompiledAlert:
+    """
+    One alert configuration compiled into sets and bounds.
+
+    An empty set means the alert does not constrain that field.
+    """
+
+    __slots__ = ('id', 'name', 'industries', 'super_categories', 'locations', 'round_types',
+                 'size_min', 'size_max', 'num_employees', 'investors', 'companies')
+
+    def __init__(self, configuration: Dict[str, Any]):
+        filters = configuration.get('filters') or {}
+        self.id = configuration.get('configuration_id')
+        self.name = configuration.get('configuration_name') or self.id
+        self.industries = set(filters.get('industries') or [])
+        self.super_categories = set(filters.get('super_categories') or [])
+        self.locations = set(filters.get('locations') or [])
+        self.round_types = {normalize_round_type(value) for value in filters.get('financing_types') or []}
+        self.size_min = filters.get('deal_size_min')
+        self.size_max = filters.get('deal_size_max')
+        self.num_employees = set(filters.get('num_employees') or [])
+        self.investors = _ids(filters.get('investors'))
+        self.companies = _ids(filters.get('companies'))
+
+    def matches(self, facts: Dict[str, Any]) -> bool:
+        """Evaluate every criterion against deal_facts() output."""
+        for field in ('industries', 'super_categories', 'locations', 'round_types', 'investors', 'companies'):
+            wanted = getattr(self, field)
+            if wanted and wanted.isdisjoint(facts[field]):
+                return False
+        if self.num_employees and facts['num_employees'] not in self.num_employees:
+            return False
+        if self.size_min is not None or self.size_max is not None:
+            size = facts['size']
+            if size is None:
+                return False
+            if self.size_min is not None and size < self.size_min:
+                return False
+            if self.size_max is not None and size > self.size_max:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"CompiledAlert({self.name!r})"
+
+
+class AlertMatcher:
+    """
+    Match deals against many alerts at once.
+
+    Args:
+        configurations: Alert configuration dicts from get_alert_configurations()
+        super_categories: Industry permalink -> super category permalinks, used
+            to evaluate super_categories filters (see module docstring)
+        investor_ids: Investor permalink -> UUID, used to evaluate investor
+            filters given as permalinks (see investor_ids_for_alerts())
+
+    Attributes:
+        alerts: configuration_id -> CompiledAlert
+        unsupported: configuration_id -> reason, for alerts that cannot be
+            evaluated locally (they are skipped)
+    """
+
+    # Fields with an inverted index: value -> alert positions
+    _INDEXED = ('industries', 'locations', 'round_types')
+
+    def __init__(self, configurations: Iterable[Dict[str, Any]],
+                 super_categories: Optional[Dict[str, Iterable[str]]] = None,
+                 investor_ids: Optional[Dict[str, str]] = None):
+        self.super_categories = {industry: set(values) for industry, values in (super_categories or {}).items()}
+        self.investor_ids = dict(investor_ids or {})
+        self.alerts: Dict[str, CompiledAlert] = {}
+        self.unsupported: Dict[str, str] = {}
+
+        self._compiled: List[CompiledAlert] = []
+        self._index: Dict[str, Dict[str, Set[int]]] = {field: {} for field in self._INDEXED}
+        # Alerts that do not constrain a field match any value of it
+        self._unconstrained: Dict[str, Set[int]] = {field: set() for field in self._INDEXED}
+
+        for configuration in configurations:
+            alert = CompiledAlert(configuration)
+            if not alert.id:
+                continue
+            if alert.super_categories and not self.super_categories:
+                self.unsupported[alert.id] = "super_categories filter needs a super_categories= mapping"
+                continue
+            unresolved = sorted(value for value in alert.investors
+                                if not _UUID.match(value) and value not in self.investor_ids)
+            if unresolved:
+                self.unsupported[alert.id] = f"investor permalinks without an investor_ids= entry: {unresolved}"
+                continue
+            alert.investors = {self.investor_ids.get(value, value) for value in alert.investors}
+            self.alerts[alert.id] = alert
+            position = len(self._compiled)
+            self._compiled.append(alert)
+            for field in self._INDEXED:
+                values = getattr(alert, field)
+                if not values:
+                    self._unconstrained[field].add(position)
+                for value in values:
+                    self._index[field].setdefault(value, set()).add(position)
+
+    @classmethod
+    def from_client(cls, client, super_categories: Optional[Dict[str, Iterable[str]]] = None,
+                    max_retries: int = 3) -> 'AlertMatcher':
+        """
+        Build a matcher from the account's alert configurations (does not use
+        credits), resolving investor permalinks with investor_ids_for_alerts().
+        """
+        strict = client.with_error_mode('raise')
+        configurations = call_with_retry(strict.get_alert_configurations, client.rate_limiter,
+                                         max_retries=max_retries)
+        return cls(configurations, super_categories,
+                   investor_ids_for_alerts(client, configurations, max_retries=max_retries))
+
+    def _candidates(self, facts: Dict[str, Any]) -> Set[int]:
+        candidates = None
+        for field in self._INDEXED:
+            found = set(self._unconstrained[field])
+            for value in facts[field]:
+                found |= self._index[field].get(value, set())
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                break
+        return candidates or set()
+
+    def match(self, deal: Any, company: Any = None) -> List[str]:
+        """IDs of the alerts a deal matches."""
+        facts = deal_facts(deal, company, self.super_categories)
+        return [self._compiled[position].id for position in sorted(self._candidates(facts))
+                if self._compiled[position].matches(facts)]
+
+    def match_many(self, deals: Iterable[Any], companies: Optional[Dict[str, Any]] = None) -> Dict[str, List[Any]]:
+        """
+        Match many deals in one pass.
+
+        Args:
+            deals: Deals from get_deals (dicts or fundable.models.Deal records)
+            companies: company_id -> company record, e.g. from companies_for_deals()
+
+        Returns:
+            configuration_id -> matching deals (in input order), for alerts with matches
+        """
+        companies = companies or {}
+        matched: Dict[str, List[Any]] = {}
+        for deal in deals:
+            company = companies.get(_plain(deal).get('company_id'))
+            for alert_id in self.match(deal, company):
+                matched.setdefault(alert_id, []).append(deal)
+        return matched
+
+
+def companies_for_deals(client, deals: Iterable[Any], chunk_size: int = 100,
+                        max_retries: int = 3) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch the company records of deals with batched get_companies(company_ids=...) calls.
+
+    Calls go through the client's shared rate limiter and are retried on
+    429 / 5xx / transport errors.
+
+    Returns:
+        company_id -> company dict
+
+    Raises:
+        fundable.errors.FundableError: a chunk failed after all retries, so
+            no deal is silently left without its company
+    """
+    strict = client.with_error_mode('raise')
+    company_ids = sorted({_plain(deal).get('company_id') for deal in deals} - {None})
+    companies = {}
+    for start in range(0, len(company_ids), chunk_size):
+        chunk = company_ids[start:start + chunk_size]
+        for company in call_with_retry(lambda: strict.get_companies(company_ids=chunk, page_size=len(chunk)),
+                                       client.rate_limiter, max_retries=max_retries):
+            companies[company['id']] = company
+    return companies
+
+
+def investor_ids_for_alerts(client, configurations: Iterable[Dict[str, Any]],
+                            max_retries: int = 3) -> Dict[str, str]:
+    """
+    Resolve the investor permalinks in alert investor filters to UUIDs.
+
+    Each permalink is looked up with search_investors(name=...), using the
+    name stored next to it in the filter, and mapped to the result whose
+    guru_permalink matches. Permalinks without such a result are left out.
+
+    Returns:
+        investor permalink -> investor UUID
+
+    Raises:
+        fundable.errors.FundableError: a search failed after all retries
+    """
+    strict = client.with_error_mode('raise')
+    names: Dict[str, str] = {}
+    for configuration in configurations:
+        for item in (configuration.get('filters') or {}).get('investors') or []:
+            value = item.get('id') if isinstance(item, dict) else item
+            if value and not _UUID.match(value):
+                name = item.get('name') if isinstance(item, dict) else None
+                names.setdefault(value, name or value.replace('-', ' '))
+
+    investor_ids = {}
+    for permalink, name in names.items():
+        results = call_with_retry(lambda: strict.search_investors(name=name), client.rate_limiter,
+                                  max_retries=max_retries)
+        for investor in results:
+            if investor.get('guru_permalink') == permalink and investor.get('id'):
+                investor_ids[permalink] = investor['id']
+                break
+    return investor_ids
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Per-request metrics hooks for FundableClient.
+
+Every API call produces one RequestMetrics record, which is passed to each
+hook registered on the client (FundableClient(hooks=[...]) or
+client.add_hook(...)). A hook is any callable taking a RequestMetrics.
+Two adapters are included:
+- PrometheusMetrics: in-process counters and latency histograms per endpoint,
+  with text exposition output and p50/p99 estimates
+- LoggingHook: one structured (JSON) log line per request
+"""
+
+import bisect
+import contextlib
+import contextvars
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Latency histogram buckets in seconds (upper bounds)
+DEFAULT_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Set by call_with_retry (attempt number) and the caching layers ('miss')
+# around the calls they make; FundableClient._request copies them into
+# each call's RequestMetrics.
+_retry_attempt: contextvars.ContextVar = contextvars.ContextVar('fundable_retry_attempt', default=0)
+_cache_result: contextvars.ContextVar = contextvars.ContextVar('fundable_cache_result', default=None)
+
+
+@contextlib.contextmanager
+def retry_attempt(attempt: int) -> Iterator[None]:
+    """Mark the API calls made inside the block as retry number `attempt` (0 = first try)."""
+    token = _retry_attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _retry_attempt.reset(token)
+
+
+@contextlib.contextmanager
+def cache_miss() -> Iterator[None]:
+    """Mark the API calls made inside the block as fetches after a cache miss."""
+    token = _cache_result.set('miss')
+    try:
+        yield
+    finally:
+        _cache_result.reset(token)
+
+
+class RequestMetrics:
+    """
+    Timing and size information for one API call.
+
+    Latencies are in milliseconds. dns_ms and connect_ms are None when the
+    transport does not expose them (requests/urllib3 do not break connection
+    setup out separately); ttfb_ms is the time until response headers were
+    parsed, and total_ms includes reading and decoding the body.
+
+    retries is the retry number of the call under call_with_retry (0 for
+    the first attempt). cache is 'miss' for calls a caching layer made
+    after a miss, and 'hit' for lookups a cache answered without a request
+    (see FundableClient.record_cache_hit); such records have no status and
+    records holds the number of cached records served.
+    """
+
+    __slots__ = ('method', 'endpoint', 'path', 'status', 'dns_ms', 'connect_ms', 'ttfb_ms',
+                 'total_ms', 'request_bytes', 'response_bytes', 'decoded_bytes', 'retries',
+                 'cache', 'records', 'error', 'timestamp', '_started')
+
+    def __init__(self, method: str, endpoint: str, path: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.path = path
+        self.status: Optional[int] = None
+        self.dns_ms: Optional[float] = None
+        self.connect_ms: Optional[float] = None
+        self.ttfb_ms: Optional[float] = None
+        self.total_ms: Optional[float] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.decoded_bytes = 0
+        self.retries: int = _retry_attempt.get()
+        self.cache: Optional[str] = _cache_result.get()      # 'hit', 'miss' or None when no cache is involved
+        self.records: Optional[int] = None
+        self.error: Optional[str] = None
+        self.timestamp = time.time()
+        self._started = time.perf_counter()
+
+    @property
+    def ok(self) -> bool:
+        if self.cache == 'hit':
+            return self.error is None
+        return self.error is None and self.status is not None and self.status < 400
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+        result['ok'] = self.ok
+        return result
+
+    def __repr__(self) -> str:
+        return (f"RequestMetrics({self.method} {self.endpoint} status={self.status} "
+                f"total_ms={self.total_ms and round(self.total_ms, 1)} records={self.records})")
+
+
+def count_records(data: Any) -> Optional[int]:
+    """Number of records in a decoded response: the length of the first list under `data`, else 1."""
+    if not isinstance(data, dict) or not data.get('success'):
+        return None
+    payload = data.get('data')
+    if not isinstance(payload, dict):
+        return None
+    for value in payload.values():
+        if isinstance(value, list):
+            return len(value)
+    return 1 if payload else 0
+
+
+def emit(hooks: List[Callable[[RequestMetrics], Any]], metrics: RequestMetrics):
+    """Call each hook; a failing hook is reported but never breaks the API call."""
+    for hook in hooks:
+        try:
+            hook(metrics)
+        except Exception as e:
+            print(f"⚠️  Metrics hook {hook!r} failed: {e}")
+
+
+class PrometheusMetrics:
+    """
+    Prometheus-style counters and histograms, kept in process.
+
+    Register on the client and serve render() from a /metrics endpoint, or
+    read percentiles() directly:
+
+        metrics = PrometheusMetrics()
+        client = FundableClient(hooks=[metrics])
+        ...
+        print(metrics.percentiles('/deals'))   # {'p50': 0.21, 'p99': 0.87} (seconds)
+    """
+
+    def __init__(self, namespace: str = 'fundable', buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}            # (endpoint, method, status) -> count
+        self._histograms: Dict[Tuple[str, str], Dict[str, Any]] = {}    # (endpoint, method) -> buckets/sum/count
+        self._bytes: Dict[Tuple[str, str], int] = {}                    # (endpoint, direction) -> bytes
+        self._records: Dict[str, int] = {}
+        self._cache: Dict[Tuple[str, str], int] = {}                    # (endpoint, hit|miss) -> count
+
+    def __call__(self, metrics: RequestMetrics):
+        if metrics.cache == 'hit':
+            # Answered from a cache: no request to count or time
+            with self._lock:
+                key = (metrics.endpoint, 'hit')
+                self._cache[key] = self._cache.get(key, 0) + 1
+            return
+        status = str(metrics.status) if metrics.status is not None else 'error'
+        seconds = (metrics.total_ms or 0) / 1000
+        with self._lock:
+            key = (metrics.endpoint, metrics.method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+            hist = self._histograms.setdefault((metrics.endpoint, metrics.method), {
+                'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0,
+            })
+            hist['buckets'][bisect.bisect_left(self.buckets, seconds)] += 1
+            hist['sum'] += seconds
+            hist['count'] += 1
+
+            for direction, size in (('request', metrics.request_bytes), ('response', metrics.response_bytes)):
+                key = (metrics.endpoint, direction)
+                self._bytes[key] = self._bytes.get(key, 0) + size
+            if metrics.records:
+                self._records[metrics.endpoint] = self._records.get(metrics.endpoint, 0) + metrics.records
+            if metrics.cache:
+                key = (metrics.endpoint, metrics.cache)
+                self._cache[key] = self._cache.get(key, 0) + 1
+
+    def percentiles(self, endpoint: str, quantiles: Tuple[float, ...] = (0.5, 0.99)) -> Dict[str, Optional[float]]:
+        """
+        Estimate latency quantiles (seconds) for an endpoint from its histogram.
+
+        Uses linear interpolation within buckets, like PromQL histogram_quantile().
+        """
+        with self._lock:
+            counts = [0] * (len(self.buckets) + 1)
+            for (name, _), hist in self._histograms.items():
+                if name == endpoint:
+                    counts = [a + b for a, b in zip(counts, hist['buckets'])]
+        total = sum(counts)
+        result: Dict[str, Optional[float]] = {}
+        for q in quantiles:
+            label = f"p{q * 100:g}"
+            if not total:
+                result[label] = None
+                continue
+            rank = q * total
+            cumulative = 0
+            for i, count in enumerate(counts):
+                if cumulative + count >= rank and count:
+                    lower = self.buckets[i - 1] if i > 0 else 0.0
+                    if i == len(self.buckets):      # +Inf bucket: report the highest finite bound
+                        result[label] = self.buckets[-1]
+                    else:
+                        result[label] = lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+                    break
+                cumulative += count
+        return result
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_requests_total API requests by endpoint, method and status.",
+            f"# TYPE {ns}_requests_total counter",
+        ]
+        with self._lock:
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                lines.append(f'{ns}_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+            lines.append(f"# HELP {ns}_request_duration_seconds API request latency including body decode.")
+            lines.append(f"# TYPE {ns}_request_duration_seconds histogram")
+            for (endpoint, method), hist in sorted(self._histograms.items()):
+                labels = f'endpoint="{endpoint}",method="{method}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), hist['buckets']):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                    lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"{ns}_request_duration_seconds_sum{{{labels}}} {hist['sum']:.6f}")
+                lines.append(f"{ns}_request_duration_seconds_count{{{labels}}} {hist['count']}")
+
+            lines.append(f"# HELP {ns}_bytes_total Bytes sent and received on the wire.")
+            lines.append(f"# TYPE {ns}_bytes_total counter")
+            for (endpoint, direction), size in sorted(self._bytes.items()):
+                lines.append(f'{ns}_bytes_total{{endpoint="{endpoint}",direction="{direction}"}} {size}')
+
+            lines.append(f"# HELP {ns}_records_total Records returned.")
+            lines.append(f"# TYPE {ns}_records_total counter")
+            for endpoint, count in sorted(self._records.items()):
+                lines.append(f'{ns}_records_total{{endpoint="{endpoint}"}} {count}')
+
+            if self._cache:
+                lines.append(f"# HELP {ns}_cache_requests_total Cache lookups by result.")
+                lines.append(f"# TYPE {ns}_cache_requests_total counter")
+                for (endpoint, result), count in sorted(self._cache.items()):
+                    lines.append(f'{ns}_cache_requests_total{{endpoint="{endpoint}",result="{result}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._histograms.clear()
+            self._bytes.clear()
+            self._records.clear()
+            self._cache.clear()
+
+
+class LoggingHook:
+    """
+    Structured log sink: one JSON log line per request on the 'fundable' logger.
+
+    The fields are also attached to the LogRecord as `fundable_request`, so
+    JSON log formatters can pick them up without parsing the message.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO,
+                 error_level: int = logging.WARNING):
+        self.logger = logger or logging.getLogger('fundable')
+        self.level = level
+        self.error_level = error_level
+
+    def __call__(self, metrics: RequestMetrics):
+        fields = metrics.to_dict()
+        level = self.level if metrics.ok else self.error_level
+        self.logger.log(level, json.dumps(fields, default=str), extra={'fundable_request': fields})
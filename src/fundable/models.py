@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+"""
+Compact typed records for Fundable API objects.
+
+GENERATED by scripts/generate_models.py from openapi/*.yaml — do not edit
+by hand; re-run the generator after updating the specs.
+
+Pass model=True to the FundableClient list/detail methods to receive these
+instead of raw dicts.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from fundable._records import Record, lazy_record, intern_str, intern_tuple
+
+
+class DealDescriptions(Record):
+    """DealDescriptions record (openapi-deals.yaml, inline `deal_descriptions` of Deal)."""
+
+    __slots__ = ('short_description', 'long_description')
+    _fields = ('short_description', 'long_description')
+
+    short_description: Optional[str]
+    long_description: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DealDescriptions':
+        self = cls.__new__(cls)
+        get = data.get
+        self.short_description = get('short_description')
+        self.long_description = get('long_description')
+        return self
+
+
+class Financing(Record):
+    """Financing record (openapi-deals.yaml #/components/schemas/Financing)."""
+
+    __slots__ = ('id', 'type', 'size_usd', 'size_native', 'currency')
+    _fields = ('id', 'type', 'size_usd', 'size_native', 'currency')
+
+    id: Optional[str]
+    type: Optional[str]
+    size_usd: Optional[float]
+    size_native: Optional[float]
+    currency: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Financing':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.type = intern_str(get('type'))
+        self.size_usd = get('size_usd')
+        self.size_native = get('size_native')
+        self.currency = get('currency')
+        return self
+
+
+class Valuation(Record):
+    """Valuation record (openapi-deals.yaml #/components/schemas/Valuation)."""
+
+    __slots__ = ('valuation_currency', 'valuation_usd', 'valuation_native', 'type')
+    _fields = ('valuation_currency', 'valuation_usd', 'valuation_native', 'type')
+
+    valuation_currency: Optional[str]
+    valuation_usd: Optional[float]
+    valuation_native: Optional[float]
+    type: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Valuation':
+        self = cls.__new__(cls)
+        get = data.get
+        self.valuation_currency = get('valuation_currency')
+        self.valuation_usd = get('valuation_usd')
+        self.valuation_native = get('valuation_native')
+        self.type = intern_str(get('type'))
+        return self
+
+
+class DealArticle(Record):
+    """DealArticle record (openapi-deals.yaml #/components/schemas/DealArticle)."""
+
+    __slots__ = ('link', 'date', 'is_primary')
+    _fields = ('link', 'date', 'is_primary')
+
+    link: Optional[str]
+    date: Optional[str]
+    is_primary: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DealArticle':
+        self = cls.__new__(cls)
+        get = data.get
+        self.link = get('link')
+        self.date = get('date')
+        self.is_primary = get('is_primary')
+        return self
+
+
+class Deal(Record):
+    """Deal record (openapi-deals.yaml #/components/schemas/Deal)."""
+
+    __slots__ = ('id', 'round_type', 'extension', 'intermediate', 'pre', 'date', 'created_at', 'total_round_raised', '_deal_descriptions', 'company_id', 'investor_ids', 'angel_investor_ids', '_financings', '_valuation', '_articles')
+    _fields = ('id', 'round_type', 'extension', 'intermediate', 'pre', 'date', 'created_at', 'total_round_raised', 'deal_descriptions', 'company_id', 'investor_ids', 'angel_investor_ids', 'financings', 'valuation', 'articles')
+
+    id: Optional[str]
+    round_type: Optional[str]
+    extension: Optional[bool]
+    intermediate: Optional[str]
+    pre: Optional[bool]
+    date: Optional[str]
+    created_at: Optional[str]
+    total_round_raised: Optional[float]
+    deal_descriptions: Optional[DealDescriptions]
+    company_id: Optional[str]
+    investor_ids: Optional[Tuple[str, ...]]
+    angel_investor_ids: Optional[Tuple[str, ...]]
+    financings: Optional[Tuple[Financing, ...]]
+    valuation: Optional[Valuation]
+    articles: Optional[Tuple[DealArticle, ...]]
+
+    deal_descriptions = lazy_record('_deal_descriptions', DealDescriptions)
+    financings = lazy_record('_financings', Financing, many=True)
+    valuation = lazy_record('_valuation', Valuation)
+    articles = lazy_record('_articles', DealArticle, many=True)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Deal':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.round_type = intern_str(get('round_type'))
+        self.extension = get('extension')
+        self.intermediate = intern_str(get('intermediate'))
+        self.pre = get('pre')
+        self.date = get('date')
+        self.created_at = get('created_at')
+        self.total_round_raised = get('total_round_raised')
+        self._deal_descriptions = get('deal_descriptions')
+        self.company_id = intern_str(get('company_id'))
+        self.investor_ids = intern_tuple(get('investor_ids'))
+        self.angel_investor_ids = intern_tuple(get('angel_investor_ids'))
+        self._financings = get('financings')
+        self._valuation = get('valuation')
+        self._articles = get('articles')
+        return self
+
+
+class LatestDealFinancing(Record):
+    """LatestDealFinancing record (openapi-companies.yaml, inline `financings` of LatestDeal)."""
+
+    __slots__ = ('id', 'type', 'size_usd', 'size_native', 'currency')
+    _fields = ('id', 'type', 'size_usd', 'size_native', 'currency')
+
+    id: Optional[str]
+    type: Optional[str]
+    size_usd: Optional[float]
+    size_native: Optional[float]
+    currency: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatestDealFinancing':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.type = get('type')
+        self.size_usd = get('size_usd')
+        self.size_native = get('size_native')
+        self.currency = get('currency')
+        return self
+
+
+class LatestDeal(Record):
+    """LatestDeal record (openapi-companies.yaml #/components/schemas/LatestDeal)."""
+
+    __slots__ = ('id', 'type', 'total_round_raised', 'date', 'extension', 'pre', 'intermediate', '_description', 'investors', 'angel_investor_ids', '_financings')
+    _fields = ('id', 'type', 'total_round_raised', 'date', 'extension', 'pre', 'intermediate', 'description', 'investors', 'angel_investor_ids', 'financings')
+
+    id: Optional[str]
+    type: Optional[str]
+    total_round_raised: Optional[float]
+    date: Optional[str]
+    extension: Optional[bool]
+    pre: Optional[bool]
+    intermediate: Optional[str]
+    description: Optional[DealDescriptions]
+    investors: Optional[Tuple[str, ...]]
+    angel_investor_ids: Optional[Tuple[str, ...]]
+    financings: Optional[Tuple[LatestDealFinancing, ...]]
+
+    description = lazy_record('_description', DealDescriptions)
+    financings = lazy_record('_financings', LatestDealFinancing, many=True)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatestDeal':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.type = intern_str(get('type'))
+        self.total_round_raised = get('total_round_raised')
+        self.date = get('date')
+        self.extension = get('extension')
+        self.pre = get('pre')
+        self.intermediate = intern_str(get('intermediate'))
+        self._description = get('description')
+        self.investors = intern_tuple(get('investors'))
+        self.angel_investor_ids = intern_tuple(get('angel_investor_ids'))
+        self._financings = get('financings')
+        return self
+
+
+class Company(Record):
+    """Company record (openapi-companies.yaml #/components/schemas/CompanyDetails)."""
+
+    __slots__ = ('id', 'name', 'legal_name', 'guru_permalink', 'domain', 'region', 'short_description', 'long_description', 'num_employees', 'linkedin', 'twitter', 'facebook', 'pitchbook', 'crunchbase', 'address', 'ipo_status', 'num_funding_rounds', 'num_investors', 'total_raised', 'latest_valuation_usd', 'latest_valuation_date', 'industries', 'location', '_latest_deal', 'all_investor_ids', 'similarity')
+    _fields = ('id', 'name', 'legal_name', 'guru_permalink', 'domain', 'region', 'short_description', 'long_description', 'num_employees', 'linkedin', 'twitter', 'facebook', 'pitchbook', 'crunchbase', 'address', 'ipo_status', 'num_funding_rounds', 'num_investors', 'total_raised', 'latest_valuation_usd', 'latest_valuation_date', 'industries', 'location', 'latest_deal', 'all_investor_ids', 'similarity')
+
+    id: Optional[str]
+    name: Optional[str]
+    legal_name: Optional[str]
+    guru_permalink: Optional[str]
+    domain: Optional[str]
+    region: Optional[str]
+    short_description: Optional[str]
+    long_description: Optional[str]
+    num_employees: Optional[str]
+    linkedin: Optional[str]
+    twitter: Optional[str]
+    facebook: Optional[str]
+    pitchbook: Optional[str]
+    crunchbase: Optional[str]
+    address: Optional[str]
+    ipo_status: Optional[str]
+    num_funding_rounds: Optional[int]
+    num_investors: Optional[int]
+    total_raised: Optional[float]
+    latest_valuation_usd: Optional[float]
+    latest_valuation_date: Optional[str]
+    industries: Any
+    location: Any
+    latest_deal: Optional[LatestDeal]
+    all_investor_ids: Optional[Tuple[str, ...]]
+    similarity: Optional[float]
+
+    latest_deal = lazy_record('_latest_deal', LatestDeal)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Company':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.legal_name = get('legal_name')
+        self.guru_permalink = get('guru_permalink')
+        self.domain = get('domain')
+        self.region = get('region')
+        self.short_description = get('short_description')
+        self.long_description = get('long_description')
+        self.num_employees = get('num_employees')
+        self.linkedin = get('linkedin')
+        self.twitter = get('twitter')
+        self.facebook = get('facebook')
+        self.pitchbook = get('pitchbook')
+        self.crunchbase = get('crunchbase')
+        self.address = get('address')
+        self.ipo_status = intern_str(get('ipo_status'))
+        self.num_funding_rounds = get('num_funding_rounds')
+        self.num_investors = get('num_investors')
+        self.total_raised = get('total_raised')
+        self.latest_valuation_usd = get('latest_valuation_usd')
+        self.latest_valuation_date = get('latest_valuation_date')
+        self.industries = get('industries')
+        self.location = get('location')
+        self._latest_deal = get('latest_deal')
+        self.all_investor_ids = intern_tuple(get('all_investor_ids'))
+        self.similarity = get('similarity')
+        return self
+
+
+class LocationInfo(Record):
+    """LocationInfo record (openapi-investors.yaml #/components/schemas/LocationInfo)."""
+
+    __slots__ = ('region', 'country', 'state', 'city')
+    _fields = ('region', 'country', 'state', 'city')
+
+    region: Any
+    country: Any
+    state: Any
+    city: Any
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LocationInfo':
+        self = cls.__new__(cls)
+        get = data.get
+        self.region = get('region')
+        self.country = get('country')
+        self.state = get('state')
+        self.city = get('city')
+        return self
+
+
+class Investor(Record):
+    """Investor record (openapi-investors.yaml #/components/schemas/InvestorListItem)."""
+
+    __slots__ = ('id', 'name', 'total_deal_count', 'lead_deal_count', 'deal_count_last_12_months', 'lead_deal_count_last_12_months', 'most_recent_deal_date', 'guru_permalink', 'domain', 'website', 'linkedin', 'pitchbook', 'crunchbase', 'description', 'legal_name', 'num_employees', 'investment_stage', 'contact_email', 'contact_phone', '_location', 'top_industries', 'top_locations', 'top_round_types', 'filtered_deal_count', 'filtered_lead_count')
+    _fields = ('id', 'name', 'total_deal_count', 'lead_deal_count', 'deal_count_last_12_months', 'lead_deal_count_last_12_months', 'most_recent_deal_date', 'guru_permalink', 'domain', 'website', 'linkedin', 'pitchbook', 'crunchbase', 'description', 'legal_name', 'num_employees', 'investment_stage', 'contact_email', 'contact_phone', 'location', 'top_industries', 'top_locations', 'top_round_types', 'filtered_deal_count', 'filtered_lead_count')
+
+    id: Optional[str]
+    name: Optional[str]
+    total_deal_count: Optional[int]
+    lead_deal_count: Optional[int]
+    deal_count_last_12_months: Optional[int]
+    lead_deal_count_last_12_months: Optional[int]
+    most_recent_deal_date: Optional[str]
+    guru_permalink: Optional[str]
+    domain: Optional[str]
+    website: Optional[str]
+    linkedin: Optional[str]
+    pitchbook: Optional[str]
+    crunchbase: Optional[str]
+    description: Optional[str]
+    legal_name: Optional[str]
+    num_employees: Optional[str]
+    investment_stage: Optional[str]
+    contact_email: Optional[str]
+    contact_phone: Optional[str]
+    location: Optional[LocationInfo]
+    top_industries: Any
+    top_locations: Any
+    top_round_types: Any
+    filtered_deal_count: Optional[int]
+    filtered_lead_count: Optional[int]
+
+    location = lazy_record('_location', LocationInfo)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Investor':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.total_deal_count = get('total_deal_count')
+        self.lead_deal_count = get('lead_deal_count')
+        self.deal_count_last_12_months = get('deal_count_last_12_months')
+        self.lead_deal_count_last_12_months = get('lead_deal_count_last_12_months')
+        self.most_recent_deal_date = get('most_recent_deal_date')
+        self.guru_permalink = get('guru_permalink')
+        self.domain = get('domain')
+        self.website = get('website')
+        self.linkedin = get('linkedin')
+        self.pitchbook = get('pitchbook')
+        self.crunchbase = get('crunchbase')
+        self.description = get('description')
+        self.legal_name = get('legal_name')
+        self.num_employees = get('num_employees')
+        self.investment_stage = get('investment_stage')
+        self.contact_email = get('contact_email')
+        self.contact_phone = get('contact_phone')
+        self._location = get('location')
+        self.top_industries = get('top_industries')
+        self.top_locations = get('top_locations')
+        self.top_round_types = get('top_round_types')
+        self.filtered_deal_count = get('filtered_deal_count')
+        self.filtered_lead_count = get('filtered_lead_count')
+        return self
+
+
+class PersonCurrentCompany(Record):
+    """PersonCurrentCompany record (openapi-people.yaml #/components/schemas/PersonCurrentCompany)."""
+
+    __slots__ = ('id', 'name', 'permalink', 'domain')
+    _fields = ('id', 'name', 'permalink', 'domain')
+
+    id: Optional[str]
+    name: Optional[str]
+    permalink: Optional[str]
+    domain: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PersonCurrentCompany':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.permalink = get('permalink')
+        self.domain = get('domain')
+        return self
+
+
+class EmploymentRecord(Record):
+    """EmploymentRecord record (openapi-people.yaml #/components/schemas/EmploymentRecord)."""
+
+    __slots__ = ('title', 'company_name', 'company_id', 'company_url', 'location', 'description', 'start_date', 'end_date', 'is_current')
+    _fields = ('title', 'company_name', 'company_id', 'company_url', 'location', 'description', 'start_date', 'end_date', 'is_current')
+
+    title: Optional[str]
+    company_name: Optional[str]
+    company_id: Optional[str]
+    company_url: Optional[str]
+    location: Optional[str]
+    description: Optional[str]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    is_current: Optional[bool]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EmploymentRecord':
+        self = cls.__new__(cls)
+        get = data.get
+        self.title = get('title')
+        self.company_name = get('company_name')
+        self.company_id = get('company_id')
+        self.company_url = get('company_url')
+        self.location = get('location')
+        self.description = get('description')
+        self.start_date = get('start_date')
+        self.end_date = get('end_date')
+        self.is_current = get('is_current')
+        return self
+
+
+class EducationRecord(Record):
+    """EducationRecord record (openapi-people.yaml #/components/schemas/EducationRecord)."""
+
+    __slots__ = ('school_name', 'school_id', 'school_url', 'degree', 'field_of_study', 'start_date', 'end_date', 'description')
+    _fields = ('school_name', 'school_id', 'school_url', 'degree', 'field_of_study', 'start_date', 'end_date', 'description')
+
+    school_name: Optional[str]
+    school_id: Optional[str]
+    school_url: Optional[str]
+    degree: Optional[str]
+    field_of_study: Optional[str]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    description: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EducationRecord':
+        self = cls.__new__(cls)
+        get = data.get
+        self.school_name = get('school_name')
+        self.school_id = get('school_id')
+        self.school_url = get('school_url')
+        self.degree = get('degree')
+        self.field_of_study = get('field_of_study')
+        self.start_date = get('start_date')
+        self.end_date = get('end_date')
+        self.description = get('description')
+        return self
+
+
+class Firm(Record):
+    """Firm record (openapi-people.yaml #/components/schemas/Firm)."""
+
+    __slots__ = ('id', 'name', 'permalink', 'domain', 'deal_count', 'last_deal_date')
+    _fields = ('id', 'name', 'permalink', 'domain', 'deal_count', 'last_deal_date')
+
+    id: Optional[str]
+    name: Optional[str]
+    permalink: Optional[str]
+    domain: Optional[str]
+    deal_count: Optional[int]
+    last_deal_date: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Firm':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.permalink = get('permalink')
+        self.domain = get('domain')
+        self.deal_count = get('deal_count')
+        self.last_deal_date = get('last_deal_date')
+        return self
+
+
+class InvestorHighlights(Record):
+    """InvestorHighlights record (openapi-people.yaml #/components/schemas/InvestorHighlights)."""
+
+    __slots__ = ('total_deal_count', 'lead_deal_count', 'deal_count_last_12_months', 'lead_deal_count_last_12_months', 'most_recent_deal_date', 'top_industries', 'top_locations', 'top_round_types')
+    _fields = ('total_deal_count', 'lead_deal_count', 'deal_count_last_12_months', 'lead_deal_count_last_12_months', 'most_recent_deal_date', 'top_industries', 'top_locations', 'top_round_types')
+
+    total_deal_count: Optional[int]
+    lead_deal_count: Optional[int]
+    deal_count_last_12_months: Optional[int]
+    lead_deal_count_last_12_months: Optional[int]
+    most_recent_deal_date: Optional[str]
+    top_industries: Any
+    top_locations: Any
+    top_round_types: Any
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InvestorHighlights':
+        self = cls.__new__(cls)
+        get = data.get
+        self.total_deal_count = get('total_deal_count')
+        self.lead_deal_count = get('lead_deal_count')
+        self.deal_count_last_12_months = get('deal_count_last_12_months')
+        self.lead_deal_count_last_12_months = get('lead_deal_count_last_12_months')
+        self.most_recent_deal_date = get('most_recent_deal_date')
+        self.top_industries = get('top_industries')
+        self.top_locations = get('top_locations')
+        self.top_round_types = get('top_round_types')
+        return self
+
+
+class Person(Record):
+    """Person record (openapi-people.yaml #/components/schemas/PersonSearchResult)."""
+
+    __slots__ = ('id', 'name', 'title', 'linkedin_url', 'crunchbase_url', 'twitter_url', 'location', 'city', 'country_code', 'about', 'is_founder', '_current_company', '_employment_history', '_education_history', 'is_investor', 'is_angel', 'has_led_deal', '_investment_firms', '_investor_highlights', 'filtered_deal_count', 'filtered_lead_count', 'filtered_most_recent_date')
+    _fields = ('id', 'name', 'title', 'linkedin_url', 'crunchbase_url', 'twitter_url', 'location', 'city', 'country_code', 'about', 'is_founder', 'current_company', 'employment_history', 'education_history', 'is_investor', 'is_angel', 'has_led_deal', 'investment_firms', 'investor_highlights', 'filtered_deal_count', 'filtered_lead_count', 'filtered_most_recent_date')
+
+    id: Optional[str]
+    name: Optional[str]
+    title: Optional[str]
+    linkedin_url: Optional[str]
+    crunchbase_url: Optional[str]
+    twitter_url: Optional[str]
+    location: Optional[str]
+    city: Optional[str]
+    country_code: Optional[str]
+    about: Optional[str]
+    is_founder: Optional[bool]
+    current_company: Optional[PersonCurrentCompany]
+    employment_history: Optional[Tuple[EmploymentRecord, ...]]
+    education_history: Optional[Tuple[EducationRecord, ...]]
+    is_investor: Optional[bool]
+    is_angel: Optional[bool]
+    has_led_deal: Optional[bool]
+    investment_firms: Optional[Tuple[Firm, ...]]
+    investor_highlights: Optional[InvestorHighlights]
+    filtered_deal_count: Optional[int]
+    filtered_lead_count: Optional[int]
+    filtered_most_recent_date: Optional[str]
+
+    current_company = lazy_record('_current_company', PersonCurrentCompany)
+    employment_history = lazy_record('_employment_history', EmploymentRecord, many=True)
+    education_history = lazy_record('_education_history', EducationRecord, many=True)
+    investment_firms = lazy_record('_investment_firms', Firm, many=True)
+    investor_highlights = lazy_record('_investor_highlights', InvestorHighlights)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Person':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.title = get('title')
+        self.linkedin_url = get('linkedin_url')
+        self.crunchbase_url = get('crunchbase_url')
+        self.twitter_url = get('twitter_url')
+        self.location = get('location')
+        self.city = get('city')
+        self.country_code = get('country_code')
+        self.about = get('about')
+        self.is_founder = get('is_founder')
+        self._current_company = get('current_company')
+        self._employment_history = get('employment_history')
+        self._education_history = get('education_history')
+        self.is_investor = get('is_investor')
+        self.is_angel = get('is_angel')
+        self.has_led_deal = get('has_led_deal')
+        self._investment_firms = get('investment_firms')
+        self._investor_highlights = get('investor_highlights')
+        self.filtered_deal_count = get('filtered_deal_count')
+        self.filtered_lead_count = get('filtered_lead_count')
+        self.filtered_most_recent_date = get('filtered_most_recent_date')
+        return self
+
+
+__all__ = [
+    "DealDescriptions",
+    "Financing",
+    "Valuation",
+    "DealArticle",
+    "Deal",
+    "LatestDealFinancing",
+    "LatestDeal",
+    "Company",
+    "LocationInfo",
+    "Investor",
+    "PersonCurrentCompany",
+    "EmploymentRecord",
+    "EducationRecord",
+    "Firm",
+    "InvestorHighlights",
+    "Person",
+]
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Page results for FundableClient list endpoints.
+
+The *_page methods (get_deals_page, get_companies_page, ...) return a Page:
+the records plus the response meta, so callers know total_count up front
+and can plan exactly the page requests they need instead of fetching until
+a short page comes back:
+
+    first = client.get_deals_page(deal_start_date='2024-01-01', page_size=500)
+    for page in first.remaining_pages():     # every other page number, for concurrent fetches
+        ...
+
+AdaptivePageSizer picks page sizes per endpoint from observed latency and
+payload size instead of a hand-tuned constant; client.iter_query() uses it
+to choose every page of a scan:
+
+    client = FundableClient(page_sizer=AdaptivePageSizer(target_ms=1500))
+    for deal in client.iter_query(DealQuery(deal_start_date='2024-01-01')):
+        ...
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def page_count(total_count: Optional[int], page_size: Optional[int]) -> Optional[int]:
+    """Number of pages needed for total_count records (None if either is unknown)."""
+    if total_count is None or not page_size:
+        return None
+    return math.ceil(total_count / page_size)
+
+
+class Page:
+    """
+    One page of records from a list endpoint, with its pagination meta.
+
+    Behaves like the list of records (len, iteration, indexing), so it can
+    replace the plain list returned by the non-page methods.
+
+    Attributes:
+        records: Records on this page (dicts, or fundable.models records with model=True)
+        meta: Response meta dict (total_count, page, page_size, credits_used, ...);
+            empty when the request failed in the default 'print' error mode
+    """
+
+    __slots__ = ('records', 'meta')
+
+    def __init__(self, records: List[Any], meta: Optional[Dict[str, Any]] = None):
+        self.records = records
+        self.meta = meta or {}
+
+    @property
+    def total_count(self) -> Optional[int]:
+        return self.meta.get('total_count')
+
+    @property
+    def page(self) -> int:
+        return self.meta.get('page') or 0
+
+    @property
+    def page_size(self) -> Optional[int]:
+        return self.meta.get('page_size')
+
+    @property
+    def num_pages(self) -> Optional[int]:
+        return page_count(self.total_count, self.page_size)
+
+    @property
+    def has_more(self) -> bool:
+        """Whether pages follow this one (falls back to 'page was full' if total_count is unknown)."""
+        num_pages = self.num_pages
+        if num_pages is not None:
+            return self.page + 1 < num_pages
+        return bool(self.page_size) and len(self.records) >= self.page_size
+
+    @property
+    def next_page(self) -> Optional[int]:
+        return self.page + 1 if self.has_more else None
+
+    def remaining_pages(self) -> range:
+        """Page numbers after this one, for planning concurrent fetches (empty if unknown)."""
+        num_pages = self.num_pages
+        if num_pages is None:
+            return range(0)
+        return range(self.page + 1, num_pages)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def __bool__(self) -> bool:
+        return bool(self.records)
+
+    def __repr__(self) -> str:
+        return (f"Page(page={self.page}, records={len(self.records)}, "
+                f"page_size={self.page_size}, total_count={self.total_count})")
+
+
+class _EndpointStats:
+    """Exponentially decayed sums for a least-squares fit of latency against page size."""
+
+    __slots__ = ('weight', 'sum_x', 'sum_y', 'sum_xx', 'sum_xy', 'records', 'bytes', 'largest', 'observations')
+
+    def __init__(self):
+        self.weight = self.sum_x = self.sum_y = self.sum_xx = self.sum_xy = 0.0
+        self.records = self.bytes = 0.0
+        self.largest = 0
+        self.observations = 0
+
+    def add(self, records: int, elapsed_ms: float, payload_bytes: int, decay: float):
+        for name in ('weight', 'sum_x', 'sum_y', 'sum_xx', 'sum_xy', 'records', 'bytes'):
+            setattr(self, name, getattr(self, name) * decay)
+        self.weight += 1
+        self.sum_x += records
+        self.sum_y += elapsed_ms
+        self.sum_xx += records * records
+        self.sum_xy += records * elapsed_ms
+        self.records += records
+        self.bytes += payload_bytes
+        self.largest = max(self.largest, records)
+        self.observations += 1
+
+    def fit(self):
+        """
+        (base_ms, ms_per_record). Until two page sizes have been seen, all
+        time is charged per record, which under- rather than overestimates
+        the size that fits.
+        """
+        mean_x, mean_y = self.sum_x / self.weight, self.sum_y / self.weight
+        variance = self.sum_xx / self.weight - mean_x * mean_x
+        if variance > 1.0:
+            slope = (self.sum_xy / self.weight - mean_x * mean_y) / variance
+            if slope <= 0:
+                return mean_y, 0.0     # latency does not grow with page size
+            base = mean_y - slope * mean_x
+            if base >= 0:
+                return base, slope
+        return 0.0, mean_y / mean_x
+
+
+class AdaptivePageSizer:
+    """
+    Choose page sizes per endpoint that fit a latency and payload budget.
+
+    Register it as a client hook (FundableClient(page_sizer=...) does this).
+    Each successful list response updates the endpoint's fit of latency
+    against page size (base latency + cost per record) and its bytes per
+    record. page_size() then returns the largest size whose predicted
+    latency and payload stay within budget, at most doubling the largest
+    page seen so far.
+
+    Args:
+        target_ms: Per-request latency budget (total_ms: headers, body and decoding)
+        max_bytes: Per-request decoded payload budget
+        min_size: Smallest page size chosen
+        max_size: Largest page size chosen (the API maximum is 500)
+        initial_size: Page size for an endpoint with no observations yet
+        decay: Weight older observations keep per new one (0-1); lower adapts faster
+    """
+
+    def __init__(self, target_ms: float = 2000.0, max_bytes: int = 8_000_000, min_size: int = 25,
+                 max_size: int = 500, initial_size: int = 100, decay: float = 0.8):
+        if not 1 <= min_size <= initial_size <= max_size <= 500:
+            raise ValueError("Need 1 <= min_size <= initial_size <= max_size <= 500")
+        if not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        self.target_ms = target_ms
+        self.max_bytes = max_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+        self.initial_size = initial_size
+        self.decay = decay
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics) -> None:
+        """Hook entry point: record a fundable.metrics.RequestMetrics."""
+        if metrics.ok and metrics.cache != 'hit' and metrics.records and metrics.total_ms is not None:
+            self.observe(metrics.endpoint, metrics.records, metrics.total_ms, metrics.decoded_bytes)
+
+    def observe(self, endpoint: str, records: int, elapsed_ms: float, payload_bytes: int = 0):
+        """Record one page: how many records it held, how long it took and its decoded size."""
+        if records <= 0:
+            return
+        with self._lock:
+            self._stats.setdefault(endpoint, _EndpointStats()).add(records, elapsed_ms, payload_bytes, self.decay)
+
+    def _best_size(self, endpoint: str) -> int:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            return self.initial_size
+        base, per_record = stats.fit()
+        size = self.max_size
+        if per_record > 0:
+            size = min(size, (self.target_ms - base) / per_record)
+        if stats.bytes > 0:
+            size = min(size, self.max_bytes / (stats.bytes / stats.records))
+        size = min(size, 2 * stats.largest)
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    def page_size(self, endpoint: str, offset: int = 0, current: Optional[int] = None) -> int:
+        """
+        Page size for the next request to an endpoint.
+
+        Pages are addressed as page * page_size, so once a scan has read
+        `offset` records the next size must divide offset. The largest such
+        size up to the best one is returned; if none is at least min_size,
+        the scan keeps its current size.
+
+        Args:
+            endpoint: Endpoint label, e.g. '/deals' (fundable.transport.endpoint_label)
+            offset: Records already read by the scan
+            current: The scan's current page size
+        """
+        with self._lock:
+            size = self._best_size(endpoint)
+        if offset:
+            for candidate in range(size, self.min_size - 1, -1):
+                if offset % candidate == 0:
+                    return candidate
+            if current:
+                return current
+        return size
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint fit and the page size currently chosen."""
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._stats.items():
+                base, per_record = stats.fit()
+                result[endpoint] = {
+                    'observations': stats.observations,
+                    'base_ms': round(base, 1),
+                    'ms_per_record': round(per_record, 3),
+                    'bytes_per_record': round(stats.bytes / stats.records) if stats.records else None,
+                    'page_size': self._best_size(endpoint),
+                }
+            return result
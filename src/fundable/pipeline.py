@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Staged, bounded-concurrency enrichment of alert deals.
+
+Enriching alert deals one by one (get_company per deal, get_deals, then
+get_investor per investor) takes a few calls per deal, so examples usually
+stop after 5. Pipeline runs the enrichment as stages connected by bounded
+queues, each with its own worker threads. Every stage collects items into
+batches and resolves a whole batch with one identifier lookup
+(get_companies(company_ids=...), get_deals(deal_ids=...),
+get_investors(investor_ids=...)). Companies, deals and investors are cached
+per run, so an entity shared by several alerts or deals is fetched once:
+
+    enricher = AlertEnricher(client)
+    for item in enricher.enrich_alerts(alert_ids, start_date, end_date):
+        print(item['alert_name'], item['company']['name'], [i['name'] for i in item['investors']])
+"""
+
+import queue
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fundable.concurrency import call_with_retry, shared_limiter
+from fundable.metrics import cache_miss
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+class Stage:
+    """
+    One pipeline step.
+
+    Args:
+        name: Stage name, used in error messages and tracing spans
+        process: Callable(batch) that enriches a list of items in place
+        workers: Threads running this stage
+        batch_size: Maximum items handed to process() at once
+        queue_size: Capacity of the stage's input queue; a full queue blocks
+            the upstream stage, so a slow stage cannot build an unbounded backlog
+    """
+
+    def __init__(self, name: str, process: Callable[[List[Dict[str, Any]]], Any], workers: int = 2,
+                 batch_size: int = 1, queue_size: int = 200):
+        self.name = name
+        self.process = process
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+
+
+class Pipeline:
+    """
+    Run items (dicts) through a sequence of stages.
+
+    A failure in a stage does not stop the pipeline: the error message is
+    appended to each affected item's 'errors' list and the items move on.
+
+    Args:
+        client: FundableClient whose span() parents each stage batch
+        stages: Stages, in order
+        linger: Seconds a worker waits for more items to fill a batch
+    """
+
+    def __init__(self, client, stages: List[Stage], linger: float = 0.05):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.client = client
+        self.stages = stages
+        self.linger = linger
+
+    def _take_batch(self, stage: Stage, inbox: queue.Queue) -> Tuple[List[Dict[str, Any]], bool]:
+        """Block for one item, then gather up to batch_size within the linger time."""
+        item = inbox.get()
+        if item is _DONE:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < stage.batch_size:
+            try:
+                item = inbox.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def run(self, items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Feed items through every stage and yield them as they complete.
+
+        Output order follows completion, not input order. Consume the
+        iterator to the end; the worker threads exit once it is exhausted.
+        If iterating items raises, the items already fed still finish and
+        the exception is re-raised at the end.
+        """
+        inboxes = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        outbox: queue.Queue = queue.Queue()
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+
+        def finish(index: int):
+            # The last worker of a stage to exit passes end-of-stream downstream
+            with lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if not last:
+                return
+            if index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    inboxes[index + 1].put(_DONE)
+            else:
+                outbox.put(_DONE)
+
+        def work(index: int):
+            stage = self.stages[index]
+            forward = inboxes[index + 1].put if index + 1 < len(self.stages) else outbox.put
+            done = False
+            while not done:
+                batch, done = self._take_batch(stage, inboxes[index])
+                if batch:
+                    try:
+                        with self.client.span(f"pipeline.{stage.name}", items=len(batch)):
+                            stage.process(batch)
+                    except Exception as e:
+                        for item in batch:
+                            item.setdefault('errors', []).append(f"{stage.name}: {e}")
+                    for item in batch:
+                        forward(item)
+            finish(index)
+
+        feed_errors: List[BaseException] = []
+
+        def feed():
+            try:
+                for item in items:
+                    inboxes[0].put(item)
+            except BaseException as e:
+                feed_errors.append(e)
+            finally:
+                # Always end the stream, or the stages (and run()) wait forever
+                for _ in range(self.stages[0].workers):
+                    inboxes[0].put(_DONE)
+
+        threads = [threading.Thread(target=feed, name='pipeline-feed', daemon=True)]
+        for index, stage in enumerate(self.stages):
+            threads.extend(threading.Thread(target=work, args=(index,), name=f"pipeline-{stage.name}-{n}", daemon=True)
+                           for n in range(stage.workers))
+        for thread in threads:
+            thread.start()
+
+        while True:
+            item = outbox.get()
+            if item is _DONE:
+                break
+            yield item
+        if feed_errors:
+            raise feed_errors[0]
+
+
+class EntityCache:
+    """
+    Thread-safe ID -> record cache that lets exactly one worker fetch each ID.
+
+    claim() splits IDs into those the caller must fetch and those another
+    worker is already fetching; wait() blocks until the latter are filled.
+    """
+
+    def __init__(self):
+        self.records: Dict[str, Any] = {}
+        self._pending: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, ids: Iterable[str]) -> Tuple[List[str], List[str]]:
+        mine, theirs = [], []
+        with self._lock:
+            for entity_id in dict.fromkeys(ids):
+                if not entity_id or entity_id in self.records:
+                    continue
+                if entity_id in self._pending:
+                    theirs.append(entity_id)
+                else:
+                    self._pending[entity_id] = threading.Event()
+                    mine.append(entity_id)
+        return mine, theirs
+
+    def fill(self, ids: Iterable[str], records: Dict[str, Any]):
+        """Store fetched records; IDs missing from records are cached as None (not found or failed)."""
+        with self._lock:
+            for entity_id in ids:
+                self.records[entity_id] = records.get(entity_id)
+                event = self._pending.pop(entity_id, None)
+                if event is not None:
+                    event.set()
+
+    def wait(self, ids: Iterable[str]):
+        for entity_id in ids:
+            with self._lock:
+                event = self._pending.get(entity_id)
+            if event is not None:
+                event.wait()
+
+    def get(self, entity_id: Optional[str]) -> Any:
+        return self.records.get(entity_id) if entity_id else None
+
+
+class AlertEnricher:
+    """
+    Enrich alert deals with the full company, deal and investor records.
+
+    Each output item is a dict with 'alert_id', 'alert_name', 'deal' (the
+    alert's simplified deal), 'company', 'full_deal', 'investors' (investor
+    records of the deal's firms, leads first when lead_investors is set) and
+    'errors'.
+
+    Args:
+        client: FundableClient (any error_mode; lookups use a raising copy)
+        workers: Worker threads per stage
+        batch_size: Identifiers per batch lookup (max 100)
+        queue_size: Bounded queue capacity between stages
+        lead_investors: Also call get_deal_investors per deal to mark leads
+            ('lead_investor_ids'); this stage cannot be batched
+        rate_limit: Requests per minute across all stages (default: the client's shared rate_limiter)
+        max_retries: Retries per call for 429 / 5xx / transport errors
+    """
+
+    def __init__(self, client, workers: int = 2, batch_size: int = 50, queue_size: int = 200,
+                 lead_investors: bool = False, rate_limit: Optional[int] = None, max_retries: int = 5):
+        if not 1 <= batch_size <= 100:
+            raise ValueError("batch_size must be between 1 and 100")
+        self.client = client
+        self.strict = client.with_error_mode('raise')
+        self.limiter = shared_limiter(client, rate_limit)
+        self.max_retries = max_retries
+        self.batch_size = batch_size
+        self.companies = EntityCache()
+        self.deals = EntityCache()
+        self.investors = EntityCache()
+        self.deal_investors = EntityCache()
+
+        stages = [
+            Stage('companies', self._companies, workers, batch_size, queue_size),
+            Stage('deals', self._deals, workers, batch_size, queue_size),
+            Stage('investors', self._investors, workers, batch_size, queue_size),
+        ]
+        if lead_investors:
+            stages.append(Stage('lead_investors', self._lead_investors, workers * 2, 1, queue_size))
+        self.pipeline = Pipeline(client, stages)
+
+    def _call(self, fn: Callable[[], Any]) -> Any:
+        with cache_miss():
+            return call_with_retry(fn, self.limiter, max_retries=self.max_retries)
+
+    def _batch_lookup(self, cache: EntityCache, ids: List[str], fetch: Callable[[List[str]], List[Dict[str, Any]]],
+                      path: str):
+        mine, theirs = cache.claim(ids)
+        # IDs cached or being fetched by another worker cost this lookup no request
+        hits = len(set(filter(None, ids))) - len(mine)
+        if hits:
+            self.client.record_cache_hit('POST', path, hits)
+        fetched = {}
+        try:
+            # A batch of deals can carry far more investor IDs than one lookup accepts
+            for start in range(0, len(mine), self.batch_size):
+                chunk = mine[start:start + self.batch_size]
+                fetched.update((record['id'], record) for record in self._call(partial(fetch, chunk))
+                               if record.get('id'))
+        finally:
+            # Always release claimed IDs, so other workers never wait forever
+            cache.fill(mine, fetched)
+        cache.wait(theirs)
+
+    def _companies(self, batch: List[Dict[str, Any]]):
+        ids = [item['deal'].get('company_id') for item in batch]
+        self._batch_lookup(self.companies, ids,
+                           lambda chunk: self.strict.get_companies(company_ids=chunk, page_size=len(chunk)),
+                           '/companies')
+        for item in batch:
+            item['company'] = self.companies.get(item['deal'].get('company_id'))
+
+    def _deals(self, batch: List[Dict[str, Any]]):
+        ids = [item['deal'].get('id') for item in batch]
+        self._batch_lookup(self.deals, ids,
+                           lambda chunk: self.strict.get_deals(deal_ids=chunk, page_size=len(chunk)),
+                           '/deals')
+        for item in batch:
+            item['full_deal'] = self.deals.get(item['deal'].get('id'))
+
+    def _investors(self, batch: List[Dict[str, Any]]):
+        ids = [investor_id for item in batch for investor_id in (item['full_deal'] or {}).get('investor_ids') or []]
+        self._batch_lookup(self.investors, ids,
+                           lambda chunk: self.strict.get_investors(investor_ids=chunk, page_size=len(chunk)),
+                           '/investors')
+        for item in batch:
+            investor_ids = (item['full_deal'] or {}).get('investor_ids') or []
+            item['investors'] = [record for record in map(self.investors.get, investor_ids) if record]
+
+    def _lead_investors(self, batch: List[Dict[str, Any]]):
+        for item in batch:
+            deal_id = (item['full_deal'] or {}).get('id')
+            if not deal_id:
+                continue
+            mine, theirs = self.deal_investors.claim([deal_id])
+            if not mine:
+                self.client.record_cache_hit('GET', f"/deals/{deal_id}/investors", 1)
+            investors = []
+            try:
+                if mine:
+                    investors = self._call(lambda: self.strict.get_deal_investors(deal_id))
+            finally:
+                self.deal_investors.fill(mine, {deal_id: investors} if mine else {})
+            self.deal_investors.wait(theirs)
+            leads = [investor['id'] for investor in self.deal_investors.get(deal_id) or []
+                     if investor.get('lead_investor') and investor.get('id')]
+            item['lead_investor_ids'] = leads
+            item['investors'].sort(key=lambda record: record.get('id') not in leads)
+
+    def enrich(self, alerts: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Enrich every deal of the given alerts (the 'alerts' list of a
+        get_alerts / get_alerts_bulk result), yielding items as they finish.
+        """
+        def items():
+            for alert in alerts:
+                for deal in alert.get('deals', []):
+                    yield {'alert_id': alert.get('alertId'), 'alert_name': alert.get('alertName'), 'deal': deal,
+                           'company': None, 'full_deal': None, 'investors': [], 'errors': []}
+
+        return self.pipeline.run(items())
+
+    def enrich_alerts(self, alert_ids: List[str], start_date: str, end_date: str) -> Iterator[Dict[str, Any]]:
+        """Fetch alerts with get_alerts_bulk and enrich all of their deals."""
+        result = self.client.get_alerts_bulk(alert_ids, start_date, end_date, rate_limiter=self.limiter,
+                                             max_retries=self.max_retries)
+        if hasattr(result, 'unwrap'):
+            result = result.unwrap()
+        return self.enrich(result['alerts'])
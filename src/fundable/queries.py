@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Precompiled request bodies for the filter-heavy list endpoints.
+
+get_deals, get_companies and get_investors turn their keyword filters into a
+nested JSON body on every call, and every page of a paginated scan encodes
+the same body again. A query object validates and encodes the body once and
+derives each page's bytes by appending only the page number:
+
+    query = DealQuery(deal_start_date='2024-01-01', industries=['fintech'], page_size=500)
+    for page in range(10):
+        deals = client.run_query(query, page=page)
+
+    q1 = query.with_filters(deal_end_date='2024-03-31')   # queries are immutable
+
+The build_*_body functions are what the client methods use, so a query
+sends exactly the body the matching get_* call would.
+"""
+
+import hashlib
+import inspect
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fundable.models import Company, Deal, Investor
+from fundable.validation import validate_request
+
+
+def build_deals_body(page_size: int = None, sort_by: str = None,
+                     deal_start_date: str = None, deal_end_date: str = None,
+                     company_ids: List[str] = None, industries: List[str] = None,
+                     super_categories: List[str] = None, locations: List[str] = None,
+                     employee_count: List[str] = None, ipo_status: List[str] = None,
+                     total_raised_min: float = None, total_raised_max: float = None,
+                     financing_types: List[Dict[str, Any]] = None,
+                     deal_size_min: float = None, deal_size_max: float = None,
+                     investor_ids: List[str] = None, deal_ids: List[str] = None,
+                     start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+    """Nested POST /deals body for get_deals() filters (without page)."""
+    # Handle legacy parameters
+    if start_date and not deal_start_date:
+        deal_start_date = start_date
+    if end_date and not deal_end_date:
+        deal_end_date = end_date
+
+    # No implicit date window: send exactly the filters the caller specified.
+    # A date-less query is valid — the API returns most-recent deals, bounded by
+    # page_size and sort_by (default 'most_recent_deal').
+    body = {}
+
+    # Identifiers section
+    identifiers = {}
+    if deal_ids:
+        identifiers['deal_ids'] = deal_ids
+    if identifiers:
+        body['identifiers'] = identifiers
+
+    # Deal section
+    deal_filters = {}
+    if financing_types:
+        deal_filters['financing_types'] = financing_types
+    if deal_size_min is not None:
+        deal_filters['size_min'] = deal_size_min
+    if deal_size_max is not None:
+        deal_filters['size_max'] = deal_size_max
+    if deal_start_date:
+        deal_filters['date_start'] = deal_start_date
+    if deal_end_date:
+        deal_filters['date_end'] = deal_end_date
+    if deal_filters:
+        body['deal'] = deal_filters
+
+    # Company section
+    company_filters = {}
+    if locations:
+        company_filters['locations'] = locations
+    if industries:
+        company_filters['industries'] = industries
+    if super_categories:
+        company_filters['super_categories'] = super_categories
+    if employee_count:
+        company_filters['employee_count'] = employee_count
+    if ipo_status:
+        company_filters['ipo_status'] = ipo_status
+    if total_raised_min is not None:
+        company_filters['total_raised_min'] = total_raised_min
+    if total_raised_max is not None:
+        company_filters['total_raised_max'] = total_raised_max
+    if company_ids:
+        company_filters['company_ids'] = company_ids
+    if company_filters:
+        body['company'] = company_filters
+
+    # Investors section
+    investors_filter = {}
+    if investor_ids:
+        investors_filter['investor_ids'] = investor_ids
+    if investors_filter:
+        body['investors'] = investors_filter
+
+    # Page size and sorting
+    body['page_size'] = page_size if page_size is not None else 100
+    body['sort_by'] = sort_by if sort_by else 'most_recent_deal'
+    return body
+
+
+def build_companies_body(page_size: int = None, sort_by: str = None,
+                         search_query: str = None, min_relevance: float = None,
+                         deal_start_date: str = None, deal_end_date: str = None,
+                         company_founded_start: str = None, company_founded_end: str = None,
+                         company_ids: List[str] = None, industries: List[str] = None,
+                         super_categories: List[str] = None, locations: List[str] = None,
+                         employee_count: List[str] = None, ipo_status: List[str] = None,
+                         total_raised_min: float = None, total_raised_max: float = None,
+                         financing_types: List[Dict[str, Any]] = None,
+                         deal_size_min: float = None, deal_size_max: float = None,
+                         investor_ids: List[str] = None, people_ids: List[str] = None,
+                         any_round_investor_ids: List[str] = None, domains: List[str] = None,
+                         linkedins: List[str] = None, crunchbases: List[str] = None) -> Dict[str, Any]:
+    """Nested POST /companies body for get_companies() filters (without page)."""
+    has_batch_filter = domains or linkedins or crunchbases or company_ids
+    # Free-form thesis search and per-person portfolio lookups should not be silently
+    # narrowed to a 1-day window — treat them like batch lookups for date defaulting.
+    skip_date_default = has_batch_filter or search_query or people_ids or any_round_investor_ids
+
+    # Set date defaults if not provided (skip for batch lookups / thesis searches)
+    if not skip_date_default:
+        if not deal_end_date:
+            deal_end_date = datetime.utcnow().strftime("%Y-%m-%d")
+        if not deal_start_date:
+            deal_start_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    body = {}
+
+    # Identifiers section
+    identifiers = {}
+    if company_ids:
+        identifiers['ids'] = company_ids
+    if domains:
+        identifiers['domains'] = domains
+    if linkedins:
+        identifiers['linkedin_urls'] = linkedins
+    if crunchbases:
+        identifiers['crunchbase_urls'] = crunchbases
+    if identifiers:
+        body['identifiers'] = identifiers
+
+    # Company section
+    company_filters = {}
+    if search_query:
+        company_filters['search_query'] = search_query
+    if min_relevance is not None:
+        company_filters['min_relevance'] = min_relevance
+    if locations:
+        company_filters['locations'] = locations
+    if industries:
+        company_filters['industries'] = industries
+    if super_categories:
+        company_filters['super_categories'] = super_categories
+    if employee_count:
+        company_filters['employee_count'] = employee_count
+    if ipo_status:
+        company_filters['ipo_status'] = ipo_status
+    if total_raised_min is not None:
+        company_filters['total_raised_min'] = total_raised_min
+    if total_raised_max is not None:
+        company_filters['total_raised_max'] = total_raised_max
+    if company_founded_start:
+        company_filters['founded_start'] = company_founded_start
+    if company_founded_end:
+        company_filters['founded_end'] = company_founded_end
+    if company_filters:
+        body['company'] = company_filters
+
+    # Latest deal section
+    latest_deal_filters = {}
+    if financing_types:
+        latest_deal_filters['financing_types'] = financing_types
+    if deal_size_min is not None:
+        latest_deal_filters['size_min'] = deal_size_min
+    if deal_size_max is not None:
+        latest_deal_filters['size_max'] = deal_size_max
+    if deal_start_date:
+        latest_deal_filters['date_start'] = deal_start_date
+    if deal_end_date:
+        latest_deal_filters['date_end'] = deal_end_date
+    if investor_ids:
+        latest_deal_filters['investor_ids'] = investor_ids
+    if latest_deal_filters:
+        body['latest_deal'] = latest_deal_filters
+
+    # Investors section (any-round scope)
+    investors_block = {}
+    if people_ids:
+        investors_block['people_ids'] = people_ids
+    if any_round_investor_ids:
+        investors_block['investor_ids'] = any_round_investor_ids
+    if investors_block:
+        body['investors'] = investors_block
+
+    # Page size and sorting
+    body['page_size'] = page_size if page_size is not None else 100
+    if sort_by:
+        body['sort_by'] = sort_by
+    elif not has_batch_filter:
+        body['sort_by'] = 'most_recent_raise'
+    return body
+
+
+def build_investors_body(page_size: int = None, sort_by: str = None,
+                         investor_locations: List[str] = None, investor_employee_count: List[str] = None,
+                         investor_domains: List[str] = None, investor_linkedins: List[str] = None,
+                         investor_crunchbases: List[str] = None, investor_ids: List[str] = None,
+                         industries: List[str] = None, super_categories: List[str] = None,
+                         locations: List[str] = None, employee_count: List[str] = None,
+                         ipo_status: List[str] = None, deal_size_min: float = None,
+                         deal_size_max: float = None, deal_start_date: str = None,
+                         deal_end_date: str = None, financing_types: List[Dict[str, Any]] = None,
+                         company_ids: List[str] = None, min_matching_deals: int = None,
+                         only_lead_deals: bool = None) -> Dict[str, Any]:
+    """Nested POST /investors body for get_investors() filters (without page)."""
+    has_batch_filter = investor_domains or investor_linkedins or investor_crunchbases
+
+    body = {}
+
+    # Identifiers section (investor batch lookup)
+    identifiers = {}
+    if investor_ids:
+        identifiers['ids'] = investor_ids
+    if investor_domains:
+        identifiers['domains'] = investor_domains
+    if investor_linkedins:
+        identifiers['linkedin_urls'] = investor_linkedins
+    if investor_crunchbases:
+        identifiers['crunchbase_urls'] = investor_crunchbases
+    if identifiers:
+        body['identifiers'] = identifiers
+
+    # Investor section
+    investor_filters = {}
+    if investor_locations:
+        investor_filters['locations'] = investor_locations
+    if investor_employee_count:
+        investor_filters['employee_count'] = investor_employee_count
+    if investor_filters:
+        body['investor'] = investor_filters
+
+    # Company investments section (portfolio filters)
+    portfolio_filters = {}
+    if deal_size_min is not None:
+        portfolio_filters['deal_size_min'] = deal_size_min
+    if deal_size_max is not None:
+        portfolio_filters['deal_size_max'] = deal_size_max
+    if deal_start_date:
+        portfolio_filters['deal_start_date'] = deal_start_date
+    if deal_end_date:
+        portfolio_filters['deal_end_date'] = deal_end_date
+    if financing_types:
+        portfolio_filters['financing_types'] = financing_types
+    if locations:
+        portfolio_filters['locations'] = locations
+    if industries:
+        portfolio_filters['industries'] = industries
+    if super_categories:
+        portfolio_filters['super_categories'] = super_categories
+    if employee_count:
+        portfolio_filters['employee_count'] = employee_count
+    if ipo_status:
+        portfolio_filters['ipo_status'] = ipo_status
+    if company_ids:
+        portfolio_filters['company_ids'] = company_ids
+    if min_matching_deals is not None:
+        portfolio_filters['min_matching_deals'] = min_matching_deals
+    if only_lead_deals is not None:
+        portfolio_filters['only_lead_deals'] = only_lead_deals
+    if portfolio_filters:
+        body['company_investments'] = portfolio_filters
+
+    # Page size and sorting
+    body['page_size'] = page_size if page_size is not None else 100
+    if sort_by:
+        body['sort_by'] = sort_by
+    elif not has_batch_filter:
+        body['sort_by'] = 'most_recent_deal'
+    return body
+
+
+class Query:
+    """
+    Immutable, pre-encoded list query. Use DealQuery, CompanyQuery or InvestorQuery.
+
+    Args:
+        **filters: Keyword filters of the matching get_* method (including
+            page_size and sort_by); page is chosen per request
+
+    Raises:
+        ValueError: Unknown filter names, page, or values the OpenAPI spec
+            rejects (see fundable.validation), checked once at construction
+
+    Attributes:
+        filters: The filters the query was built from (None for from_body() queries)
+        body: The request body without page (do not modify)
+    """
+
+    __slots__ = ('filters', 'body', '_encoded', '_prefix')
+
+    # Set by subclasses
+    path: str = ''
+    records_key: str = ''
+    record_type: Any = None
+    _builder: Any = None
+
+    def __init__(self, **filters):
+        allowed = inspect.signature(type(self)._builder).parameters
+        unknown = sorted(set(filters) - set(allowed))
+        if 'page' in unknown:
+            raise ValueError("page is chosen per request; pass it to run_query() instead")
+        if unknown:
+            raise ValueError(f"Unknown {type(self).__name__} filters: {unknown}")
+
+        self._set_body(type(self)._builder(**filters))
+        object.__setattr__(self, 'filters', dict(filters))
+
+    @classmethod
+    def from_body(cls, body: Dict[str, Any]) -> 'Query':
+        """
+        Rebuild a query from a saved body (e.g. a checkpoint), so a resumed job
+        sends exactly the request it started with, including defaults such as
+        CompanyQuery's date window that were filled in when it was built.
+        """
+        if 'page' in body or 'page_size' not in body:
+            raise ValueError("A query body holds page_size and no page")
+        query = cls.__new__(cls)
+        query._set_body(dict(body))
+        object.__setattr__(query, 'filters', None)
+        return query
+
+    def _set_body(self, body: Dict[str, Any]):
+        problems = validate_request(f"POST {self.path}", body)
+        if problems:
+            raise ValueError(f"Invalid {type(self).__name__}: {'; '.join(problems)}")
+        encoded = json.dumps(body, separators=(',', ':')).encode()
+        object.__setattr__(self, 'body', body)
+        object.__setattr__(self, '_encoded', encoded)
+        # The body always holds page_size, so a page is appended as ',"page":N}'
+        object.__setattr__(self, '_prefix', encoded[:-1] + b',"page":')
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use with_filters()")
+
+    def encode(self, page: Optional[int] = None) -> bytes:
+        """The JSON request body for one page (the cached bytes when page is None)."""
+        if page is None:
+            return self._encoded
+        return self._prefix + str(int(page)).encode() + b'}'
+
+    def with_filters(self, **changes) -> 'Query':
+        """A new query with some filters replaced (None removes a filter)."""
+        if self.filters is None:
+            raise ValueError(f"{type(self).__name__}.from_body() queries have no filters to replace")
+        filters = dict(self.filters, **changes)
+        return type(self)(**{key: value for key, value in filters.items() if value is not None})
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the endpoint and encoded body."""
+        return hashlib.sha256(self.path.encode() + self._encoded).hexdigest()[:16]
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other._encoded == self._encoded
+
+    def __hash__(self) -> int:
+        return hash((self.path, self._encoded))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._encoded.decode()})"
+
+
+class DealQuery(Query):
+    """Precompiled get_deals() filters (POST /deals)."""
+
+    __slots__ = ()
+    path = '/deals'
+    records_key = 'deals'
+    record_type = Deal
+    _builder = staticmethod(build_deals_body)
+
+
+class CompanyQuery(Query):
+    """
+    Precompiled get_companies() filters (POST /companies).
+
+    The default 1-day latest-deal window (applied when no date, batch or
+    search filter is given) is fixed when the query is built.
+    """
+
+    __slots__ = ()
+    path = '/companies'
+    records_key = 'companies'
+    record_type = Company
+    _builder = staticmethod(build_companies_body)
+
+
+class InvestorQuery(Query):
+    """Precompiled get_investors() filters (POST /investors)."""
+
+    __slots__ = ()
+    path = '/investors'
+    records_key = 'investors'
+    record_type = Investor
+    _builder = staticmethod(build_investors_body)
+
+
+# get_* method name -> query class, for helpers that page through a named method
+QUERY_TYPES = {
+    'get_deals': DealQuery,
+    'get_companies': CompanyQuery,
+    'get_investors': InvestorQuery,
+}
@@ -0,0 +1,1305 @@
+#!/usr/bin/env python3
+"""
+Request constraints for local validation (see fundable.validation).
+
+GENERATED by scripts/generate_validation.py from openapi/*.yaml — do not
+edit by hand; re-run the generator after updating the specs.
+
+Keys are "METHOD /path"; each value is the constraint tree of the JSON body
+(POST) or of the query parameters (GET).
+"""
+
+RULES = {
+    'GET /alerts': {
+        'type': 'object',
+        'properties': {
+            'alert_ids': {
+                'type': 'array',
+                'items': {
+                    'type': 'string',
+                },
+                'min_items': 1,
+                'max_items': 10,
+            },
+            'start_date': {
+                'type': 'string',
+            },
+            'end_date': {
+                'type': 'string',
+            },
+        },
+    },
+    'GET /alerts/configurations': {
+        'type': 'object',
+        'properties': {},
+    },
+    'GET /company': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+        },
+    },
+    'GET /company/deals': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+        },
+    },
+    'GET /company/search': {
+        'type': 'object',
+        'properties': {
+            'name': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+        },
+    },
+    'POST /companies': {
+        'type': 'object',
+        'properties': {
+            'identifiers': {
+                'type': 'object',
+                'properties': {
+                    'ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'domains': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'linkedin_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'crunchbase_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                },
+            },
+            'company': {
+                'type': 'object',
+                'properties': {
+                    'search_query': {
+                        'type': 'string',
+                    },
+                    'min_relevance': {
+                        'type': 'number',
+                        'minimum': 0,
+                        'maximum': 1,
+                    },
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'industries': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'super_categories': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                    'ipo_status': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['public', 'private'],
+                        },
+                    },
+                    'total_raised_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'total_raised_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                },
+            },
+            'latest_deal': {
+                'type': 'object',
+                'properties': {
+                    'financing_types': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'required': ['type'],
+                            'properties': {
+                                'type': {
+                                    'type': 'string',
+                                    'enum': [
+                                        'SERIES_A',
+                                        'SERIES_B',
+                                        'SERIES_C',
+                                        'SERIES_D',
+                                        'SERIES_E',
+                                        'SERIES_F',
+                                        'SERIES_G',
+                                        'SERIES_H',
+                                        'SERIES_I',
+                                        'SERIES_J',
+                                        'SERIES_K',
+                                        'SERIES_L',
+                                        'SERIES_M',
+                                        'SEED',
+                                        'SAFE',
+                                        'CONVERTIBLE_NOTE',
+                                        'EQUITY',
+                                        'PREFERRED',
+                                        'SECONDARY_MARKET',
+                                        'DEBT_FINANCING',
+                                        'GRANT',
+                                        'NON_EQUITY_ASSISTANCE',
+                                        'CROWDFUNDING',
+                                        'INITIAL_COIN_OFFERING',
+                                        'FUNDING_ROUND',
+                                    ],
+                                },
+                                'pre': {
+                                    'type': 'boolean',
+                                },
+                                'extension': {
+                                    'type': 'boolean',
+                                },
+                            },
+                        },
+                    },
+                    'size_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'size_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'date_start': {
+                        'type': 'string',
+                    },
+                    'date_end': {
+                        'type': 'string',
+                    },
+                    'investor_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                },
+            },
+            'investors': {
+                'type': 'object',
+                'properties': {
+                    'investor_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'people_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                },
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+            'sort_by': {
+                'type': 'string',
+                'enum': [
+                    'most_recent_raise',
+                    'oldest_raise',
+                    'most_recent_founded',
+                    'oldest_founded',
+                    'largest_valuation',
+                    'smallest_valuation',
+                    'largest_total_raise',
+                    'smallest_total_raise',
+                    'most_funding_rounds',
+                    'most_investors',
+                ],
+            },
+        },
+    },
+    'POST /deals': {
+        'type': 'object',
+        'properties': {
+            'identifiers': {
+                'type': 'object',
+                'properties': {
+                    'deal_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                },
+            },
+            'deal': {
+                'type': 'object',
+                'properties': {
+                    'financing_types': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'required': ['type'],
+                            'properties': {
+                                'type': {
+                                    'type': 'string',
+                                    'enum': [
+                                        'SERIES_A',
+                                        'SERIES_B',
+                                        'SERIES_C',
+                                        'SERIES_D',
+                                        'SERIES_E',
+                                        'SERIES_F',
+                                        'SERIES_G',
+                                        'SERIES_H',
+                                        'SERIES_I',
+                                        'SERIES_J',
+                                        'SERIES_K',
+                                        'SERIES_L',
+                                        'SERIES_M',
+                                        'SEED',
+                                        'SAFE',
+                                        'CONVERTIBLE_NOTE',
+                                        'EQUITY',
+                                        'PREFERRED',
+                                        'SECONDARY_MARKET',
+                                        'DEBT_FINANCING',
+                                        'GRANT',
+                                        'NON_EQUITY_ASSISTANCE',
+                                        'CROWDFUNDING',
+                                        'INITIAL_COIN_OFFERING',
+                                        'FUNDING_ROUND',
+                                    ],
+                                },
+                                'pre': {
+                                    'type': 'boolean',
+                                },
+                                'extension': {
+                                    'type': 'boolean',
+                                },
+                            },
+                        },
+                    },
+                    'size_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'size_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'date_start': {
+                        'type': 'string',
+                    },
+                    'date_end': {
+                        'type': 'string',
+                    },
+                    'created_start': {
+                        'type': 'string',
+                    },
+                    'created_end': {
+                        'type': 'string',
+                    },
+                },
+            },
+            'company': {
+                'type': 'object',
+                'properties': {
+                    'company_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'industries': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'super_categories': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                    'ipo_status': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['public', 'private'],
+                        },
+                    },
+                    'total_raised_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'total_raised_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                },
+            },
+            'investors': {
+                'type': 'object',
+                'properties': {
+                    'investor_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'people_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                },
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+            'sort_by': {
+                'type': 'string',
+                'enum': ['most_recent_deal', 'oldest_deal', 'largest_raise', 'smallest_raise'],
+            },
+        },
+    },
+    'POST /investors': {
+        'type': 'object',
+        'properties': {
+            'identifiers': {
+                'type': 'object',
+                'properties': {
+                    'ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'domains': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'linkedin_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'crunchbase_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                },
+            },
+            'investor': {
+                'type': 'object',
+                'properties': {
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                },
+            },
+            'company_investments': {
+                'type': 'object',
+                'properties': {
+                    'company_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'search_query': {
+                        'type': 'string',
+                    },
+                    'min_relevance': {
+                        'type': 'number',
+                        'minimum': 0,
+                        'maximum': 1,
+                    },
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'industries': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'super_categories': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                    'ipo_status': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['public', 'private'],
+                        },
+                    },
+                    'total_raised_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'total_raised_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'financing_types': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'required': ['type'],
+                            'properties': {
+                                'type': {
+                                    'type': 'string',
+                                    'enum': [
+                                        'SERIES_A',
+                                        'SERIES_B',
+                                        'SERIES_C',
+                                        'SERIES_D',
+                                        'SERIES_E',
+                                        'SERIES_F',
+                                        'SERIES_G',
+                                        'SERIES_H',
+                                        'SERIES_I',
+                                        'SERIES_J',
+                                        'SERIES_K',
+                                        'SERIES_L',
+                                        'SERIES_M',
+                                        'SEED',
+                                        'SAFE',
+                                        'CONVERTIBLE_NOTE',
+                                        'EQUITY',
+                                        'PREFERRED',
+                                        'SECONDARY_MARKET',
+                                        'DEBT_FINANCING',
+                                        'GRANT',
+                                        'NON_EQUITY_ASSISTANCE',
+                                        'CROWDFUNDING',
+                                        'INITIAL_COIN_OFFERING',
+                                        'FUNDING_ROUND',
+                                    ],
+                                },
+                                'pre': {
+                                    'type': 'boolean',
+                                },
+                                'extension': {
+                                    'type': 'boolean',
+                                },
+                            },
+                        },
+                    },
+                    'deal_size_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'deal_size_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'deal_start_date': {
+                        'type': 'string',
+                    },
+                    'deal_end_date': {
+                        'type': 'string',
+                    },
+                    'only_lead_deals': {
+                        'type': 'boolean',
+                    },
+                    'min_matching_deals': {
+                        'type': 'integer',
+                        'minimum': 1,
+                    },
+                },
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+            'sort_by': {
+                'type': 'string',
+                'enum': [
+                    'most_recent_deal',
+                    'recent_deals',
+                    'deals_led_ltm',
+                    'total_deals',
+                    'matching_deals',
+                ],
+            },
+        },
+    },
+    'GET /investor': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+        },
+    },
+    'GET /investor/deals': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+        },
+    },
+    'GET /investor/search': {
+        'type': 'object',
+        'properties': {
+            'name': {
+                'type': 'string',
+            },
+            'domain': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+        },
+    },
+    'GET /location/search': {
+        'type': 'object',
+        'properties': {
+            'name': {
+                'type': 'string',
+            },
+            'type': {
+                'type': 'string',
+                'enum': ['CITY', 'STATE', 'REGION', 'COUNTRY'],
+            },
+            'location_type': {
+                'type': 'string',
+                'enum': ['CITY', 'STATE', 'REGION', 'COUNTRY'],
+            },
+        },
+    },
+    'GET /industry/search': {
+        'type': 'object',
+        'properties': {
+            'name': {
+                'type': 'string',
+            },
+            'type': {
+                'type': 'string',
+                'enum': ['INDUSTRY', 'SUPER_CATEGORY'],
+            },
+            'industry_type': {
+                'type': 'string',
+                'enum': ['INDUSTRY', 'SUPER_CATEGORY'],
+            },
+        },
+    },
+    'POST /people': {
+        'type': 'object',
+        'properties': {
+            'person_type': {
+                'type': 'string',
+                'enum': ['company', 'investor', 'any'],
+            },
+            'identifiers': {
+                'type': 'object',
+                'properties': {
+                    'ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'linkedin_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'crunchbase_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                    'twitter_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                        'max_items': 100,
+                    },
+                },
+            },
+            'person': {
+                'type': 'object',
+                'properties': {
+                    'roles': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['founder', 'ceo', 'key_person'],
+                        },
+                    },
+                    'contact_types': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['linkedin', 'email', 'phone', 'twitter'],
+                        },
+                    },
+                    'job_titles': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'education_schools': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'linkedin_companies': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                },
+            },
+            'company': {
+                'type': 'object',
+                'properties': {
+                    'search_query': {
+                        'type': 'string',
+                    },
+                    'min_relevance': {
+                        'type': 'number',
+                        'minimum': 0,
+                        'maximum': 1,
+                    },
+                    'ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'industries': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'super_categories': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                    'ipo_status': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': ['public', 'private', 'acquired', 'delisted'],
+                        },
+                    },
+                    'total_raised_min': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'total_raised_max': {
+                        'type': 'number',
+                        'minimum': 0,
+                    },
+                    'investor_people_ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'latest_deal': {
+                        'type': 'object',
+                        'properties': {
+                            'financing_types': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'required': ['type'],
+                                    'properties': {
+                                        'type': {
+                                            'type': 'string',
+                                            'enum': [
+                                                'SERIES_A',
+                                                'SERIES_B',
+                                                'SERIES_C',
+                                                'SERIES_D',
+                                                'SERIES_E',
+                                                'SERIES_F',
+                                                'SERIES_G',
+                                                'SERIES_H',
+                                                'SERIES_I',
+                                                'SERIES_J',
+                                                'SERIES_K',
+                                                'SERIES_L',
+                                                'SERIES_M',
+                                                'SEED',
+                                                'SAFE',
+                                                'CONVERTIBLE_NOTE',
+                                                'EQUITY',
+                                                'PREFERRED',
+                                                'SECONDARY_MARKET',
+                                                'DEBT_FINANCING',
+                                                'GRANT',
+                                                'NON_EQUITY_ASSISTANCE',
+                                                'CROWDFUNDING',
+                                                'INITIAL_COIN_OFFERING',
+                                                'FUNDING_ROUND',
+                                            ],
+                                        },
+                                        'pre': {
+                                            'type': 'boolean',
+                                        },
+                                        'extension': {
+                                            'type': 'boolean',
+                                        },
+                                    },
+                                },
+                            },
+                            'size_min': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                            'size_max': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                            'date_start': {
+                                'type': 'string',
+                            },
+                            'date_end': {
+                                'type': 'string',
+                            },
+                            'investor_ids': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                },
+                            },
+                            'investor_locations': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'investor': {
+                'type': 'object',
+                'properties': {
+                    'ids': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'domains': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'linkedin_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'crunchbase_urls': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'permalinks': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'locations': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                        },
+                    },
+                    'employee_count': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'string',
+                            'enum': [
+                                '1-10',
+                                '11-50',
+                                '51-100',
+                                '101-250',
+                                '251-500',
+                                '501-1000',
+                                '1001-5000',
+                                '5001-10000',
+                                '10001+',
+                            ],
+                        },
+                    },
+                    'deals': {
+                        'type': 'object',
+                        'properties': {
+                            'search_query': {
+                                'type': 'string',
+                            },
+                            'min_relevance': {
+                                'type': 'number',
+                                'minimum': 0,
+                                'maximum': 1,
+                            },
+                            'investment_type': {
+                                'type': 'string',
+                                'enum': ['all', 'angel', 'institutional'],
+                            },
+                            'only_lead_deals': {
+                                'type': 'boolean',
+                            },
+                            'min_matching_deals': {
+                                'type': 'integer',
+                                'minimum': 1,
+                            },
+                            'financing_types': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'required': ['type'],
+                                    'properties': {
+                                        'type': {
+                                            'type': 'string',
+                                            'enum': [
+                                                'SERIES_A',
+                                                'SERIES_B',
+                                                'SERIES_C',
+                                                'SERIES_D',
+                                                'SERIES_E',
+                                                'SERIES_F',
+                                                'SERIES_G',
+                                                'SERIES_H',
+                                                'SERIES_I',
+                                                'SERIES_J',
+                                                'SERIES_K',
+                                                'SERIES_L',
+                                                'SERIES_M',
+                                                'SEED',
+                                                'SAFE',
+                                                'CONVERTIBLE_NOTE',
+                                                'EQUITY',
+                                                'PREFERRED',
+                                                'SECONDARY_MARKET',
+                                                'DEBT_FINANCING',
+                                                'GRANT',
+                                                'NON_EQUITY_ASSISTANCE',
+                                                'CROWDFUNDING',
+                                                'INITIAL_COIN_OFFERING',
+                                                'FUNDING_ROUND',
+                                            ],
+                                        },
+                                        'pre': {
+                                            'type': 'boolean',
+                                        },
+                                        'extension': {
+                                            'type': 'boolean',
+                                        },
+                                    },
+                                },
+                            },
+                            'size_min': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                            'size_max': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                            'date_start': {
+                                'type': 'string',
+                            },
+                            'date_end': {
+                                'type': 'string',
+                            },
+                            'industries': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                },
+                            },
+                            'super_categories': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                },
+                            },
+                            'portfolio_locations': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                },
+                            },
+                            'portfolio_employee_count': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                    'enum': [
+                                        '1-10',
+                                        '11-50',
+                                        '51-100',
+                                        '101-250',
+                                        '251-500',
+                                        '501-1000',
+                                        '1001-5000',
+                                        '5001-10000',
+                                        '10001+',
+                                    ],
+                                },
+                            },
+                            'ipo_status': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                    'enum': ['public', 'private'],
+                                },
+                            },
+                            'total_raised_min': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                            'total_raised_max': {
+                                'type': 'number',
+                                'minimum': 0,
+                            },
+                        },
+                    },
+                },
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+            'sort_by': {
+                'type': 'string',
+                'enum': [
+                    'most_recent_deal_date',
+                    'total_raised',
+                    'latest_deal_size',
+                    'name',
+                    'total_deal_count',
+                    'deal_count_last_12_months',
+                    'lead_deal_count',
+                    'lead_deal_count_last_12_months',
+                    'filtered_deal_count',
+                ],
+            },
+        },
+    },
+    'GET /person': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+            'twitter': {
+                'type': 'string',
+            },
+        },
+    },
+    'GET /person/deals': {
+        'type': 'object',
+        'properties': {
+            'id': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+            'twitter': {
+                'type': 'string',
+            },
+            'page': {
+                'type': 'integer',
+                'minimum': 0,
+            },
+            'page_size': {
+                'type': 'integer',
+                'minimum': 1,
+                'maximum': 500,
+            },
+        },
+    },
+    'GET /person/search': {
+        'type': 'object',
+        'properties': {
+            'name': {
+                'type': 'string',
+            },
+            'id': {
+                'type': 'string',
+            },
+            'linkedin': {
+                'type': 'string',
+            },
+            'crunchbase': {
+                'type': 'string',
+            },
+            'twitter': {
+                'type': 'string',
+            },
+            'person_type': {
+                'type': 'string',
+                'enum': ['investor', 'company'],
+            },
+        },
+    },
+}
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Bulk resolution of CSV lists (websites, LinkedIn URLs, names) to Fundable IDs.
+
+Looking up a list one search_companies(domain=...) call per row costs one
+round trip per row. BulkResolver streams the CSV in chunks, normalizes each
+row's website and LinkedIn URL, and resolves a whole chunk with a single
+get_companies(domains=..., linkedins=...) (or get_investors(investor_domains=...,
+investor_linkedins=...)) batch lookup. Only the rows the batch lookup misses
+fall back to per-row search calls, which run concurrently under the API
+rate limit. The output is the input CSV plus ID columns:
+
+    resolver = BulkResolver(client, kind='company')
+    summary = resolver.resolve_csv('examples/data/companies_export.csv',
+                                   'output/companies_resolved.csv')
+    # {'rows': 99, 'batch': 91, 'search': 5, 'unmatched': 3, 'errors': 0, ...}
+"""
+
+import csv
+import itertools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fundable.concurrency import RateLimiter, call_with_retry, shared_limiter, submit_in_context
+from fundable.errors import FundableError, NotFound
+
+RESOLVE_KINDS = ['company', 'investor']
+
+# Columns appended to every output row
+OUTPUT_COLUMNS = ['fundable_id', 'fundable_name', 'fundable_match']
+
+# Header names tried, in order, when a column is not given explicitly
+_NAME_COLUMNS = ('Company Name', 'Investor Name', 'Name', 'name', 'company', 'investor')
+_DOMAIN_COLUMNS = ('Website', 'Domain', 'website', 'domain', 'URL', 'url')
+_LINKEDIN_COLUMNS = ('LinkedIn', 'Linkedin', 'LinkedIn URL', 'linkedin', 'linkedin_url')
+
+# Domains / LinkedIn URLs accepted per identifiers list of a batch lookup
+MAX_IDENTIFIERS = 100
+
+_LINKEDIN_PATH = re.compile(r'^/(company|school|showcase)/([^/?#]+)', re.IGNORECASE)
+
+
+def normalize_domain(value: Optional[str]) -> Optional[str]:
+    """
+    Reduce a website or domain to its bare host name.
+
+    'https://www.AresMgmt.com/about' -> 'aresmgmt.com'. Returns None for blanks.
+    """
+    value = (value or '').strip().lower()
+    if not value:
+        return None
+    if '//' not in value:
+        value = f"//{value}"
+    host = urlsplit(value).hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    host = host.rstrip('.')
+    return host if '.' in host else None
+
+
+def normalize_linkedin(value: Optional[str]) -> Optional[str]:
+    """
+    Canonicalize a LinkedIn company page URL.
+
+    'linkedin.com/company/Stripe/about/' -> 'https://www.linkedin.com/company/stripe'.
+    Returns None for blanks and non-company URLs.
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    if '//' not in value:
+        value = f"//{value}"
+    parts = urlsplit(value)
+    if not (parts.hostname or '').endswith('linkedin.com'):
+        return None
+    match = _LINKEDIN_PATH.match(parts.path)
+    if not match:
+        return None
+    return f"https://www.linkedin.com/{match.group(1).lower()}/{match.group(2).lower()}"
+
+
+def _normalize_name(value: Optional[str]) -> str:
+    return re.sub(r'[^a-z0-9]+', '', (value or '').casefold())
+
+
+def _pick_column(fieldnames: List[str], candidates: Tuple[str, ...]) -> Optional[str]:
+    for name in candidates:
+        if name in fieldnames:
+            return name
+    return None
+
+
+class BulkResolver:
+    """
+    Resolve rows of websites / LinkedIn URLs / names to company or investor IDs.
+
+    Each chunk of rows is resolved with one batch lookup. Rows it misses are
+    searched one by one, concurrently: by domain, then LinkedIn URL, then (if
+    name_fallback) by name. A search only counts as a match when the top
+    result carries the same normalized domain / LinkedIn URL, or for name
+    searches the same name ignoring case and punctuation.
+
+    Args:
+        client: FundableClient (any error_mode; the resolver uses a raising copy)
+        kind: 'company' (get_companies / search_companies) or 'investor'
+            (get_investors / search_investors)
+        chunk_size: Rows per batch lookup (max 100, the API's identifier limit)
+        workers: Concurrent fallback searches
+        rate_limit: Requests per minute across all workers (default: the client's shared rate_limiter)
+        max_retries: Retries per request for 429 / 5xx / transport errors
+        name_fallback: Search by name when the domain and LinkedIn URL miss
+    """
+
+    def __init__(self, client, kind: str = 'company', chunk_size: int = 100, workers: int = 4,
+                 rate_limit: Optional[int] = None, max_retries: int = 5, name_fallback: bool = True):
+        if kind not in RESOLVE_KINDS:
+            raise ValueError(f"kind must be one of: {RESOLVE_KINDS}")
+        if not 1 <= chunk_size <= MAX_IDENTIFIERS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_IDENTIFIERS}")
+        self.client = client
+        self.kind = kind
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.name_fallback = name_fallback
+        # Normalized domain / LinkedIn URL -> record, shared across chunks so repeats cost nothing
+        self._by_domain: Dict[str, Dict[str, Any]] = {}
+        self._by_linkedin: Dict[str, Dict[str, Any]] = {}
+
+    def _index(self, record: Dict[str, Any]):
+        domain = normalize_domain(record.get('domain') or record.get('website'))
+        if domain:
+            self._by_domain.setdefault(domain, record)
+        linkedin = normalize_linkedin(record.get('linkedin'))
+        if linkedin:
+            self._by_linkedin.setdefault(linkedin, record)
+
+    def _lookup(self, domain: Optional[str], linkedin: Optional[str]) -> Tuple[Optional[Dict[str, Any]], str]:
+        if domain and domain in self._by_domain:
+            return self._by_domain[domain], 'domain'
+        if linkedin and linkedin in self._by_linkedin:
+            return self._by_linkedin[linkedin], 'linkedin'
+        return None, 'unmatched'
+
+    @staticmethod
+    def _same(field: str, record: Dict[str, Any], value: str) -> bool:
+        """Whether a search result really is the row (search ranks by relevance, not equality)."""
+        if field == 'name':
+            return _normalize_name(record.get('name')) == _normalize_name(value)
+        if field == 'domain':
+            found = normalize_domain(record.get('domain') or record.get('website'))
+        else:
+            found = normalize_linkedin(record.get('linkedin'))
+        # A result without the identifier cannot confirm the row
+        return found == value
+
+    def _batch(self, client, limiter: RateLimiter, domains: List[str], linkedins: List[str]):
+        """Fetch every record matching any of the identifiers and index it."""
+        if not domains and not linkedins:
+            return
+        if self.kind == 'company':
+            fetch, query = client.get_companies_page, {'domains': domains, 'linkedins': linkedins}
+        else:
+            fetch, query = client.get_investors_page, {'investor_domains': domains, 'investor_linkedins': linkedins}
+        query = {key: value for key, value in query.items() if value}
+        # Each identifier matches at most one record, so a page this size holds every match
+        page_size = len(domains) + len(linkedins)
+        page = call_with_retry(lambda: fetch(page=0, page_size=page_size, **query),
+                               limiter, max_retries=self.max_retries)
+        for record in page.records:
+            self._index(record)
+
+    def _search(self, client, limiter: RateLimiter, row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Per-row fallback: search by domain, LinkedIn URL, then name."""
+        search = client.search_companies if self.kind == 'company' else client.search_investors
+        attempts = [('domain', row['domain']), ('linkedin', row['linkedin'])]
+        if self.name_fallback:
+            attempts.append(('name', row['name']))
+
+        for field, value in attempts:
+            if not value:
+                continue
+            try:
+                results = call_with_retry(lambda: search(**{field: value}), limiter, max_retries=self.max_retries)
+            except NotFound:
+                continue
+            if not results:
+                continue
+            best = results[0]
+            if not self._same(field, best, value):
+                continue
+            self._index(best)
+            return best, f"search:{field}"
+        return None, 'unmatched'
+
+    def resolve_rows(self, rows: Iterable[Dict[str, Any]], name_column: Optional[str] = None,
+                     domain_column: Optional[str] = None,
+                     linkedin_column: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Resolve an iterable of row dicts, yielding each row (in input order)
+        with fundable_id, fundable_name and fundable_match added.
+
+        fundable_match is 'domain' or 'linkedin' for batch matches,
+        'search:domain', 'search:linkedin' or 'search:name' for fallback
+        matches, 'unmatched', or 'error' when a fallback search failed after
+        all retries.
+
+        Args:
+            rows: Row dicts, e.g. from csv.DictReader
+            name_column: Key holding the name
+            domain_column: Key holding the website or domain
+            linkedin_column: Key holding the LinkedIn URL
+
+        Raises:
+            fundable.errors.FundableError: a batch lookup failed after all retries
+        """
+        if not (name_column or domain_column or linkedin_column):
+            raise ValueError("At least one of name_column, domain_column or linkedin_column is required")
+
+        client = self.client.with_error_mode('raise')
+        limiter = shared_limiter(self.client, self.rate_limit)
+        rows = iter(rows)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                chunk = list(itertools.islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                keys = [{
+                    'name': (row.get(name_column) or '').strip() if name_column else '',
+                    'domain': normalize_domain(row.get(domain_column)) if domain_column else None,
+                    'linkedin': normalize_linkedin(row.get(linkedin_column)) if linkedin_column else None,
+                } for row in chunk]
+
+                domains = sorted({key['domain'] for key in keys if key['domain'] and key['domain'] not in self._by_domain})
+                linkedins = sorted({key['linkedin'] for key in keys
+                                    if key['linkedin'] and key['linkedin'] not in self._by_linkedin})
+                with client.span('resolve.batch', kind=self.kind, rows=len(chunk),
+                                 domains=len(domains), linkedins=len(linkedins)):
+                    self._batch(client, limiter, domains, linkedins)
+
+                matches = [self._lookup(key['domain'], key['linkedin']) for key in keys]
+                fallbacks = {
+                    index: submit_in_context(executor, self._search, client, limiter, key)
+                    for index, (key, (record, _)) in enumerate(zip(keys, matches))
+                    if record is None and (key['domain'] or key['linkedin'] or (self.name_fallback and key['name']))
+                }
+                for index, future in fallbacks.items():
+                    try:
+                        matches[index] = future.result()
+                    except FundableError as e:
+                        print(f"Error resolving row {keys[index]['name'] or keys[index]['domain']}: {e}")
+                        matches[index] = (None, 'error')
+
+                for row, (record, matched_by) in zip(chunk, matches):
+                    record = record or {}
+                    yield dict(row, fundable_id=record.get('id', ''), fundable_name=record.get('name', ''),
+                               fundable_match=matched_by)
+
+    def resolve_csv(self, input_path: str, output_path: str, name_column: Optional[str] = None,
+                    domain_column: Optional[str] = None, linkedin_column: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Resolve a CSV file and write it back out with OUTPUT_COLUMNS appended.
+
+        Columns are auto-detected from common headers ('Company Name' / 'Name',
+        'Website' / 'Domain', 'LinkedIn') unless given. Rows are streamed, so
+        the input can be arbitrarily large.
+
+        Returns:
+            Summary dict: rows, batch (matched by batch lookup), search (matched
+            by fallback search), unmatched, errors, elapsed_s
+        """
+        summary = {'rows': 0, 'batch': 0, 'search': 0, 'unmatched': 0, 'errors': 0}
+        started = time.perf_counter()
+
+        with open(input_path, newline='') as f_in:
+            reader = csv.DictReader(f_in)
+            fieldnames = list(reader.fieldnames or [])
+            name_column = name_column or _pick_column(fieldnames, _NAME_COLUMNS)
+            domain_column = domain_column or _pick_column(fieldnames, _DOMAIN_COLUMNS)
+            linkedin_column = linkedin_column or _pick_column(fieldnames, _LINKEDIN_COLUMNS)
+
+            with open(output_path, 'w', newline='') as f_out, \
+                    self.client.span('bulk_resolve', kind=self.kind, input=input_path):
+                writer = csv.DictWriter(f_out, fieldnames=fieldnames + OUTPUT_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                for row in self.resolve_rows(reader, name_column, domain_column, linkedin_column):
+                    writer.writerow(row)
+                    summary['rows'] += 1
+                    match = row['fundable_match']
+                    if match in ('domain', 'linkedin'):
+                        summary['batch'] += 1
+                    elif match.startswith('search:'):
+                        summary['search'] += 1
+                    elif match == 'error':
+                        summary['errors'] += 1
+                    else:
+                        summary['unmatched'] += 1
+
+        summary['elapsed_s'] = round(time.perf_counter() - started, 2)
+        return summary
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Concurrent on-thesis portfolio ranking for many people.
+
+Checking whether an angel's portfolio fits a thesis takes one
+get_companies(search_query=thesis, people_ids=[person_id]) call per person,
+which is the slowest step of angel discovery when run serially. ThesisRanker
+runs those calls for many people concurrently under one shared rate limit,
+caches results by (thesis, person_id), and yields each person's ranked
+portfolio as soon as their call finishes:
+
+    ranker = ThesisRanker(client, 'AI infrastructure for developers')
+    for result in ranker.scan(person_ids):
+        print(result['person_id'], result['score'], [c['name'] for c in result['companies']])
+
+    ranked = ranker.rank(person_ids)    # every person, best fit first
+
+Repeated scans (and other rankers sharing the same cache) reuse cached
+results instead of calling the API again.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fundable.concurrency import call_with_retry, shared_limiter, submit_in_context
+from fundable.metrics import cache_miss
+
+
+def _thesis_key(thesis: str) -> str:
+    return ' '.join(thesis.lower().split())
+
+
+def _relevance(company: Dict[str, Any]) -> float:
+    score = company.get('relevance_score')
+    return float(score) if isinstance(score, (int, float)) else 0.0
+
+
+class ThesisCache:
+    """
+    Thread-safe (thesis, person_id) -> on-thesis companies cache.
+
+    Theses are compared case- and whitespace-insensitively. Share one cache
+    between rankers that use the same min_relevance and page_size.
+    """
+
+    def __init__(self):
+        self._results: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, thesis: str, person_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            return self._results.get((_thesis_key(thesis), person_id))
+
+    def put(self, thesis: str, person_id: str, companies: List[Dict[str, Any]]):
+        with self._lock:
+            self._results[(_thesis_key(thesis), person_id)] = companies
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class ThesisRanker:
+    """
+    Rank people by how well their portfolio companies fit a thesis.
+
+    Each result is a dict with 'person_id', 'companies' (on-thesis portfolio
+    companies, most relevant first), 'score' (sum of the companies'
+    relevance scores, so both fit and breadth count), 'cached' and 'error'
+    (None, or the message of a call that failed after retries; failures are
+    not cached).
+
+    Args:
+        client: FundableClient (any error_mode; calls use a raising copy)
+        thesis: Natural-language thesis passed as search_query
+        min_relevance: Minimum relevance score of a portfolio company
+        page_size: Top on-thesis companies kept per person
+        workers: Calls in flight at once
+        rate_limit: Requests per minute, shared by all workers (default: the client's shared rate_limiter)
+        max_retries: Retries per call for 429 / 5xx / transport errors
+        cache: ThesisCache to share between rankers (default: a new one)
+    """
+
+    def __init__(self, client, thesis: str, min_relevance: float = 0.1, page_size: int = 5, workers: int = 8,
+                 rate_limit: Optional[int] = None, max_retries: int = 5, cache: Optional[ThesisCache] = None):
+        if not thesis or not thesis.strip():
+            raise ValueError("thesis must be a non-empty string")
+        self.client = client
+        self.strict = client.with_error_mode('raise')
+        self.thesis = thesis
+        self.min_relevance = min_relevance
+        self.page_size = page_size
+        self.workers = max(1, workers)
+        self.limiter = shared_limiter(client, rate_limit)
+        self.max_retries = max_retries
+        self.cache = cache if cache is not None else ThesisCache()
+
+    def _result(self, person_id: str, companies: List[Dict[str, Any]], cached: bool,
+                error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            'person_id': person_id,
+            'companies': companies,
+            'score': round(sum(_relevance(company) for company in companies), 4),
+            'cached': cached,
+            'error': error,
+        }
+
+    def _fetch(self, person_id: str) -> Dict[str, Any]:
+        with self.client.span('thesis_person', person_id=person_id), cache_miss():
+            companies = call_with_retry(
+                lambda: self.strict.get_companies(search_query=self.thesis, min_relevance=self.min_relevance,
+                                                  people_ids=[person_id], page_size=self.page_size),
+                self.limiter, max_retries=self.max_retries)
+        companies = sorted(companies, key=_relevance, reverse=True)
+        self.cache.put(self.thesis, person_id, companies)
+        return self._result(person_id, companies, cached=False)
+
+    def scan(self, person_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one result per person as each finishes.
+
+        Cached people are yielded first, then the rest in completion order.
+        Duplicate and empty IDs are skipped.
+        """
+        pending = []
+        for person_id in dict.fromkeys(person_id for person_id in person_ids if person_id):
+            companies = self.cache.get(self.thesis, person_id)
+            if companies is None:
+                pending.append(person_id)
+            else:
+                self.client.record_cache_hit('POST', '/companies', len(companies))
+                yield self._result(person_id, companies, cached=True)
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+            futures = {submit_in_context(executor, self._fetch, person_id): person_id for person_id in pending}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield self._result(futures[future], [], cached=False, error=str(e))
+
+    def rank(self, person_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Scan every person and return the results sorted by score, best first."""
+        with self.client.span('thesis_rank', thesis=self.thesis):
+            results = list(self.scan(person_ids))
+        return sorted(results, key=lambda result: result['score'], reverse=True)
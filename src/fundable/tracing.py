@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Lightweight OpenTelemetry-style tracing for multi-call workflows.
+
+Pass a Tracer to FundableClient(tracer=...) and every API call becomes a
+span, parented to whatever span is active in the calling code. Higher-level
+helpers open their own spans with client.span(...) (a no-op when tracing is
+off), so a slow fan-out stage shows up as the parent of many slow calls:
+
+    tracer = Tracer(FileSpanExporter('trace.jsonl'))
+    client = FundableClient(tracer=tracer)
+    with client.span('enrich_people', query='angels'):
+        for person in client.search_people(...):
+            with client.span('enrich_person', person_id=person['id']):
+                client.get_person(person['id'])
+
+Spans are written one JSON object per line, with OTLP-style field names.
+Summarize a trace file per stage with:
+
+    python scripts/summarize_trace.py trace.jsonl
+
+The active span is tracked with contextvars, so it follows async tasks; code
+that fans out to threads should run work under contextvars.copy_context()
+to keep parents attached.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('fundable_current_span', default=None)
+
+# Attribute values must be primitives or lists of primitives
+_PRIMITIVES = (str, bool, int, float)
+
+
+def _attribute_value(value: Any) -> Any:
+    if value is None or isinstance(value, _PRIMITIVES):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(v, _PRIMITIVES) for v in value):
+        return list(value[:20]) if len(value) <= 20 else list(value[:20]) + [f"... {len(value)} total"]
+    text = json.dumps(value, default=str)
+    return text if len(text) <= 200 else text[:197] + '...'
+
+
+def request_attributes(params: Optional[Dict[str, Any]], body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Span attributes for an API request: page info plus each filter (`fundable.filter.deal.size_min`, ...)."""
+    attributes: Dict[str, Any] = {}
+    for source in (params, body):
+        if not isinstance(source, dict):
+            continue
+        for key, value in source.items():
+            if key in ('page', 'page_size', 'sort_by'):
+                attributes[f"fundable.{key}"] = value
+            elif isinstance(value, dict):
+                for field, inner in value.items():
+                    attributes[f"fundable.filter.{key}.{field}"] = _attribute_value(inner)
+            elif value is not None:
+                attributes[f"fundable.filter.{key}"] = _attribute_value(value)
+    return attributes
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    def __init__(self, tracer: 'Tracer', name: str, parent: Optional['Span'] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = {}
+        self.status = 'UNSET'
+        self.status_message: Optional[str] = None
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        if attributes:
+            self.set_attributes(attributes)
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = _attribute_value(value)
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        """Set 'OK' or 'ERROR' (with an optional message)."""
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException):
+        self.set_status('ERROR', f"{type(exc).__name__}: {exc}")
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return (self.end_time - self.start_time) / 1e6 if self.end_time else None
+
+    def end(self):
+        if self.end_time is not None:
+            return
+        self.end_time = time.time_ns()
+        self.tracer._export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_span_id': self.parent_span_id,
+            'start_time_unix_nano': self.start_time,
+            'end_time_unix_nano': self.end_time,
+            'duration_ms': self.duration_ms,
+            'attributes': self.attributes,
+            'status': {'code': self.status, 'message': self.status_message},
+            'resource': {'service.name': self.tracer.service_name},
+        }
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, duration_ms={self.duration_ms})"
+
+
+class _NoopSpan:
+    """Stand-in yielded by client.span() when tracing is off."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        pass
+
+    def record_exception(self, exc: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter.
+
+    Args:
+        exporter: Object with an export(span) method (FileSpanExporter,
+            InMemorySpanExporter), or None to discard spans
+        service_name: Recorded as resource `service.name` on each span
+    """
+
+    def __init__(self, exporter: Any = None, service_name: str = 'fundable-client'):
+        self.exporter = exporter
+        self.service_name = service_name
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None,
+                   parent: Optional[Span] = None) -> Span:
+        """Start a span without activating it (the caller must call end())."""
+        return Span(self, name, parent or _current_span.get(), attributes)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """Start a span, make it the active parent for the block, and end it afterwards."""
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def traced(self, name: Optional[str] = None):
+        """Decorator wrapping each call of a function in a span."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name or fn.__qualname__):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    def _export(self, span: Span):
+        if self.exporter is not None:
+            try:
+                self.exporter.export(span)
+            except Exception as e:
+                print(f"⚠️  Failed to export span {span.name!r}: {e}")
+
+
+class FileSpanExporter:
+    """Append finished spans to a JSON Lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+
+
+class InMemorySpanExporter:
+    """Keep finished spans in a list (handy in notebooks)."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate spans by name: count, total and self time (total minus child time).
+
+    Returns:
+        One dict per span name, slowest total first
+    """
+    child_ms: Dict[str, float] = {}
+    for span in spans:
+        parent = span.get('parent_span_id')
+        if parent:
+            child_ms[parent] = child_ms.get(parent, 0.0) + (span.get('duration_ms') or 0.0)
+
+    stages: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        duration = span.get('duration_ms') or 0.0
+        stage = stages.setdefault(span['name'], {
+            'name': span['name'], 'count': 0, 'total_ms': 0.0, 'self_ms': 0.0, 'max_ms': 0.0, 'errors': 0,
+        })
+        stage['count'] += 1
+        stage['total_ms'] += duration
+        stage['self_ms'] += max(0.0, duration - child_ms.get(span['span_id'], 0.0))
+        stage['max_ms'] = max(stage['max_ms'], duration)
+        if (span.get('status') or {}).get('code') == 'ERROR':
+            stage['errors'] += 1
+    return sorted(stages.values(), key=lambda s: s['total_ms'], reverse=True)
+
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+HTTP transport helpers: compression negotiation and transfer accounting.
+
+urllib3 decompresses response bodies incrementally as they are read, for
+every encoding it has a decoder for (gzip/deflate always, br with brotli or
+brotlicffi installed, zstd with zstandard installed on urllib3 2.x). The
+client advertises exactly that set, best ratio first, and records wire vs
+decoded bytes per endpoint so the savings are measurable.
+"""
+
+import re
+import threading
+from typing import Dict, Any, List
+
+import requests
+
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ENCODINGS
+except ImportError:  # pragma: no cover - very old urllib3
+    _URLLIB3_ENCODINGS = 'gzip,deflate'
+
+# Best compression ratio first
+_ENCODING_PREFERENCE = ['zstd', 'br', 'gzip', 'deflate']
+
+_ID_SEGMENT = re.compile(r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+
+
+def supported_encodings() -> List[str]:
+    """Content encodings urllib3 can decode in this environment, best first."""
+    available = {enc.strip() for enc in _URLLIB3_ENCODINGS.split(',') if enc.strip()}
+    return [enc for enc in _ENCODING_PREFERENCE if enc in available]
+
+
+def accept_encoding_header() -> str:
+    """Accept-Encoding value with quality weights reflecting our preference order."""
+    encodings = supported_encodings()
+    weighted = []
+    for i, enc in enumerate(encodings):
+        weighted.append(enc if i == 0 else f"{enc};q={1 - i * 0.1:.1f}")
+    return ', '.join(weighted)
+
+
+def endpoint_label(path: str) -> str:
+    """Collapse UUID path segments so per-endpoint stats aggregate (/deals/{id})."""
+    return _ID_SEGMENT.sub('/{id}', path)
+
+
+class TransferStats:
+    """Thread-safe per-endpoint counters of wire (compressed) vs decoded bytes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, path: str, response: requests.Response) -> Dict[str, Any]:
+        """
+        Record one response.
+
+        Returns:
+            Dict with endpoint, encoding, wire_bytes and decoded_bytes for this response
+        """
+        decoded = len(response.content)
+        wire = decoded
+        raw = getattr(response, 'raw', None)
+        if raw is not None and hasattr(raw, 'tell'):
+            try:
+                wire = raw.tell() or decoded
+            except (OSError, ValueError):
+                pass
+        encoding = response.headers.get('Content-Encoding', 'identity').lower()
+
+        endpoint = endpoint_label(path)
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {
+                'requests': 0, 'wire_bytes': 0, 'decoded_bytes': 0, 'encodings': {},
+            })
+            stats['requests'] += 1
+            stats['wire_bytes'] += wire
+            stats['decoded_bytes'] += decoded
+            stats['encodings'][encoding] = stats['encodings'].get(encoding, 0) + 1
+
+        return {'endpoint': endpoint, 'encoding': encoding, 'wire_bytes': wire, 'decoded_bytes': decoded}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of per-endpoint stats, including the compression ratio."""
+        with self._lock:
+            snapshot = {endpoint: dict(stats, encodings=dict(stats['encodings']))
+                        for endpoint, stats in self._stats.items()}
+        for stats in snapshot.values():
+            wire = stats['wire_bytes']
+            stats['compression_ratio'] = round(stats['decoded_bytes'] / wire, 2) if wire else None
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
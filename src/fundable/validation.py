@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Local request validation against the OpenAPI specs.
+
+A bad filter value (an unknown employee_count bucket, a page_size of 1000,
+eleven alert IDs) otherwise comes back as a 400 only after a round trip,
+and in batch jobs every such request still costs time and quota. The
+constraints in fundable.request_rules (generated from openapi/*.yaml by
+scripts/generate_validation.py) are compiled once at import, and
+FundableClient checks get_deals, get_companies, get_investors,
+search_people and get_alerts requests against them before sending:
+
+    client.get_deals(employee_count=['11-49'])
+    # Error fetching deals: Invalid request: company.employee_count[0]: '11-49' is not one of
+    # '1-10', '11-50', ... (POST /deals)
+
+    problems = validate_request('POST /deals', body)    # [] when valid
+
+Only the constraints the specs declare are checked; unknown keys pass
+through. Pass FundableClient(validate=False) to skip the checks.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fundable.errors import ValidationError
+from fundable.request_rules import RULES
+
+_TYPES = {
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'array': (list, tuple),
+    'object': dict,
+}
+
+
+def _compile(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve type names to classes and enums to frozensets."""
+    compiled = dict(node)
+    if 'type' in node:
+        compiled['type'] = (node['type'], _TYPES.get(node['type'], object))
+    if 'enum' in node:
+        compiled['enum'] = (frozenset(node['enum']), node['enum'])
+    if 'items' in node:
+        compiled['items'] = _compile(node['items'])
+    if 'properties' in node:
+        compiled['properties'] = {field: _compile(child) for field, child in node['properties'].items()}
+    return compiled
+
+
+_COMPILED = {endpoint: _compile(node) for endpoint, node in RULES.items()}
+
+
+def _check(node: Dict[str, Any], value: Any, where: str, problems: List[str]):
+    kind = node.get('type')
+    if kind is not None:
+        name, expected = kind
+        # bool is an int subclass, but not a valid integer/number
+        if not isinstance(value, expected) or (isinstance(value, bool) and name in ('integer', 'number')):
+            problems.append(f"{where}: expected {name}, got {type(value).__name__}")
+            return
+
+    enum = node.get('enum')
+    if enum is not None and value not in enum[0]:
+        problems.append(f"{where}: {value!r} is not one of {', '.join(map(repr, enum[1]))}")
+    if 'minimum' in node and value < node['minimum']:
+        problems.append(f"{where}: {value!r} is below the minimum of {node['minimum']}")
+    if 'maximum' in node and value > node['maximum']:
+        problems.append(f"{where}: {value!r} is above the maximum of {node['maximum']}")
+
+    if isinstance(value, (list, tuple)):
+        if 'min_items' in node and len(value) < node['min_items']:
+            problems.append(f"{where}: needs at least {node['min_items']} items, got {len(value)}")
+        if 'max_items' in node and len(value) > node['max_items']:
+            problems.append(f"{where}: accepts at most {node['max_items']} items, got {len(value)}")
+        items = node.get('items')
+        if items is not None:
+            for index, item in enumerate(value):
+                _check(items, item, f"{where}[{index}]", problems)
+    elif isinstance(value, dict):
+        for field in node.get('required', ()):
+            if value.get(field) is None:
+                problems.append(f"{where + '.' if where else ''}{field}: is required")
+        properties = node.get('properties')
+        if properties:
+            for field, item in value.items():
+                child = properties.get(field)
+                if child is not None and item is not None:
+                    _check(child, item, f"{where}.{field}" if where else field, problems)
+
+
+def validate_request(endpoint: str, payload: Dict[str, Any]) -> List[str]:
+    """
+    Check a request body or query parameters against the specs.
+
+    Args:
+        endpoint: "METHOD /path", e.g. 'POST /deals' or 'GET /alerts'
+        payload: JSON body (POST) or query parameters (GET); None values are ignored
+
+    Returns:
+        Problem descriptions, empty when the request is valid or the
+        endpoint has no rules
+    """
+    node = _COMPILED.get(endpoint)
+    if node is None:
+        return []
+    problems: List[str] = []
+    _check(node, payload, '', problems)
+    return problems
+
+
+def request_error(endpoint: str, payload: Dict[str, Any]) -> Optional[ValidationError]:
+    """A ValidationError describing every problem of the request, or None if it is valid."""
+    problems = validate_request(endpoint, payload)
+    if not problems:
+        return None
+    return ValidationError(f"Invalid request: {'; '.join(problems)}", code='CLIENT_VALIDATION',
+                           details={'problems': problems}, endpoint=endpoint.split(' ', 1)[-1])
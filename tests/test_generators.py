@@ -0,0 +1,30 @@
+"""The checked-in generated modules must match what their generators produce."""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip('yaml')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_script(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_ROOT, 'scripts', f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize('script, generated', [
+    ('generate_models', 'models.py'),
+    ('generate_validation', 'request_rules.py'),
+])
+def test_generated_module_is_up_to_date(script, generated, tmp_path, monkeypatch):
+    module = _load_script(script)
+    output = tmp_path / generated
+    monkeypatch.setattr(module, 'OUTPUT_PATH', str(output))
+    module.main()
+    with open(os.path.join(REPO_ROOT, 'src', 'fundable', generated)) as f:
+        assert output.read_text() == f.read(), f"re-run scripts/{script}.py"
@@ -0,0 +1,54 @@
+import pytest
+
+from fundable.pagination import AdaptivePageSizer, Page, page_count
+
+
+def test_page_count():
+    assert page_count(1000, 100) == 10
+    assert page_count(1001, 100) == 11
+    assert page_count(0, 100) == 0
+    assert page_count(None, 100) is None
+    assert page_count(10, None) is None
+
+
+def test_remaining_pages():
+    first = Page(list(range(100)), {'total_count': 1050, 'page': 0, 'page_size': 100})
+    assert list(first.remaining_pages()) == list(range(1, 11))
+    assert first.has_more and first.next_page == 1
+
+    last = Page(list(range(50)), {'total_count': 1050, 'page': 10, 'page_size': 100})
+    assert list(last.remaining_pages()) == []
+    assert not last.has_more and last.next_page is None
+
+    unknown = Page(list(range(100)), {'page': 0, 'page_size': 100})
+    assert list(unknown.remaining_pages()) == []
+    assert unknown.has_more    # falls back to "page was full"
+
+
+def test_page_size_starts_at_initial_size():
+    assert AdaptivePageSizer(initial_size=100).page_size('/deals') == 100
+
+
+@pytest.mark.parametrize('offset', [100, 200, 300, 700, 1200])
+def test_page_size_divides_offset(offset):
+    sizer = AdaptivePageSizer(target_ms=2000, min_size=25, initial_size=100)
+    for _ in range(5):
+        # Flat, fast latency: the sizer wants to grow
+        sizer.observe('/deals', 100, 50.0, 100 * 1000)
+        sizer.observe('/deals', 200, 60.0, 200 * 1000)
+    size = sizer.page_size('/deals', offset=offset, current=100)
+    assert 25 <= size <= 500
+    assert offset % size == 0
+
+
+def test_page_size_keeps_current_without_divisor():
+    sizer = AdaptivePageSizer(min_size=100, initial_size=100)
+    # 101 is prime: no size between min_size and the best one divides it
+    assert sizer.page_size('/deals', offset=101, current=101) == 101
+
+
+def test_page_size_respects_latency_budget():
+    sizer = AdaptivePageSizer(target_ms=1000, min_size=10, initial_size=100)
+    for records in (50, 100, 200):
+        sizer.observe('/companies', records, 100 + 5 * records)    # 5 ms per record
+    assert sizer.page_size('/companies') <= 180
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from fundable.queries import (
+    CompanyQuery, DealQuery, InvestorQuery, build_companies_body, build_deals_body, build_investors_body,
+)
+
+CASES = [
+    (DealQuery, build_deals_body, {'deal_start_date': '2024-01-01', 'industries': ['fintech'], 'page_size': 500}),
+    (CompanyQuery, build_companies_body, {'search_query': 'AI infrastructure', 'min_relevance': 0.2}),
+    (InvestorQuery, build_investors_body, {'investor_ids': ['c5a3f6ac-f6c9-4686-aa6e-12aeb7419b82'],
+                                           'only_lead_deals': True, 'page_size': 50}),
+]
+
+
+@pytest.mark.parametrize('query_type, builder, filters', CASES)
+@pytest.mark.parametrize('page', [0, 1, 17])
+def test_encoded_page_matches_built_body(query_type, builder, filters, page):
+    expected = json.dumps(dict(builder(**filters), page=page), separators=(',', ':')).encode()
+    assert query_type(**filters).encode(page) == expected
+
+
+def test_encode_without_page_is_the_body():
+    query = DealQuery(deal_start_date='2024-01-01')
+    assert json.loads(query.encode()) == query.body == build_deals_body(deal_start_date='2024-01-01')
+
+
+def test_queries_are_immutable_and_comparable():
+    query = DealQuery(deal_start_date='2024-01-01')
+    with pytest.raises(AttributeError):
+        query.body = {}
+    narrowed = query.with_filters(deal_end_date='2024-03-31')
+    assert narrowed != query
+    assert narrowed.with_filters(deal_end_date=None) == query
+    assert narrowed.fingerprint != query.fingerprint
+
+
+def test_invalid_filters_raise():
+    with pytest.raises(ValueError, match='Unknown DealQuery filters'):
+        DealQuery(not_a_filter=1)
+    with pytest.raises(ValueError, match='page is chosen per request'):
+        DealQuery(page=2)
+    with pytest.raises(ValueError, match='Invalid DealQuery'):
+        DealQuery(page_size=1000)
+
+
+def test_from_body_round_trips():
+    query = CompanyQuery(industries=['fintech'])
+    restored = CompanyQuery.from_body(query.body)
+    assert restored == query
+    assert restored.encode(3) == query.encode(3)
+    with pytest.raises(ValueError):
+        restored.with_filters(industries=['biotech'])
@@ -0,0 +1,38 @@
+import pytest
+
+from fundable.resolve import BulkResolver, normalize_domain, normalize_linkedin
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('https://www.AresMgmt.com/about', 'aresmgmt.com'),
+    ('aresmgmt.com', 'aresmgmt.com'),
+    ('http://sub.example.co.uk:8080/x?y=1', 'sub.example.co.uk'),
+    ('example.com.', 'example.com'),
+    ('', None),
+    (None, None),
+    ('localhost', None),
+])
+def test_normalize_domain(value, expected):
+    assert normalize_domain(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('linkedin.com/company/Stripe/about/', 'https://www.linkedin.com/company/stripe'),
+    ('https://www.linkedin.com/company/stripe?trk=x', 'https://www.linkedin.com/company/stripe'),
+    ('https://uk.linkedin.com/school/MIT', 'https://www.linkedin.com/school/mit'),
+    ('https://www.linkedin.com/in/jane-doe', None),
+    ('https://example.com/company/stripe', None),
+    ('', None),
+    (None, None),
+])
+def test_normalize_linkedin(value, expected):
+    assert normalize_linkedin(value) == expected
+
+
+def test_search_hit_must_carry_the_identifier():
+    same = BulkResolver._same
+    assert same('domain', {'domain': 'https://www.stripe.com'}, 'stripe.com')
+    assert not same('domain', {'domain': 'plaid.com'}, 'stripe.com')
+    assert not same('domain', {'name': 'Stripe'}, 'stripe.com')
+    assert not same('linkedin', {}, 'https://www.linkedin.com/company/stripe')
+    assert same('name', {'name': 'Stripe, Inc'}, 'stripe inc')
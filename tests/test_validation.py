@@ -0,0 +1,39 @@
+from fundable.queries import build_deals_body
+from fundable.validation import request_error, validate_request
+
+
+def test_valid_deals_body_has_no_problems():
+    body = build_deals_body(deal_start_date='2024-01-01', employee_count=['11-50'], page_size=500)
+    assert validate_request('POST /deals', body) == []
+
+
+def test_bad_enum_and_page_size_are_reported():
+    body = build_deals_body(employee_count=['11-49'], page_size=1000)
+    problems = validate_request('POST /deals', body)
+    assert any(p.startswith('company.employee_count[0]') for p in problems)
+    assert any(p.startswith('page_size') and 'maximum of 500' in p for p in problems)
+
+
+def test_wrong_type_is_reported():
+    assert validate_request('POST /deals', {'page_size': 'ten'}) == ['page_size: expected integer, got str']
+    assert validate_request('POST /deals', {'page_size': True}) == ['page_size: expected integer, got bool']
+
+
+def test_prose_limits_from_overrides():
+    assert validate_request('GET /alerts', {'alert_ids': ['a'] * 10}) == []
+    assert validate_request('GET /alerts', {'alert_ids': ['a'] * 11}) == ['alert_ids: accepts at most 10 items, got 11']
+    problems = validate_request('POST /companies', {'identifiers': {'domains': ['a.com'] * 101}})
+    assert problems == ['identifiers.domains: accepts at most 100 items, got 101']
+
+
+def test_unknown_endpoints_and_keys_pass():
+    assert validate_request('POST /unknown', {'anything': 1}) == []
+    assert validate_request('POST /deals', {'not_in_spec': [1, 2]}) == []
+
+
+def test_request_error():
+    assert request_error('POST /deals', {'page_size': 10}) is None
+    error = request_error('POST /deals', {'page_size': 0})
+    assert error.code == 'CLIENT_VALIDATION'
+    assert error.endpoint == '/deals'
+    assert error.details['problems'] == ['page_size: 0 is below the minimum of 1']